@@ -1,3 +1,5 @@
+import json
+import os
 import sys
 import time
 import tracemalloc
@@ -6,18 +8,107 @@ from typing import Callable
 from src.simulator import simulation_hanoi
 from src.hanoi_states import StatesHanoi, ProblemHanoi
 from src.models.metrics import Metrics
-from src.services.databases import DatabaseService
+from src.models.search_progress import SearchProgress as SearchProgressRecord
+from src.services.databases import DatabaseService, BufferedWriter
 from src.tree_hanoi import NodeHanoi
-from src.search import (
-    breadth_first_tree_search,
-    breadth_first_graph_search,
-    astar_search_heuristic1,
-    astar_search_heuristic2,
-    astar_search_heuristic3,
-    greedy_search_heuristic1,
-    greedy_search_heuristic2,
-    greedy_search_heuristic3
-)
+from src.profiling import SearchProfile, SearchProgress, print_progress
+from src.budget import SearchBudget, BudgetExceeded
+from src.benchmark import run_benchmark, run_parallel_benchmark, summarize_rows, write_results
+from src.batch import read_pairs, random_pairs, solve_batch, write_jsonl
+from src.registry import get_solver, sweep_solvers, load_solver_modules, SOLVERS
+
+
+# Con --profile, cada búsqueda acumula contadores y tiempos por fase y se guardan en la columna comments de Metrics
+PROFILE_SEARCH = "--profile" in sys.argv
+if PROFILE_SEARCH:
+    sys.argv.remove("--profile")
+
+# Con --progress, cada búsqueda muestra su avance cada PROGRESS_EVERY expansiones y, con db, lo guarda como serie de
+# tiempo en la tabla SearchProgress
+PROGRESS_SEARCH = "--progress" in sys.argv
+if PROGRESS_SEARCH:
+    sys.argv.remove("--progress")
+PROGRESS_EVERY = 10000
+
+# Con --pegs=N los problemas se arman con N varillas (Reve's puzzle con 4); por defecto 3
+PEGS = 3
+for argument in list(sys.argv):
+    if argument.startswith("--pegs="):
+        PEGS = int(argument.split("=", 1)[1])
+        sys.argv.remove(argument)
+EMPTY_RODS = [[] for _ in range(PEGS - 1)]
+
+# Algoritmos que se resuelven y se miden (ver src/registry.py): por defecto todos los registrados para los barridos.
+# Con --solvers=a,b solo esos, en ese orden, y con --solvers-module=paquete.modulo se importan módulos que registran
+# solvers propios antes de elegirlos
+SOLVER_NAMES = []
+SOLVER_MODULES = []
+for argument in list(sys.argv):
+    if argument.startswith("--solvers="):
+        SOLVER_NAMES = argument.split("=", 1)[1].split(",")
+        sys.argv.remove(argument)
+    elif argument.startswith("--solvers-module="):
+        SOLVER_MODULES = argument.split("=", 1)[1].split(",")
+        sys.argv.remove(argument)
+load_solver_modules(SOLVER_MODULES)
+SWEEP = sweep_solvers(SOLVER_NAMES)
+# `solve` y `solve-db` resuelven por defecto solo los algoritmos que tienen su solución en el simulador
+# (src/simulator/solutions), y solo de ellos se generan los JSON; los demás se eligen con --solvers=a,b
+SIMULATOR_SOLVERS = [
+    'breadth_first_graph_search',
+    'astar_search_heuristic1',
+    'astar_search_heuristic2',
+    'astar_search_heuristic3',
+    'greedy_search_heuristic1',
+    'greedy_search_heuristic2',
+    'greedy_search_heuristic3',
+    'ida_star_search_heuristic1',
+    'ida_star_search_heuristic2',
+    'bidirectional_breadth_first_search',
+    'bidirectional_astar_search_heuristic1',
+    'bidirectional_astar_search_heuristic2',
+    'recursive_optimal_search',
+    'astar_search_pattern_database',
+]
+SOLVE = sweep_solvers(SOLVER_NAMES or SIMULATOR_SOLVERS)
+
+# Cada búsqueda corre con un presupuesto (ver src/budget.py): la que lo supera se corta y se registra como
+# presupuesto excedido en vez de colgar el barrido. Algunos solvers registran límites propios (IDA*, por ejemplo,
+# un máximo de expansiones).
+DEFAULT_BUDGET = {"max_seconds": 300.0}
+# Con --max-seconds=S, --max-expansions=N y --max-memory=MB se reemplazan esos límites para todas las búsquedas;
+# 0 quita el límite
+BUDGET_FLAGS = {"--max-seconds=": ("max_seconds", float), "--max-expansions=": ("max_expansions", int),
+                "--max-memory=": ("max_memory_mb", float)}
+CLI_BUDGET = {}
+for argument in list(sys.argv):
+    for flag, (key, cast) in BUDGET_FLAGS.items():
+        if argument.startswith(flag):
+            CLI_BUDGET[key] = cast(argument.split("=", 1)[1]) or None
+            sys.argv.remove(argument)
+
+
+def budget_limits(name: str) -> dict:
+    """
+    Límites del presupuesto de un algoritmo: los por defecto, los propios del algoritmo y los de la línea de
+    comandos, en ese orden de prioridad creciente.
+    """
+    solver_budget = SOLVERS[name].budget if name in SOLVERS else {}
+    return {**DEFAULT_BUDGET, **solver_budget, **CLI_BUDGET}
+
+# Escritores compartidos por todas las ejecuciones, uno por tabla: las filas se insertan de a lotes
+writers = {}
+
+
+def get_writer(model) -> BufferedWriter:
+    if model not in writers:
+        writers[model] = BufferedWriter(model, flush_size=100)
+    return writers[model]
+
+
+def close_writers() -> None:
+    for writer in writers.values():
+        writer.close()
 
 
 def metrics(func):
@@ -26,35 +117,56 @@ def metrics(func):
         tracemalloc.start()
         explored = None
         frontier = None
+        profile = SearchProfile() if PROFILE_SEARCH else None
+        progress = SearchProgress(print_progress, every=PROGRESS_EVERY) if PROGRESS_SEARCH else None
+        budget = SearchBudget(**budget_limits(args[0]))
 
-        result = func(*args, **kwargs)  # Call the original function
+        # Call the original function
+        result = func(*args, profile=profile, progress=progress, budget=budget, **kwargs)
         if isinstance(result, tuple):
             explored = result[1]
             frontier = result[2]
             result = result[0]
+        elif isinstance(result, BudgetExceeded):
+            explored = result.expanded
+            frontier = result.frontier
 
         end_time = time.perf_counter()  # Stop the timer
         _, memory_peak = tracemalloc.get_traced_memory()
         memory_peak /= 1024*1024
         tracemalloc.stop()
         execution_time = end_time - start_time
+        if progress is not None and progress.events:
+            print()  # Termina la línea de progreso
         
         print(f"Tiempo que demoró {func.__name__}: {execution_time:4f} [s]", )
         print(f"Maxima memoria ocupada: {round(memory_peak, 2)} [MB]", )
+        if profile is not None:
+            print(f"Perfil: {profile.report()}")
+        # En comments van el perfil y, si se cortó la búsqueda, el presupuesto excedido con sus estadísticas
+        comments = {}
+        if profile is not None:
+            comments.update(profile.as_dict())
+        if isinstance(result, BudgetExceeded):
+            comments.update(result.as_dict())
         
         if 'db' in sys.argv[1]:
-            db = DatabaseService()           
-            db.add(Metrics(
+            timestamp = datetime.now()
+            get_writer(Metrics).add(dict(
                 model_name=args[0],  # Add the model name as a parameter
                 disks=args[1],
-                timestamp=datetime.now(),
+                timestamp=timestamp,
                 memory_allocation=memory_peak,
                 execution_time=execution_time,
                 movements = explored,
                 frontiers = frontier,
-                cost = result.state.accumulated_cost,
-                comments="",
+                cost = result.state.accumulated_cost if hasattr(result, "state") else None,
+                comments=json.dumps(comments) if comments else "",
             ))
+            if progress is not None:
+                for event in progress.events:
+                    get_writer(SearchProgressRecord).add(dict(run_timestamp=timestamp, model_name=args[0],
+                                                              disks=args[1], **event))
             
         
         # TODO: Insert data in DB for futher analysis
@@ -62,16 +174,18 @@ def metrics(func):
     return wrapper
 
 @metrics
-def execute_algorithm(name: str, disks: int, problem_hanoi: ProblemHanoi, solver: Callable) ->  NodeHanoi:
+def execute_algorithm(name: str, disks: int, problem_hanoi: ProblemHanoi, solver: Callable,
+                      profile: SearchProfile = None, progress: SearchProgress = None,
+                      budget: SearchBudget = None) ->  NodeHanoi:
     # Resuelve el problema utilizando búsqueda en anchura
     # Esta forma de búsqueda es muy ineficiente, por lo que si deseas probarlo, usa 3 discos o si querés esperar
     # un poco más, 4 discos, pero 5 discos no finaliza nunca.
     #last_node = breadth_first_tree_search(problem_hanoi)
     # Resuelve el problema utilizando búsqueda en anchura, pero con memoria que recuerda caminos ya recorridos.
-    last_node_info = solver(problem_hanoi, display=True)
+    last_node_info = solver(problem_hanoi, display=True, profile=profile, progress=progress, budget=budget)
     return last_node_info
 
-def solve_problem(name: str, disks: int, problem_hanoi: ProblemHanoi, solver: Callable) -> None:
+def solve_problem(name: str, disks: int, problem_hanoi: ProblemHanoi, solver: Callable):
     """
     Función que resuelve el problema de la Torre de Hanoi utilizando un algoritmo de búsqueda.
 
@@ -79,6 +193,10 @@ def solve_problem(name: str, disks: int, problem_hanoi: ProblemHanoi, solver: Ca
         name (str): Nombre del algoritmo a utilizar
         problem_hanoi (ProblemHanoi): Instancia del problema de la Torre de Hanoi
         solver (Callable): Algoritmo de búsqueda a utilizar
+
+    Returns:
+        El último nodo de la solución, un BudgetExceeded si la búsqueda superó su presupuesto, o el resultado del
+        algoritmo si no encontró solución.
     """
     print(f'-'*50)
     print(f'Solving problem using {name} and {disks} disks')
@@ -90,14 +208,57 @@ def solve_problem(name: str, disks: int, problem_hanoi: ProblemHanoi, solver: Ca
         print(f'Longitud del camino de la solución: {last_node.state.accumulated_cost}')
 
         # Genera los JSON para el simulador
-        last_node.generate_solution_for_simulator(
-            initial_state_file=f"./src/simulator/solutions/initial_state_{name}.json",
-            sequence_file=f"./src/simulator/solutions/sequence_{name}.json"
-        )
+        if name in SIMULATOR_SOLVERS:
+            last_node.generate_solution_for_simulator(
+                initial_state_file=f"./src/simulator/solutions/initial_state_{name}.json",
+                sequence_file=f"./src/simulator/solutions/sequence_{name}.json"
+            )
+    elif isinstance(last_node, BudgetExceeded):
+        print(last_node)
     else:
         print(last_node)
         print("No se encuentra solución")
+    return last_node
         
+def bench(max_disks: int, repeats: int = 10) -> None:
+    """
+    Mide tiempo y memoria de todos los algoritmos, de 3 a max_disks discos, y escribe las estadísticas en
+    data/benchmark/ con el mismo formato que los CSV de data/.
+
+    A diferencia de solve-db-m, no imprime soluciones, no genera JSON ni escribe en la base de datos durante la
+    medición, hace ejecuciones de calentamiento y mide tiempo y memoria en pasadas separadas.
+    """
+    results = run_benchmark(SWEEP, range(3, max_disks + 1), repeats=repeats, pegs=PEGS,
+                            timeout=budget_limits(None).get("max_seconds"))
+    write_results(results)
+
+def bench_parallel(max_disks: int, workers: int = None, repeats: int = 10) -> None:
+    """
+    Igual que solve-db-m pero repartiendo cada (algoritmo, discos, repetición) entre varios procesos, cada uno fijado
+    a su propia CPU. Las filas se escriben juntas en la base de datos al terminar y las estadísticas en
+    data/benchmark/.
+    """
+    cpus = sorted(os.sched_getaffinity(0))[:workers] if hasattr(os, "sched_getaffinity") else None
+    rows = run_parallel_benchmark(list(SWEEP), range(3, max_disks + 1), repeats=repeats, workers=workers,
+                                  cpus=cpus, pegs=PEGS, timeout=budget_limits(None).get("max_seconds"),
+                                  solver_modules=SOLVER_MODULES)
+    for row in rows:
+        budget_exceeded = row.pop("budget_exceeded")
+        row["comments"] = json.dumps(budget_exceeded) if budget_exceeded else ""
+    DatabaseService().add_many(Metrics, rows)
+    write_results(summarize_rows(rows))
+
+def batch(name: str, pairs, output_file: str = None) -> None:
+    """
+    Resuelve un lote de pares (inicial, objetivo) con un único algoritmo, en este mismo proceso, y escribe un
+    resultado JSONL por par a medida que se resuelven (por defecto en data/batch/<algoritmo>.jsonl).
+    """
+    output_file = output_file or f"./data/batch/{name}.jsonl"
+    os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+    with open(output_file, "w") as file:
+        count = write_jsonl(solve_batch(pairs, get_solver(name), solver_name=name), file)
+    print(f"{count} pares resueltos con {name} en {output_file}")
+
 def simulate() -> None:
     """
     Función que simula la solución del problema de la Torre de Hanoi.
@@ -112,57 +273,47 @@ def main(disks: int = 5, iterate: None|int = None) -> None:
     """
     if iterate is None:
         # Definimos estado inicial y estado final del problema a resolver
-        initial_state = StatesHanoi(list(range(disks,0,-1)), [], [], max_disks=disks)
-        goal_state = StatesHanoi([], [], list(range(disks,0,-1)), max_disks=disks)
+        initial_state = StatesHanoi(list(range(disks,0,-1)), *EMPTY_RODS, max_disks=disks)
+        goal_state = StatesHanoi(*EMPTY_RODS, list(range(disks,0,-1)), max_disks=disks)
 
         # Se crea una instancia del problema de la Torre de Hanoi
         problem_hanoi = ProblemHanoi(initial=initial_state, goal=goal_state)
-
-        # Se resuelve el problema utilizando diferentes algoritmos de búsqueda
-        problems = {
-            'breadth_first_graph_search': breadth_first_graph_search,
-            'astar_search_heuristic1': astar_search_heuristic1,
-            'astar_search_heuristic2': astar_search_heuristic2,
-            'astar_search_heuristic3': astar_search_heuristic3,
-            'greedy_search_heuristic1': greedy_search_heuristic1,
-            'greedy_search_heuristic2': greedy_search_heuristic2,
-            'greedy_search_heuristic3': greedy_search_heuristic3
-        }
+        # Se precalculan las heurísticas (tablas de pattern databases) fuera de la medición de tiempo y memoria
+        for search in SOLVE.values():
+            search.prepare(problem_hanoi)
 
         # Se resuelve el problema para cada algoritmo de búsqueda
-        for name, search in problems.items():
+        for name, search in SOLVE.items():
             solve_problem(name, disks, problem_hanoi, search)
         # Definimos estado inicial y estado final del problema a resolver
     elif '-m' in sys.argv[1]:
+        # Un algoritmo que supera su presupuesto con i discos también lo supera con más: se registra una vez y no se
+        # vuelve a correr
+        exceeded = set()
         for i in range(3, int(iterate)+1):
             for j in range(10): # Se ejecuta 10 veces para obtener un promedio por cada modelo por cada valor de discos
                 disks = i
                 state = list(range(i,2,-1)) + [2, 1]
-                initial_state = StatesHanoi(state, [], [], max_disks=disks)
-                goal_state = StatesHanoi([], [], state, max_disks=disks)
+                initial_state = StatesHanoi(state, *EMPTY_RODS, max_disks=disks)
+                goal_state = StatesHanoi(*EMPTY_RODS, state, max_disks=disks)
                 # Se crea una instancia del problema de la Torre de Hanoi
                 problem_hanoi = ProblemHanoi(initial=initial_state, goal=goal_state)
-
-                # Se resuelve el problema utilizando diferentes algoritmos de búsqueda
-                problems = {
-                    'breadth_first_graph_search': breadth_first_graph_search,
-                    'astar_search_heuristic1': astar_search_heuristic1,
-                    'astar_search_heuristic2': astar_search_heuristic2,
-                    'astar_search_heuristic3': astar_search_heuristic3,
-                    'greedy_search_heuristic1': greedy_search_heuristic1,
-                    'greedy_search_heuristic2': greedy_search_heuristic2,
-                    'greedy_search_heuristic3': greedy_search_heuristic3
-                }
+                # Se precalculan las heurísticas (tablas de pattern databases) fuera de la medición de tiempo y memoria
+                for search in SWEEP.values():
+                    search.prepare(problem_hanoi)
 
                 # Se resuelve el problema para cada algoritmo de búsqueda
-                for name, search in problems.items():
-                    solve_problem(name, disks, problem_hanoi, search)
+                for name, search in SWEEP.items():
+                    if name in exceeded:
+                        continue
+                    if isinstance(solve_problem(name, disks, problem_hanoi, search), BudgetExceeded):
+                        exceeded.add(name)
 
 if __name__ == "__main__":
     """
     Sección de ejecución del programa
     """
-    disks = int(sys.argv[2]) if len(sys.argv) > 2 else 5 
+    disks = int(sys.argv[2]) if len(sys.argv) > 2 and sys.argv[2].isdigit() else 5 
     
     if sys.argv[1] == "solve":
         main(disks)
@@ -170,10 +321,30 @@ if __name__ == "__main__":
     if sys.argv[1] == "solve-db":
         DatabaseService.init_database()
         main(disks)
+        close_writers()
         
     if sys.argv[1] == "simulate":
         simulate()
 
     if sys.argv[1] == "solve-db-m":
         DatabaseService.init_database()
-        main(iterate=int(sys.argv[2]))
\ No newline at end of file
+        main(iterate=int(sys.argv[2]))
+        close_writers()
+
+    if sys.argv[1] == "bench":
+        bench(disks, repeats=int(sys.argv[3]) if len(sys.argv) > 3 else 10)
+
+    if sys.argv[1] == "solve-db-mp":
+        DatabaseService.init_database()
+        bench_parallel(disks, workers=int(sys.argv[3]) if len(sys.argv) > 3 else None)
+
+    if sys.argv[1] == "solvers":
+        for name, spec in SOLVERS.items():
+            print(name, "" if spec.sweep else "(fuera de los barridos)")
+
+    if sys.argv[1] == "batch":
+        batch(sys.argv[2], read_pairs(sys.argv[3]), sys.argv[4] if len(sys.argv) > 4 else None)
+
+    if sys.argv[1] == "batch-random":
+        seed = int(sys.argv[5]) if len(sys.argv) > 5 else None
+        batch(sys.argv[2], random_pairs(int(sys.argv[3]), int(sys.argv[4]), pegs=PEGS, seed=seed))
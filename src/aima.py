@@ -155,10 +155,23 @@ class PriorityQueue:
     order) is returned first.
     If order is 'min', the item with minimum f(x) is
     returned first; if order is 'max', then it is the item with maximum f(x).
-    Also supports dict-like lookup."""
+    Also supports dict-like lookup.
+
+    Items are indexed by their hash/equality (for Nodes, by their state), so
+    membership, lookup and deletion are O(1) and re-inserting an item after
+    deleting it (decrease-key) is O(log n). Deleted entries are left in the
+    heap and skipped when popped (lazy deletion). Appending an item that is
+    already queued replaces its previous entry.
+
+    Items with equal f(x) that also compare equal under < may pop in a
+    different order than with the original linear-scan implementation, so
+    frontier sizes reported by the searches can differ slightly from older
+    runs (e.g. astar_search_heuristic1 at 5 disks: 13 -> 10)."""
 
     def __init__(self, order='min', f=lambda x: x):
         self.heap = []
+        self.entries = {}
+        self.order = order
         if order == 'min':
             self.f = f
         elif order == 'max':  # now item with max f(x)
@@ -168,7 +181,12 @@ class PriorityQueue:
 
     def append(self, item):
         """Insert item at its correct position."""
-        heapq.heappush(self.heap, (self.f(item), item))
+        entry = (self.f(item), item)
+        replaced = item in self.entries
+        self.entries[item] = entry
+        heapq.heappush(self.heap, entry)
+        if replaced:
+            self._compact()
 
     def extend(self, items):
         """Insert each item in items at its correct position."""
@@ -178,32 +196,62 @@ class PriorityQueue:
     def pop(self):
         """Pop and return the item (with min or max f(x) value)
         depending on the order."""
-        if self.heap:
-            return heapq.heappop(self.heap)[1]
-        else:
-            raise Exception('Trying to pop from empty PriorityQueue.')
+        while self.heap:
+            entry = heapq.heappop(self.heap)
+            item = entry[1]
+            if self.entries.get(item) is entry:
+                del self.entries[item]
+                return item
+        raise Exception('Trying to pop from empty PriorityQueue.')
+
+    def top_priority(self):
+        """Return f(x) of the item that would be popped next, or None if
+        the queue is empty. Stale entries on top of the heap are discarded."""
+        while self.heap and self.entries.get(self.heap[0][1]) is not self.heap[0]:
+            heapq.heappop(self.heap)
+        if not self.heap:
+            return None
+        return self.heap[0][0] if self.order == 'min' else -self.heap[0][0]
 
     def __len__(self):
         """Return current capacity of PriorityQueue."""
-        return len(self.heap)
+        return len(self.entries)
 
     def __contains__(self, key):
         """Return True if the key is in PriorityQueue."""
-        return any([item == key for _, item in self.heap])
+        return key in self.entries
 
     def __getitem__(self, key):
-        """Returns the first value associated with key in PriorityQueue.
+        """Returns the value associated with key in PriorityQueue.
         Raises KeyError if key is not present."""
-        for value, item in self.heap:
-            if item == key:
-                return value
-        raise KeyError(str(key) + " is not in the priority queue")
+        try:
+            return self.entries[key][0]
+        except KeyError:
+            raise KeyError(str(key) + " is not in the priority queue")
 
     def __delitem__(self, key):
-        """Delete the first occurrence of key."""
+        """Delete the entry associated with key."""
         try:
-            del self.heap[[item == key for _, item in self.heap].index(True)]
-        except ValueError:
+            del self.entries[key]
+        except KeyError:
             raise KeyError(str(key) + " is not in the priority queue")
-        heapq.heapify(self.heap)
-
+        self._compact()
+
+    def prune(self, size, key=None):
+        """Keep only the `size` best items and return the removed ones,
+        worst first. Items are ranked as they would be popped, or by
+        key((f(x), x)) if a key is given (e.g. to break ties differently)."""
+        ranked = sorted(self.entries.values(), key=key)
+        removed = [item for _, item in reversed(ranked[size:])]
+        for item in removed:
+            del self.entries[item]
+        self.heap = ranked[:size]
+        if key is not None:
+            heapq.heapify(self.heap)
+        return removed
+
+    def _compact(self):
+        """Rebuild the heap once stale entries outnumber the live ones."""
+        if len(self.heap) > 2 * len(self.entries) + 32:
+            self.heap = list(self.entries.values())
+            heapq.heapify(self.heap)
@@ -0,0 +1,205 @@
+import json
+import random
+import time
+from typing import Callable, Iterable, Iterator, TextIO
+
+from src.hanoi_states import StatesHanoi, ProblemHanoi, ActionHanoi
+from src.recursive_solver import optimal_cost
+
+
+def state_from_dict(state_dict) -> StatesHanoi:
+    """
+    Construye un estado a partir de su representación JSON: el diccionario de `StatesHanoi.get_state_dict`
+    ({"peg_1": [...], "peg_2": [...], ...}) o directamente una lista de varillas.
+
+    Args:
+        state_dict (dict | list): Discos de cada varilla, de abajo hacia arriba.
+
+    Returns:
+        StatesHanoi: Estado validado.
+    """
+    if isinstance(state_dict, dict):
+        rods = [state_dict[peg] for peg in sorted(state_dict, key=lambda peg: int(peg.split("_")[-1]))]
+    else:
+        rods = state_dict
+    return StatesHanoi(*[list(rod) for rod in rods], max_disks=sum(len(rod) for rod in rods))
+
+
+def read_pairs(file_path: str) -> Iterator[tuple]:
+    """
+    Lee pares (inicial, objetivo) de un archivo JSONL, uno por línea: {"initial": ..., "goal": ...} (ver
+    `state_from_dict`). Las líneas vacías se ignoran.
+
+    Yields:
+        tuple: (StatesHanoi inicial, StatesHanoi objetivo).
+    """
+    with open(file_path) as file:
+        for line in file:
+            if line.strip():
+                pair = json.loads(line)
+                yield state_from_dict(pair["initial"]), state_from_dict(pair["goal"])
+
+
+def write_pairs(pairs: Iterable[tuple], file_path: str) -> int:
+    """
+    Escribe pares (inicial, objetivo) con el formato de `read_pairs`, por ejemplo para repetir un lote aleatorio con
+    otro solver.
+
+    Returns:
+        int: Cantidad de pares escritos.
+    """
+    count = 0
+    with open(file_path, "w") as file:
+        for initial, goal in pairs:
+            file.write(json.dumps({"initial": initial.get_state_dict(), "goal": goal.get_state_dict()}) + "\n")
+            count += 1
+    return count
+
+
+def random_pairs(count: int, disks: int, pegs: int = 3, seed: int = None) -> Iterator[tuple]:
+    """
+    Genera pares (inicial, objetivo) uniformes entre las k^n configuraciones válidas. Con la misma semilla se
+    generan siempre los mismos pares.
+
+    Args:
+        count (int): Cantidad de pares.
+        disks (int): Cantidad de discos.
+        pegs (int): Cantidad de varillas.
+        seed (int): Semilla del generador.
+
+    Yields:
+        tuple: (StatesHanoi inicial, StatesHanoi objetivo).
+    """
+    rng = random.Random(seed)
+    states = pegs ** disks
+    for _ in range(count):
+        yield (StatesHanoi.from_code(rng.randrange(states), disks, number_of_pegs=pegs),
+               StatesHanoi.from_code(rng.randrange(states), disks, number_of_pegs=pegs))
+
+
+def canonical_labels(goal: StatesHanoi) -> list:
+    """
+    Renumera las varillas para que objetivos equivalentes por simetría queden iguales: recorriendo los discos del
+    objetivo de mayor a menor, la primera varilla que aparece pasa a ser la última, la segunda la anteúltima, etc.
+    Las varillas vacías conservan su orden.
+
+    Así la heurística de pattern databases construida para un objetivo sirve para todos los que difieren solo en el
+    nombre de las varillas, y el objetivo estándar (torre en la última varilla) no cambia.
+
+    Returns:
+        list: labels[varilla] con el nuevo índice de cada varilla.
+    """
+    pegs = goal.number_of_pegs
+    positions = [0] * (goal.number_of_disks + 1)
+    for rod_index, rod in enumerate(goal.rods):
+        for disk in rod:
+            positions[disk] = rod_index
+
+    labels = [None] * pegs
+    next_label = pegs - 1
+    for disk in range(goal.number_of_disks, 0, -1):
+        if labels[positions[disk]] is None:
+            labels[positions[disk]] = next_label
+            next_label -= 1
+    for rod_index in range(pegs):
+        if labels[rod_index] is None:
+            labels[rod_index] = next_label
+            next_label -= 1
+    # Las varillas vacías quedaron numeradas de derecha a izquierda, se devuelven a su orden original
+    empty = sorted(rod_index for rod_index in range(pegs) if not goal.rods[rod_index])
+    for rod_index, label in zip(empty, sorted(labels[rod_index] for rod_index in empty)):
+        labels[rod_index] = label
+    return labels
+
+
+def relabel_state(state: StatesHanoi, labels: list) -> StatesHanoi:
+    """
+    Estado con las varillas renumeradas según `labels` (ver `canonical_labels`).
+    """
+    rods = [None] * state.number_of_pegs
+    for rod_index, rod in enumerate(state.rods):
+        rods[labels[rod_index]] = list(rod)
+    return StatesHanoi(*rods, max_disks=state.number_of_disks, cost=state.accumulated_cost)
+
+
+def solve_batch(pairs: Iterable[tuple], solver: Callable, solver_name: str = None, canonical: bool = True,
+                include_solution: bool = False) -> Iterator[dict]:
+    """
+    Resuelve un lote de pares (inicial, objetivo) con el mismo solver, en un único proceso, y devuelve un resultado
+    por par a medida que se resuelven.
+
+    Todo lo que el solver precalcula se comparte entre las consultas del lote: las heurísticas de pattern databases
+    se construyen una vez por objetivo (ver `pattern_database_heuristic`) y sus tablas quedan abiertas, y con
+    `canonical` cada par se renumera antes de resolverlo (ver `canonical_labels`) para que los objetivos simétricos
+    compartan las mismas tablas. La solución se traduce de vuelta a las varillas originales.
+
+    Un par que el solver no admite (ValueError) no corta el lote: su resultado tiene la clave "error".
+
+    Args:
+        pairs (Iterable[tuple]): Pares (StatesHanoi inicial, StatesHanoi objetivo), por ejemplo de `read_pairs` o
+            `random_pairs`.
+        solver (Callable): solver(problem) de src/search.py.
+        solver_name (str): Nombre que se informa en cada resultado. Por defecto el __name__ del solver.
+        canonical (bool): Renumera las varillas de cada par según su objetivo.
+        include_solution (bool): Agrega la secuencia de movimientos (con el formato de `ActionHanoi.action_dict`).
+
+    Yields:
+        dict: index, model_name, disks, pegs, initial, goal, cost, optimal_cost (solo con 3 varillas), movements,
+        frontiers, execution_time y, opcionalmente, solution o error.
+    """
+    solver_name = solver_name or getattr(solver, "__name__", "solver")
+    for index, (initial, goal) in enumerate(pairs):
+        if initial.number_of_disks != goal.number_of_disks or initial.number_of_pegs != goal.number_of_pegs:
+            raise ValueError('El estado inicial y el objetivo deben tener los mismos discos y varillas')
+
+        row = {
+            "index": index,
+            "model_name": solver_name,
+            "disks": initial.number_of_disks,
+            "pegs": initial.number_of_pegs,
+            "initial": initial.get_state_dict(),
+            "goal": goal.get_state_dict(),
+        }
+        if initial.number_of_pegs == 3:
+            row["optimal_cost"] = optimal_cost(initial, goal)
+
+        labels = canonical_labels(goal) if canonical else list(range(goal.number_of_pegs))
+        problem = ProblemHanoi(initial=relabel_state(initial, labels), goal=relabel_state(goal, labels))
+        start_time = time.perf_counter()
+        try:
+            result = solver(problem)
+        except ValueError as error:
+            row["error"] = str(error)
+            yield row
+            continue
+        row["execution_time"] = time.perf_counter() - start_time
+
+        explored = frontier = None
+        if isinstance(result, tuple):
+            result, explored, frontier = result
+        row["cost"] = result.state.accumulated_cost if hasattr(result, "state") else None
+        row["movements"] = explored
+        row["frontiers"] = frontier
+        if include_solution and hasattr(result, "solution"):
+            original = {label: rod_index for rod_index, label in enumerate(labels)}
+            row["solution"] = [
+                ActionHanoi(action.disk, original[action.rod_input], original[action.rod_out]).action_dict
+                for action in result.solution()
+            ]
+        yield row
+
+
+def write_jsonl(rows: Iterable[dict], file: TextIO) -> int:
+    """
+    Escribe cada fila como una línea JSON apenas se obtiene, así un lote largo se puede seguir (o interrumpir) sin
+    perder los resultados ya calculados.
+
+    Returns:
+        int: Cantidad de filas escritas.
+    """
+    count = 0
+    for row in rows:
+        file.write(json.dumps(row) + "\n")
+        file.flush()
+        count += 1
+    return count
@@ -0,0 +1,309 @@
+import csv
+import multiprocessing
+import os
+import statistics
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable
+
+import numpy as np
+
+from src.budget import SearchBudget, BudgetExceeded
+from src.hanoi_states import StatesHanoi, ProblemHanoi
+
+
+def build_problem(disks: int, pegs: int = 3) -> ProblemHanoi:
+    """
+    Construye el problema estándar: todos los discos de la primera a la última varilla.
+
+    Args:
+        disks (int): Cantidad de discos.
+        pegs (int): Cantidad de varillas.
+
+    Returns:
+        ProblemHanoi: Instancia del problema.
+    """
+    empty_rods = [[] for _ in range(pegs - 1)]
+    initial_state = StatesHanoi(list(range(disks, 0, -1)), *empty_rods, max_disks=disks)
+    goal_state = StatesHanoi(*empty_rods, list(range(disks, 0, -1)), max_disks=disks)
+    return ProblemHanoi(initial=initial_state, goal=goal_state)
+
+
+def summarize(values: list) -> dict:
+    """
+    Calcula las estadísticas de una serie de mediciones. El desvío y la varianza son muestrales, igual que en los
+    CSV de data/.
+
+    Args:
+        values (list): Mediciones.
+
+    Returns:
+        dict: mean, std, var, median y p95 de las mediciones.
+    """
+    return {
+        "mean": statistics.mean(values),
+        "std": statistics.stdev(values) if len(values) > 1 else 0.0,
+        "var": statistics.variance(values) if len(values) > 1 else 0.0,
+        "median": statistics.median(values),
+        "p95": float(np.percentile(values, 95)),
+    }
+
+
+def measure_time(solver: Callable, problem: ProblemHanoi, budget: SearchBudget = None) -> tuple:
+    """
+    Tiempo de una ejecución del solver, sin tracemalloc activo. Con `budget`, la ejecución se corta al superarlo.
+
+    Returns:
+        tuple: (segundos, resultado del solver, que es un BudgetExceeded si se cortó).
+    """
+    start_time = time.perf_counter()
+    if budget is None:
+        result = solver(problem)
+    else:
+        result = solver(problem, budget=budget)
+    return time.perf_counter() - start_time, result
+
+
+def measure_memory(solver: Callable, problem: ProblemHanoi) -> float:
+    """
+    Pico de memoria de una ejecución del solver en MB, medido con tracemalloc.
+    """
+    tracemalloc.start()
+    try:
+        solver(problem)
+        _, memory_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return memory_peak / (1024 * 1024)
+
+
+def run_benchmark(solvers: dict, disks_range: range, repeats: int = 10, warmup: int = 1,
+                  timeout: float = 60.0, display: bool = True, pegs: int = 3) -> dict:
+    """
+    Mide tiempo y memoria de cada solver para cada cantidad de discos.
+
+    Para cada par (solver, discos) se hacen `warmup` ejecuciones que no se registran (carga de tablas, caches), una
+    pasada de `repeats` ejecuciones midiendo solo tiempo y otra pasada de `repeats` ejecuciones midiendo solo
+    memoria, así tracemalloc no infla los tiempos.
+
+    Cada ejecución corre con el presupuesto de su solver: `timeout` segundos más los límites propios del solver (su
+    atributo budget, ver registry.SolverSpec), igual que en `run_parallel_benchmark`. Si una ejecución lo supera se
+    corta (ver `budget.SearchBudget`) y se descartan el resto de las mediciones de ese solver para esa cantidad de
+    discos y para las siguientes.
+
+    Args:
+        solvers (dict): Diccionario nombre -> solver(problem, budget=None).
+        disks_range (range): Cantidades de discos a medir.
+        repeats (int): Ejecuciones medidas por pasada.
+        warmup (int): Ejecuciones de calentamiento.
+        timeout (float): Máximo de segundos por ejecución, salvo que el solver tenga uno propio. None para no
+            limitarlo.
+        display (bool): Imprime el progreso.
+        pegs (int): Cantidad de varillas.
+
+    Returns:
+        dict: {"execution_time": [...], "memory_allocation": [...]}, cada lista con una fila por (solver, discos):
+        model_name, disks, mean, std, var, median, p95.
+    """
+    results = {"execution_time": [], "memory_allocation": []}
+    timed_out = set()
+    for disks in disks_range:
+        problem = build_problem(disks, pegs)
+        for name, solver in solvers.items():
+            if name in timed_out:
+                continue
+
+            limits = {"max_seconds": timeout, **getattr(solver, "budget", {})}
+            times = []
+            for run in range(warmup + repeats):
+                elapsed, result = measure_time(solver, problem, SearchBudget(**limits))
+                if isinstance(result, BudgetExceeded) or (limits["max_seconds"] is not None
+                                                          and elapsed > limits["max_seconds"]):
+                    timed_out.add(name)
+                    if display:
+                        print(f"{name} con {disks} discos supera su presupuesto {limits}, se descarta")
+                    break
+                if run >= warmup:
+                    times.append(elapsed)
+            if name in timed_out:
+                continue
+
+            memory = [measure_memory(solver, problem) for _ in range(repeats)]
+
+            results["execution_time"].append({"model_name": name, "disks": disks, **summarize(times)})
+            results["memory_allocation"].append({"model_name": name, "disks": disks, **summarize(memory)})
+            if display:
+                print(f"{name} con {disks} discos: {statistics.mean(times):4f} [s], "
+                      f"{statistics.mean(memory):.2f} [MB]")
+    return results
+
+
+def write_results(results: dict, output_dir: str = "./data/benchmark") -> None:
+    """
+    Escribe los resultados con el mismo formato que data/execution_time.csv y data/memory_alloc_df.csv, más las
+    columnas median y p95.
+
+    Args:
+        results (dict): Resultado de `run_benchmark`.
+        output_dir (str): Carpeta de salida.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    files = {"execution_time": "execution_time.csv", "memory_allocation": "memory_alloc_df.csv"}
+    for key, file_name in files.items():
+        with open(os.path.join(output_dir, file_name), "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=["model_name", "disks", "mean", "std", "var", "median", "p95"])
+            writer.writeheader()
+            writer.writerows(results[key])
+
+
+def _run_job(job: tuple) -> dict:
+    """
+    Ejecuta una medición (solver, discos) dentro de un proceso del pool.
+
+    El solver se busca por nombre en el registro (ver src/registry.py), importando antes los módulos que registran
+    solvers propios, porque cada proceso arranca de cero. Si se recibe una cola de CPUs, el proceso toma una, se
+    fija a ella mientras dura la medición y la devuelve al terminar.
+
+    Args:
+        job (tuple): (nombre del solver, discos, varillas, ejecuciones de calentamiento, máximo de segundos por
+            ejecución o None, módulos con solvers propios, cola de CPUs o None).
+
+    Returns:
+        dict: Fila con las columnas de Metrics (model_name, disks, timestamp, execution_time, memory_allocation,
+        movements, frontiers, cost) y budget_exceeded: None, o el BudgetExceeded.as_dict() de la ejecución medida si
+        superó su presupuesto (en ese caso no se mide la memoria y movements y frontiers son los parciales).
+    """
+    from src.registry import get_solver, load_solver_modules
+
+    name, disks, pegs, warmup, timeout, solver_modules, cpu_queue = job
+    cpu = None
+    if cpu_queue is not None:
+        cpu = cpu_queue.get()
+        os.sched_setaffinity(0, {cpu})
+    try:
+        load_solver_modules(solver_modules)
+        solver = get_solver(name)
+        problem = build_problem(disks, pegs)
+        # El presupuesto (timeout y límites propios del solver) se reinicia en cada ejecución, así que el mismo sirve
+        # para el calentamiento
+        budget = SearchBudget(**{"max_seconds": timeout, **solver.budget}) if timeout or solver.budget else None
+        for _ in range(warmup):
+            solver(problem, budget=budget)
+
+        start_time = time.perf_counter()
+        result = solver(problem, budget=budget)
+        execution_time = time.perf_counter() - start_time
+        memory_allocation = None if isinstance(result, BudgetExceeded) else measure_memory(solver, problem)
+    finally:
+        if cpu is not None:
+            cpu_queue.put(cpu)
+
+    explored = frontier = budget_exceeded = None
+    if isinstance(result, tuple):
+        result, explored, frontier = result
+    elif isinstance(result, BudgetExceeded):
+        explored, frontier, budget_exceeded = result.expanded, result.frontier, result.as_dict()
+    return {
+        "model_name": name,
+        "disks": disks,
+        "timestamp": datetime.now(),
+        "execution_time": execution_time,
+        "memory_allocation": memory_allocation,
+        "movements": explored,
+        "frontiers": frontier,
+        "cost": result.state.accumulated_cost if hasattr(result, "state") else None,
+        "budget_exceeded": budget_exceeded,
+    }
+
+
+def run_parallel_benchmark(solver_names: list, disks_range: range, repeats: int = 10, warmup: int = 1,
+                           workers: int = None, cpus: list = None, pegs: int = 3, timeout: float = None,
+                           solver_modules: list = ()) -> list:
+    """
+    Ejecuta las mediciones (solver, discos, repetición) en paralelo con un ProcessPoolExecutor.
+
+    Cada medición corre en un proceso nuevo (max_tasks_per_child=1) y cada proceso atiende una sola medición a la
+    vez, así ninguna comparte caches ni memoria con otra. Con `cpus`, cada medición se fija a una CPU libre de esa
+    lista (solo Linux), para que dos mediciones no compitan por el mismo núcleo.
+
+    Args:
+        solver_names (list): Nombres de los solvers registrados (ver src/registry.py).
+        disks_range (range): Cantidades de discos a medir.
+        repeats (int): Repeticiones por (solver, discos).
+        warmup (int): Ejecuciones de calentamiento dentro de cada medición.
+        workers (int): Cantidad de procesos. Por defecto la cantidad de CPUs (o de `cpus`).
+        cpus (list): CPUs a las que se fijan los procesos. None para no fijarlos. Se ignoran las CPUs que no están
+            disponibles para este proceso y, fuera de Linux, la lista completa.
+        pegs (int): Cantidad de varillas.
+        timeout (float): Máximo de segundos de la ejecución medida; la que lo supera se corta y su fila lo indica
+            en budget_exceeded. None para no limitarla.
+        solver_modules (list): Módulos que registran solvers propios, que cada proceso importa antes de medir.
+
+    Returns:
+        list: Una fila por medición (ver `_run_job`), en el orden en que se enviaron, con timestamps distintos (ver
+        `unique_timestamps`).
+    """
+    context = multiprocessing.get_context("spawn")
+    manager = None
+    cpu_queue = None
+    if cpus and hasattr(os, "sched_setaffinity"):
+        available = os.sched_getaffinity(0)
+        cpus = [cpu for cpu in cpus if cpu in available]
+        if not cpus:
+            raise ValueError('Ninguna de las CPUs indicadas está disponible')
+        workers = min(workers or len(cpus), len(cpus))
+        manager = context.Manager()
+        cpu_queue = manager.Queue()
+        for cpu in cpus:
+            cpu_queue.put(cpu)
+
+    jobs = [(name, disks, pegs, warmup, timeout, list(solver_modules), cpu_queue)
+            for disks in disks_range for name in solver_names for _ in range(repeats)]
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context, max_tasks_per_child=1) as executor:
+            rows = list(executor.map(_run_job, jobs))
+    finally:
+        if manager is not None:
+            manager.shutdown()
+    return unique_timestamps(rows)
+
+
+def unique_timestamps(rows: list) -> list:
+    """
+    Corre hacia adelante, de a un microsegundo, los timestamps de las filas que coinciden con el de otra, porque
+    Metrics.timestamp es único y una sola repetición aborta la inserción de todo el lote. Los procesos del pool
+    toman la hora por separado, así que no se puede contar con que el reloj los distinga.
+
+    Args:
+        rows (list): Filas con la columna timestamp; se modifican en el lugar.
+
+    Returns:
+        list: Las mismas filas, en el mismo orden.
+    """
+    previous = None
+    for row in sorted(rows, key=lambda row: row["timestamp"]):
+        if previous is not None and row["timestamp"] <= previous:
+            row["timestamp"] = previous + timedelta(microseconds=1)
+        previous = row["timestamp"]
+    return rows
+
+
+def summarize_rows(rows: list) -> dict:
+    """
+    Agrupa las filas de `run_parallel_benchmark` por (solver, discos) con el mismo formato que `run_benchmark`. Las
+    mediciones que superaron el timeout no se incluyen.
+    """
+    groups = {}
+    for row in rows:
+        if row.get("budget_exceeded"):
+            continue
+        groups.setdefault((row["model_name"], row["disks"]), []).append(row)
+
+    results = {"execution_time": [], "memory_allocation": []}
+    for (name, disks), group in groups.items():
+        for key in results:
+            values = [row[key] for row in group]
+            results[key].append({"model_name": name, "disks": disks, **summarize(values)})
+    return results
@@ -0,0 +1,192 @@
+import functools
+import inspect
+import time
+import tracemalloc
+from typing import Callable
+
+from src import hanoi_states
+from src.profiling import ProfiledProblem, resident_memory_mb
+
+
+class SearchBudget:
+    """
+    Límites de una búsqueda: tiempo de reloj, cantidad de expansiones y memoria. También se puede cancelar desde
+    afuera (otro hilo, un manejador de señales) con `cancel`.
+
+    Igual que SearchProfile y SearchProgress, solo se engancha al problema cuando se pasa a una búsqueda
+    (`budget=`), contando cada llamada a actions como una expansión. Las expansiones se controlan en cada una; el
+    tiempo, la memoria y la cancelación cada `check_every` expansiones, así el costo por nodo es un contador.
+
+    Cuando se supera un límite la búsqueda se corta y devuelve un BudgetExceeded con las estadísticas parciales en
+    lugar de la solución (ver `budgeted`).
+
+    La memoria es lo que creció desde el inicio de la búsqueda: la que informa tracemalloc si está activo (la misma
+    que mide main.py) o, si no, la memoria residente (ver `profiling.resident_memory_mb`; sin psutil es el pico del
+    proceso, así que puede no detectar una búsqueda que no supera el pico de una anterior).
+    """
+
+    def __init__(self, max_seconds: float = None, max_expansions: int = None, max_memory_mb: float = None,
+                 check_every: int = 256):
+        """
+        Args:
+            max_seconds (float, optional): Máximo de segundos de reloj desde que empieza la búsqueda.
+            max_expansions (int, optional): Máximo de nodos expandidos.
+            max_memory_mb (float, optional): Máximo de memoria de la búsqueda, en MB.
+            check_every (int): Cada cuántas expansiones se controlan el tiempo, la memoria y la cancelación.
+        """
+        self.max_seconds = max_seconds
+        self.max_expansions = max_expansions
+        self.max_memory_mb = max_memory_mb
+        self.check_every = check_every
+        self.cancelled = False
+        self.expanded = 0
+        self.frontiers = ()
+        self.reached = ()
+        self.start_time = time.perf_counter()
+        self.start_memory = 0.0
+
+    def problem(self, problem: hanoi_states.ProblemHanoi) -> ProfiledProblem:
+        """
+        Envuelve el problema para controlar los límites en cada expansión. Reinicia el reloj y los contadores, así el
+        mismo presupuesto se puede usar en varias búsquedas seguidas.
+        """
+        actions = problem.actions
+
+        def budgeted_actions(state):
+            self.expanded += 1
+            if self.max_expansions is not None and self.expanded > self.max_expansions:
+                raise BudgetStop("expansions")
+            if self.expanded % self.check_every == 0:
+                self.check()
+            return actions(state)
+
+        self.expanded = 0
+        self.frontiers = ()
+        self.reached = ()
+        if tracemalloc.is_tracing():
+            self.start_memory = tracemalloc.get_traced_memory()[0] / (1024 * 1024)
+        else:
+            self.start_memory = resident_memory_mb() or 0.0
+        self.start_time = time.perf_counter()
+        return ProfiledProblem(problem, actions=budgeted_actions)
+
+    def watch(self, frontiers: tuple, reached: tuple) -> None:
+        """
+        Registra las fronteras y los conjuntos de estados alcanzados cuyos tamaños se informan al cortar la búsqueda.
+        """
+        self.frontiers = frontiers
+        self.reached = reached
+
+    def cancel(self) -> None:
+        """
+        Pide que la búsqueda se corte en el próximo control.
+        """
+        self.cancelled = True
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start_time
+
+    def memory_mb(self) -> float:
+        """
+        Memoria usada por la búsqueda hasta el momento, en MB (None si no se puede medir).
+        """
+        if tracemalloc.is_tracing():
+            return tracemalloc.get_traced_memory()[0] / (1024 * 1024) - self.start_memory
+        memory = resident_memory_mb()
+        return None if memory is None else memory - self.start_memory
+
+    def check(self) -> None:
+        """
+        Corta la búsqueda si se canceló o si se superó el tiempo o la memoria.
+        """
+        if self.cancelled:
+            raise BudgetStop("cancelled")
+        if self.max_seconds is not None and self.elapsed() > self.max_seconds:
+            raise BudgetStop("time")
+        if self.max_memory_mb is not None:
+            memory = self.memory_mb()
+            if memory is not None and memory > self.max_memory_mb:
+                raise BudgetStop("memory")
+
+    def exceeded(self, reason: str) -> "BudgetExceeded":
+        """
+        Resultado con las estadísticas parciales de la búsqueda cortada.
+        """
+        limits = {"time": self.max_seconds, "expansions": self.max_expansions, "memory": self.max_memory_mb}
+        memory = self.memory_mb()
+        return BudgetExceeded(
+            reason=reason,
+            limit=limits.get(reason),
+            expanded=min(self.expanded, self.max_expansions) if reason == "expansions" else self.expanded,
+            elapsed=self.elapsed(),
+            memory_mb=None if memory is None else round(memory, 3),
+            frontier=sum(len(frontier) for frontier in self.frontiers),
+            reached=sum(len(reached) for reached in self.reached),
+        )
+
+
+class BudgetExceeded:
+    """
+    Resultado de una búsqueda cortada por su SearchBudget, en lugar de la tupla (nodo, explorados, frontera).
+
+    Atributos:
+        reason (str): "time", "expansions", "memory" o "cancelled".
+        limit: Límite superado (None si se canceló).
+        expanded (int): Nodos expandidos hasta el corte.
+        elapsed (float): Segundos desde el inicio de la búsqueda.
+        memory_mb (float): Memoria de la búsqueda al cortar (ver `SearchBudget.memory_mb`).
+        frontier (int): Nodos en la(s) frontera(s) al cortar (0 si la búsqueda no registra su frontera).
+        reached (int): Estados alcanzados al cortar (0 si la búsqueda no los registra).
+    """
+
+    def __init__(self, reason: str, limit, expanded: int, elapsed: float, memory_mb: float, frontier: int,
+                 reached: int):
+        self.reason = reason
+        self.limit = limit
+        self.expanded = expanded
+        self.elapsed = elapsed
+        self.memory_mb = memory_mb
+        self.frontier = frontier
+        self.reached = reached
+
+    def as_dict(self) -> dict:
+        return {"budget_exceeded": self.reason, "limit": self.limit, "expanded": self.expanded,
+                "elapsed": round(self.elapsed, 6), "memory_mb": self.memory_mb, "frontier": self.frontier,
+                "reached": self.reached}
+
+    def __str__(self):
+        return (f"Presupuesto excedido ({self.reason}, límite {self.limit}): {self.expanded} expandidos, "
+                f"{self.frontier} en la frontera, {self.elapsed:.2f} [s]")
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.as_dict()}>"
+
+
+class BudgetStop(Exception):
+    """
+    Corta el lazo de búsqueda desde adentro de problem.actions; `budgeted` la convierte en BudgetExceeded. Las
+    búsquedas anytime (ara_star_search) la atrapan para devolver la mejor solución encontrada hasta el corte.
+    """
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+def budgeted(search: Callable) -> Callable:
+    """
+    Decorador de las búsquedas de src/search.py que reciben `budget`: si la búsqueda supera el presupuesto, devuelve
+    el BudgetExceeded correspondiente en lugar de propagar el corte. El presupuesto se toma de los argumentos de la
+    llamada, se haya pasado por nombre o por posición.
+    """
+    signature = inspect.signature(search)
+
+    @functools.wraps(search)
+    def wrapper(*args, **kwargs):
+        budget = signature.bind_partial(*args, **kwargs).arguments.get("budget")
+        try:
+            return search(*args, **kwargs)
+        except BudgetStop as stop:
+            return budget.exceeded(stop.reason)
+
+    return wrapper
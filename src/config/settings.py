@@ -9,7 +9,18 @@ load_dotenv(dotenv_path, override=False)  # priorizes env vars (not .env file)
 
 config = {
     "SQLALCHEMY_DATABASE_PREFIX": os.getenv("SQLALCHEMY_DATABASE_PREFIX", ""),
-    "SQLALCHEMY_DATABASE_URL": os.getenv("SQLALCHEMY_DATABASE_URL", ""),
+    # Sin URL configurada se usa un archivo SQLite local en data/metrics.db
+    "SQLALCHEMY_DATABASE_URL": os.getenv(
+        "SQLALCHEMY_DATABASE_URL",
+        "sqlite:///" + os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "data", "metrics.db"))
+    ),
     "SQLALCHEMY_DATABASE_ECHO": os.getenv("SQLALCHEMY_DATABASE_ECHO", "").lower() in ('true', '1', 't'),
-    "DATABASE_TABLE_METRICS": os.getenv("DATABASE_TABLE_METRICS", ""),
+    "DATABASE_TABLE_METRICS": os.getenv("DATABASE_TABLE_METRICS", "metrics"),
+    "DATABASE_TABLE_PROGRESS": os.getenv("DATABASE_TABLE_PROGRESS", "search_progress"),
+    # Carpeta de las tablas precalculadas (pattern databases). Por defecto data/pattern_databases dentro del repo,
+    # sin importar desde qué directorio se ejecute.
+    "PATTERN_DATABASE_DIR": os.getenv(
+        "PATTERN_DATABASE_DIR",
+        os.path.join(os.path.dirname(__file__), "..", "..", "data", "pattern_databases")
+    ),
 }
\ No newline at end of file
@@ -1,5 +1,4 @@
-import copy
-from typing import Optional
+from typing import Iterator, Optional
 
 from src import aima
 
@@ -19,62 +18,164 @@ def is_sorted(test_list: list) -> bool:
     return False
 
 
+def encode_rods(rods: list, number_of_pegs: int = 3) -> int:
+    """
+    Codifica la ubicación de los discos como un entero en base `number_of_pegs`.
+
+    El dígito `d-1` del código es el índice de la varilla en la que está el disco `d`. Como en cada varilla los
+    discos están ordenados de forma descendente, la ubicación de cada disco determina el estado completo.
+
+    Args:
+        rods (list): Lista de varillas, cada una con sus discos de abajo hacia arriba.
+        number_of_pegs (int): Cantidad de varillas.
+
+    Returns:
+        int: Código del estado.
+    """
+    code = 0
+    for index, rod in enumerate(rods):
+        for disk in rod:
+            code += index * number_of_pegs ** (disk - 1)
+    return code
+
+
+def decode_rods(code: int, number_of_disks: int, number_of_pegs: int = 3) -> list:
+    """
+    Reconstruye las varillas a partir del código de un estado.
+
+    Args:
+        code (int): Código del estado (ver `encode_rods`).
+        number_of_disks (int): Cantidad de discos del problema.
+        number_of_pegs (int): Cantidad de varillas.
+
+    Returns:
+        list: Lista de varillas, cada una con sus discos de abajo hacia arriba.
+    """
+    rods = [[] for _ in range(number_of_pegs)]
+    for disk in range(number_of_disks, 0, -1):
+        rods[(code // number_of_pegs ** (disk - 1)) % number_of_pegs].append(disk)
+    return rods
+
+
 class StatesHanoi:
     """
     Representa un estado posible de ubicación de discos de la Torre de Hanoi.
+
+    Además de las varillas, el estado se codifica como un único entero en base `number_of_pegs`, donde el dígito
+    `d-1` indica en qué varilla está el disco `d`. Ese código es el que se usa para comparar y hashear estados, por
+    lo que las búsquedas en `explored`/`reached` no necesitan recorrer las listas.
     """
 
-    def __init__(self, rod1: list, rod2: list, rod3: list, max_disks: int = 5, cost: float = 0.0):
+    __slots__ = ('rods', 'number_of_disks', 'number_of_pegs', 'accumulated_cost', 'code')
+
+    def __init__(self, *rods: list, max_disks: int = 5, cost: float = 0.0):
         """
         Inicializa un estado posible de ubicación de discos de la Torre de Hanoi.
 
         Args:
-            rod1 (list): Discos en la primera varilla.
-            rod2 (list): Discos en la segunda varilla.
-            rod3 (list): Discos en la tercera varilla.
+            *rods (list): Discos de cada varilla, de abajo hacia arriba. Tantas listas como varillas (al menos 3), por
+                ejemplo StatesHanoi([3, 2, 1], [], []) para 3 varillas o StatesHanoi([3, 2, 1], [], [], []) para 4.
             max_disks (int): Máximo número de discos permitidos.
             cost (float): Costo asociado al estado.
         """
+        if len(rods) < 3:
+            raise ValueError('Se necesitan al menos 3 varillas')
+
         # Comprobamos si es un estado ilegal
-        if (set.intersection(set(rod1), set(rod2)) or
-                set.intersection(set(rod2), set(rod3)) or
-                set.intersection(set(rod1), set(rod3))):
+        all_values = set().union(*rods)
+        if sum(len(set(rod)) for rod in rods) != len(all_values):
             raise ValueError('El mismo disco está en varillas diferentes')
 
-        all_values = set.union(set(rod1), set(rod2), set(rod3))
         if not all(0 < i < (max_disks + 1) for i in all_values):
             raise ValueError('Valor de disco incorrecto')
 
         if not all(i in all_values for i in range(1, max_disks + 1)):
             raise ValueError('No todos los discos están insertados')
 
-        for rod in [rod1, rod2, rod3]:
+        for rod in rods:
             if not is_sorted(rod):
                 raise ValueError('No es un estado de Hanoi válido')
 
-        self.rods = [rod1, rod2, rod3]
+        self.rods = list(rods)
         self.number_of_disks = sum([len(rod) for rod in self.rods])
-        self.number_of_pegs = 3
+        self.number_of_pegs = len(self.rods)
         self.accumulated_cost = cost
+        self.code = encode_rods(self.rods, self.number_of_pegs)
 
-        self.string_representation = ""
-        self.generate_representation()
+    @classmethod
+    def from_code(cls, code: int, number_of_disks: int, cost: float = 0.0, number_of_pegs: int = 3) -> "StatesHanoi":
+        """
+        Construye un estado a partir de su código entero, sin volver a validarlo.
 
-    def generate_representation(self):
+        Args:
+            code (int): Código del estado (ver `encode_rods`).
+            number_of_disks (int): Cantidad de discos del problema.
+            cost (float): Costo asociado al estado.
+            number_of_pegs (int): Cantidad de varillas.
+
+        Returns:
+            StatesHanoi: Estado correspondiente al código.
+        """
+        state = cls.__new__(cls)
+        state.number_of_pegs = number_of_pegs
+        state.rods = decode_rods(code, number_of_disks, state.number_of_pegs)
+        state.number_of_disks = number_of_disks
+        state.accumulated_cost = cost
+        state.code = code
+        return state
+
+    def move_disk(self, rod_input: int, rod_out: int, cost: float = 1.0) -> "StatesHanoi":
+        """
+        Genera el estado sucesor de mover el disco superior de `rod_input` a `rod_out`.
+
+        El movimiento se asume legal (como los que devuelve `ProblemHanoi.actions`), por lo que no se vuelve a
+        validar el estado. Solo se copian las dos varillas que cambian; el resto se comparte con el estado padre.
+        Esto es seguro porque `get_last_disk_rod` y `put_disk_in_rod` reemplazan la varilla en lugar de modificarla.
+
+        Args:
+            rod_input (int): Índice de la varilla de la que se saca el disco.
+            rod_out (int): Índice de la varilla en la que se coloca el disco.
+            cost (float): Costo del movimiento, se suma al costo acumulado.
+
+        Returns:
+            StatesHanoi: Nuevo estado de Hanoi después del movimiento.
+        """
+        rods = list(self.rods)
+        source = rods[rod_input][:-1]
+        disk = rods[rod_input][-1]
+        rods[rod_input] = source
+        rods[rod_out] = rods[rod_out] + [disk]
+
+        state = StatesHanoi.__new__(StatesHanoi)
+        state.rods = rods
+        state.number_of_disks = self.number_of_disks
+        state.number_of_pegs = self.number_of_pegs
+        state.accumulated_cost = self.accumulated_cost + cost
+        state.code = self.code + (rod_out - rod_input) * self.number_of_pegs ** (disk - 1)
+        return state
+
+    @property
+    def string_representation(self) -> str:
+        """
+        Representación en forma de string del estado de Hanoi.
+        """
+        return self.generate_representation()
+
+    def generate_representation(self) -> str:
         """
         Genera una representación en forma de string del estado de Hanoi.
+
+        Returns:
+            str: Cadena que representa el estado de Hanoi.
         """
-        strings = 'HanoiState: '
-        for rod in self.rods:
-            strings += ' '.join(str(disk) for disk in rod)
-            strings += " | "
-        self.string_representation = strings[:-3]
+        return 'HanoiState: ' + ' | '.join(' '.join(str(disk) for disk in rod) for rod in self.rods)
 
     def __eq__(self, other):
         """
         Compara dos estados de Hanoi para verificar si son iguales.
 
-        Dos estados de Hanoi son iguales si tienen la misma cantidad de discos y la misma ubicación.
+        Dos estados de Hanoi son iguales si tienen la misma cantidad de discos y de varillas y la misma ubicación, lo
+        que equivale a tener el mismo código.
 
         Args:
             other: Otro estado de Hanoi a comparar.
@@ -82,11 +183,8 @@ class StatesHanoi:
         Returns:
             bool: True si los estados son iguales, False en caso contrario.
         """
-        if self.number_of_disks == other.number_of_disks:
-            if self.rods == other.rods:
-                return True
-
-        return False
+        return (self.code == other.code and self.number_of_disks == other.number_of_disks and
+                self.number_of_pegs == other.number_of_pegs)
 
     def __lt__(self, other):
         """
@@ -109,8 +207,7 @@ class StatesHanoi:
         Returns:
             str: Cadena que representa el estado de Hanoi.
         """
-        self.generate_representation()
-        return self.string_representation
+        return self.generate_representation()
 
     def __str__(self):
         """
@@ -119,18 +216,16 @@ class StatesHanoi:
         Returns:
             str: Cadena que representa el estado de Hanoi.
         """
-        self.generate_representation()
-        return self.string_representation
+        return self.generate_representation()
 
     def __hash__(self):
         """
         Genera un hash para el objeto StatesHanoi.
 
         Returns:
-            int: Hash generado para el estado de Hanoi.
+            int: Hash generado para el estado de Hanoi (el propio código del estado).
         """
-        self.generate_representation()
-        return hash(self.string_representation)
+        return self.code
 
     def get_last_disk_rod(self, number_rod: int, peek: bool = False) -> Optional[int]:
         """
@@ -147,7 +242,11 @@ class StatesHanoi:
         if len(rod) != 0:
             if peek:
                 return rod[-1]
-            return rod.pop()
+            # Se reemplaza la varilla en vez de modificarla, porque puede estar compartida con otro estado
+            disk = rod[-1]
+            self.rods[number_rod] = rod[:-1]
+            self.code -= number_rod * self.number_of_pegs ** (disk - 1)
+            return disk
         return None
 
     def check_valid_disk_in_rod(self, number_rod: int, disk: int) -> bool:
@@ -178,7 +277,8 @@ class StatesHanoi:
             disk (int): Número del disco a colocar.
         """
         if self.check_valid_disk_in_rod(number_rod, disk):
-            self.rods[number_rod].append(disk)
+            self.rods[number_rod] = self.rods[number_rod] + [disk]
+            self.code += number_rod * self.number_of_pegs ** (disk - 1)
 
     def accumulate_cost(self, cost):
         """
@@ -223,8 +323,14 @@ class StatesHanoi:
 class ActionHanoi:
     """
     Representa una acción en el problema de la Torre de Hanoi.
+
+    Solo guarda el disco y las dos varillas (con __slots__, sin diccionario por instancia): la búsqueda crea una
+    acción por cada hijo generado y la mayoría se descarta, así que la descripción (`action`) y el diccionario para el
+    simulador (`action_dict`) se arman recién cuando se piden, al exportar la solución.
     """
 
+    __slots__ = ('disk', 'rod_input', 'rod_out')
+
     def __init__(self, disk: int, rod_input: int, rod_out: int):
         """
         Inicializa una acción para mover un disco de la Torre de Hanoi.
@@ -232,30 +338,46 @@ class ActionHanoi:
         Args:
             disk (int): Número del disco.
             rod_input (int): Índice de la varilla de entrada.
-            rod_out (int): Índice de la varilla de salida.
+            rod_out (int): Índice de la varilla de salida. Si es igual a `rod_input`, la acción mantiene el disco
+                en su lugar con costo 0 (`ProblemHanoi.actions` nunca las genera).
         """
         self.disk = disk
         self.rod_input = rod_input
+        self.rod_out = rod_out
+
+    @property
+    def cost(self) -> float:
+        """
+        Costo de la acción: 1 por movimiento, 0 si el disco se mantiene en su varilla.
+        """
+        return 1.0 if self.rod_input != self.rod_out else 0.0
+
+    @property
+    def action(self) -> str:
+        """
+        Descripción de la acción.
+        """
+        if self.rod_input != self.rod_out:
+            return f"Move disk {self.disk} from {self.rod_input + 1} to {self.rod_out + 1}"
+        return f"Maintain disk {self.disk} in {self.rod_input + 1}"
 
-        if rod_input != rod_out:
-            self.action = f"Move disk {disk} from {rod_input + 1} to {rod_out + 1}"
-            self.action_dict = {
+    @property
+    def action_dict(self) -> dict:
+        """
+        Acción con el formato de los JSON del simulador.
+        """
+        if self.rod_input != self.rod_out:
+            return {
                 "type": "movement",
-                "disk": disk,
-                "peg_start": rod_input + 1,
-                "peg_end": rod_out + 1
+                "disk": self.disk,
+                "peg_start": self.rod_input + 1,
+                "peg_end": self.rod_out + 1
             }
-            self.cost = 1.0
-            self.rod_out = rod_out
-        else:
-            self.action = f"Maintain disk {disk} in {rod_input + 1}"
-            self.action_dict = {
-                "type": "maintain",
-                "disk": disk,
-                "peg": rod_input + 1
-            }
-            self.cost = 0.0
-            self.rod_out = rod_input
+        return {
+            "type": "maintain",
+            "disk": self.disk,
+            "peg": self.rod_input + 1
+        }
 
     def __repr__(self):
         """
@@ -285,14 +407,7 @@ class ActionHanoi:
         Returns:
             StatesHanoi: Nuevo estado de Hanoi después de ejecutar la acción.
         """
-        if "move" in self.action.lower():
-            state_out = copy.deepcopy(state_hanoi)
-
-            disk = state_out.get_last_disk_rod(self.rod_input)
-            state_out.put_disk_in_rod(self.rod_out, disk)
-            state_out.accumulate_cost(self.cost)
-            return state_out
-        return state_hanoi
+        return state_hanoi.move_disk(self.rod_input, self.rod_out, self.cost)
 
 
 class ProblemHanoi(aima.Problem):
@@ -314,27 +429,25 @@ class ProblemHanoi(aima.Problem):
         """
         super().__init__(initial=initial, goal=goal)
 
-    def actions(self, state: StatesHanoi):
+    def actions(self, state: StatesHanoi) -> Iterator[ActionHanoi]:
         """
-        Devuelve todas las acciones posibles que se pueden ejecutar desde un estado dado.
+        Genera, de a una, las acciones posibles desde un estado dado: mover el disco superior de una varilla a otra
+        vacía o cuyo disco superior sea más grande. Nunca genera acciones que dejan el disco en la misma varilla.
 
         Args:
             state (StatesHanoi): Estado actual de la Torre de Hanoi.
 
-        Returns:
-            list: Lista con todas las acciones posibles.
-        """
-        actions_list = []
-        for i in range(3):
-            for j in range(3):
-                disk = state.get_last_disk_rod(i, peek=True)
-                if disk:
-                    if state.check_valid_disk_in_rod(j, disk):
-                        actions_list.append(ActionHanoi(disk, i, j))
-                else:
-                    break
-
-        return actions_list
+        Yields:
+            ActionHanoi: Cada acción posible.
+        """
+        tops = [rod[-1] if rod else None for rod in state.rods]
+        for rod_input, disk in enumerate(tops):
+            if disk is None:
+                continue
+            # En la misma varilla top == disk, así que nunca se genera un movimiento a la varilla de origen
+            for rod_out, top in enumerate(tops):
+                if top is None or top > disk:
+                    yield ActionHanoi(disk, rod_input, rod_out)
 
     def result(self, state: StatesHanoi, action: ActionHanoi):
         """
@@ -1,3 +1,6 @@
+from collections import OrderedDict
+from typing import Callable
+
 from src import hanoi_states
 
 
@@ -22,23 +25,21 @@ def heuristic_func_astar_2(nodeState: hanoi_states.StatesHanoi, num_of_disks: in
     
     Args:
         nodeState (hanoi_states.StatesHanoi): Objeto StatesHanoi que representa el estado actual del problema.
-        num_of_disks (int, optional): Numero de discos del problem. Defecto 5.
+        num_of_disks (int, optional): No se usa, se toma la cantidad de discos del estado. Se mantiene por
+                                      compatibilidad.
 
     Returns:
         int: Costo total que quita la heuristica dado el estado actual
     """
-    def compute_rod(current_rod, number_of_disks):
-        goal_rod = list(range(number_of_disks, 0, -1))
-        result = [0] * number_of_disks
-        for i in range(min(len(current_rod), number_of_disks)):
-            if current_rod[i] == goal_rod[i]:
-                result[i] = 1
-        return result
-    num_of_disks = max(max(rod) for rod in nodeState.rods if len(rod) > 0)
-    current_target_rod_disks = nodeState.rods[-1]
-    computed_rod = compute_rod(current_target_rod_disks, num_of_disks)
-    reward = sum([-2**(num_of_disks-idx-1)*i for idx, i in enumerate(computed_rod)])
-    return reward
+    # Las varillas son decrecientes, así que los discos en posición final son siempre un prefijo de la varilla destino
+    # (n, n-1, ...). Si son k, quitan 2^(n-1) + ... + 2^(n-k) = 2^n - 2^(n-k), sin armar la varilla objetivo.
+    num_of_disks = nodeState.number_of_disks
+    correct = 0
+    for disk in nodeState.rods[-1]:
+        if disk != num_of_disks - correct:
+            break
+        correct += 1
+    return 2 ** (num_of_disks - correct) - 2 ** num_of_disks
 
 def heuristic_func_greedy (nodeState: hanoi_states.StatesHanoi) -> int:
     """
@@ -49,3 +50,92 @@ def heuristic_func_greedy (nodeState: hanoi_states.StatesHanoi) -> int:
         int: Costo total que quita la heuristica dado el estado actual
     """
     return sum(nodeState.rods[-1])-sum(nodeState.rods[0])
+
+
+# Formas incrementales: calculan h(hijo) a partir de h(padre), el estado padre y la acción, en O(1). Las búsquedas
+# las usan cuando la heurística tiene el atributo `incremental` (ver tree_hanoi.NodeHanoi.child_node).
+
+def update_heuristic_astar_1(h: int, nodeState: hanoi_states.StatesHanoi, action: hanoi_states.ActionHanoi) -> int:
+    """
+    heuristic_func_astar_1 del hijo: solo cambia si el disco entra o sale de la varilla destino.
+    """
+    last_rod = len(nodeState.rods) - 1
+    if action.rod_out == last_rod:
+        h -= action.disk
+    if action.rod_input == last_rod:
+        h += action.disk
+    return h
+
+
+def update_heuristic_astar_2(h: int, nodeState: hanoi_states.StatesHanoi, action: hanoi_states.ActionHanoi) -> int:
+    """
+    heuristic_func_astar_2 del hijo: la cantidad k de discos en posición final se despeja de h = 2^(n-k) - 2^n y
+    solo cambia si se apoya sobre ellos el siguiente disco correcto o si se saca el último de ellos.
+    """
+    last_rod = len(nodeState.rods) - 1
+    if action.rod_input == action.rod_out or last_rod not in (action.rod_input, action.rod_out):
+        return h
+    num_of_disks = nodeState.number_of_disks
+    correct = num_of_disks - ((h + 2 ** num_of_disks).bit_length() - 1)
+    if len(nodeState.rods[last_rod]) == correct:
+        if action.rod_out == last_rod and action.disk == num_of_disks - correct:
+            correct += 1
+        elif action.rod_input == last_rod:
+            correct -= 1
+    return 2 ** (num_of_disks - correct) - 2 ** num_of_disks
+
+
+def update_heuristic_greedy(h: int, nodeState: hanoi_states.StatesHanoi, action: hanoi_states.ActionHanoi) -> int:
+    """
+    heuristic_func_greedy del hijo: solo cambia si el disco entra o sale de la primera o de la última varilla.
+    """
+    last_rod = len(nodeState.rods) - 1
+    for rod, sign in ((last_rod, 1), (0, -1)):
+        if action.rod_out == rod:
+            h += sign * action.disk
+        if action.rod_input == rod:
+            h -= sign * action.disk
+    return h
+
+
+heuristic_func_astar_1.incremental = update_heuristic_astar_1
+heuristic_func_astar_2.incremental = update_heuristic_astar_2
+heuristic_func_greedy.incremental = update_heuristic_greedy
+
+
+class HeuristicCache:
+    """
+    Memoriza una heurística por estado, con una cache LRU acotada a `maxsize` estados.
+
+    Una búsqueda genera muchas veces los mismos estados (desde padres distintos), así que cada estado se evalúa una
+    sola vez mientras siga en la cache. Cuenta aciertos (hits) y evaluaciones (misses).
+    """
+
+    def __init__(self, heuristic_func: Callable, maxsize: int = 2 ** 20):
+        """
+        Args:
+            heuristic_func (Callable): Heurística a memorizar.
+            maxsize (int): Cantidad máxima de estados en la cache; al superarla se descarta el usado hace más tiempo.
+        """
+        self.heuristic_func = heuristic_func
+        self.maxsize = maxsize
+        self.values = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        # Se conserva el nombre de la heurística, que usan SearchProfile y los reportes
+        self.__name__ = getattr(heuristic_func, '__name__', 'heuristic_func')
+        self.incremental = getattr(heuristic_func, 'incremental', None)
+
+    def __call__(self, nodeState: hanoi_states.StatesHanoi) -> int:
+        values = self.values
+        try:
+            value = values[nodeState]
+        except KeyError:
+            self.misses += 1
+            value = values[nodeState] = self.heuristic_func(nodeState)
+            if len(values) > self.maxsize:
+                values.popitem(last=False)
+            return value
+        self.hits += 1
+        values.move_to_end(nodeState)
+        return value
@@ -0,0 +1,96 @@
+import os
+from typing import Callable, Optional
+
+import numpy as np
+
+from src.config.settings import config
+
+
+# Se incrementa cada vez que cambia el formato de los archivos, así no se leen tablas viejas
+LOOKUP_TABLES_VERSION = 1
+
+
+def table_path(name: str, dtype, directory: str = None) -> str:
+    """
+    Ruta del archivo de una tabla. El nombre incluye la versión del formato y el tipo de dato, que junto con el
+    tamaño del archivo alcanzan para leerla sin ningún encabezado.
+
+    Args:
+        name (str): Nombre de la tabla, debe identificar sus parámetros (por ejemplo "goal_distances_n14").
+        dtype: Tipo de dato de numpy de los elementos.
+        directory (str): Carpeta de las tablas. Por defecto config["PATTERN_DATABASE_DIR"].
+
+    Returns:
+        str: Ruta del archivo.
+    """
+    directory = directory or config["PATTERN_DATABASE_DIR"]
+    return os.path.join(directory, f"{name}.v{LOOKUP_TABLES_VERSION}.{np.dtype(dtype).name}.bin")
+
+
+def save_table(name: str, array: np.ndarray, directory: str = None) -> str:
+    """
+    Guarda una tabla como un arreglo plano de bytes.
+
+    Se escribe primero en un archivo temporal y después se renombra, así otro proceso nunca ve una tabla a medio
+    escribir.
+
+    Args:
+        name (str): Nombre de la tabla.
+        array (np.ndarray): Tabla a guardar (se guarda aplanada).
+        directory (str): Carpeta de las tablas.
+
+    Returns:
+        str: Ruta del archivo guardado.
+    """
+    path = table_path(name, array.dtype, directory)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    np.ascontiguousarray(array).ravel().tofile(temporary_path)
+    os.replace(temporary_path, path)
+    return path
+
+
+def load_table(name: str, dtype, directory: str = None) -> Optional[np.ndarray]:
+    """
+    Abre una tabla guardada como un np.memmap de solo lectura.
+
+    No se lee el archivo: las páginas se cargan a medida que se consultan y quedan en la cache del sistema operativo,
+    así que todos los procesos que abren la misma tabla comparten una única copia en memoria.
+
+    Args:
+        name (str): Nombre de la tabla.
+        dtype: Tipo de dato de numpy de los elementos.
+        directory (str): Carpeta de las tablas.
+
+    Returns:
+        Optional[np.ndarray]: La tabla, o None si no existe.
+    """
+    path = table_path(name, dtype, directory)
+    if not os.path.exists(path):
+        return None
+    return np.memmap(path, dtype=dtype, mode='r')
+
+
+def load_or_build_table(name: str, dtype, builder: Callable[[], np.ndarray], directory: str = None,
+                        persist: bool = True) -> np.ndarray:
+    """
+    Abre una tabla ya guardada o la construye con `builder` y la guarda.
+
+    Args:
+        name (str): Nombre de la tabla.
+        dtype: Tipo de dato de numpy de los elementos.
+        builder (Callable): Función sin argumentos que calcula la tabla.
+        directory (str): Carpeta de las tablas.
+        persist (bool): Indica si la tabla se lee y se guarda en disco.
+
+    Returns:
+        np.ndarray: La tabla (un np.memmap de solo lectura si está en disco).
+    """
+    if not persist:
+        return builder().astype(dtype, copy=False)
+
+    table = load_table(name, dtype, directory)
+    if table is None:
+        save_table(name, builder().astype(dtype, copy=False), directory)
+        table = load_table(name, dtype, directory)
+    return table
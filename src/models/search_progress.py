@@ -0,0 +1,30 @@
+from src.services.databases import Base
+from src.config.settings import config
+from sqlalchemy import Column, Integer, String, Float, DateTime
+
+
+
+class SearchProgress(Base):
+    """
+    Serie de tiempo del avance de una búsqueda (ver src/profiling.py). `run_timestamp` es el timestamp de la fila de
+    Metrics de la misma ejecución.
+    """
+    __tablename__ = config["DATABASE_TABLE_PROGRESS"]
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    run_timestamp = Column(DateTime, index=True)
+    model_name = Column(String(200))
+    disks = Column(Integer)
+    expanded = Column(Integer)
+    elapsed = Column(Float)
+    nodes_per_second = Column(Float)
+    frontier = Column(Integer)
+    reached = Column(Integer)
+    best_f = Column(Float)
+    rss_mb = Column(Float)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} id: '{self.id}' model_name: '{self.model_name}'  expanded: '{self.expanded}'>"
+
+    def __str__(self):
+        return self.__repr__()
@@ -0,0 +1,191 @@
+from array import array
+
+import numpy as np
+
+from src import hanoi_states
+from src import tree_hanoi
+
+
+# Índice de "ningún nodo": padre de la raíz y estados todavía no alcanzados
+NO_NODE = -1
+
+# Con hasta esta cantidad de configuraciones posibles, el índice código -> nodo es un arreglo de numpy de 4 bytes por
+# configuración (3^14 son 18 MB); con más, un diccionario con solo los estados alcanzados
+DENSE_INDEX_LIMIT = 3 ** 14
+
+
+class NodeStore:
+    """
+    Árbol de búsqueda guardado en arreglos paralelos, sin un objeto por nodo.
+
+    Cada nodo es un entero (su posición en los arreglos) y solo se guarda el código de su estado, el índice de su
+    padre, el movimiento que lo generó y su costo acumulado g (y opcionalmente su heurística h): 28 bytes por nodo
+    (8 + 8 + 4 + 8, 36 con h), más el índice código -> nodo, contra los cientos de bytes de un NodeHanoi con su
+    StatesHanoi, sus varillas y su ActionHanoi. Los estados se reconstruyen del código solo al expandir un nodo, y el camino se convierte en
+    NodeHanoi/ActionHanoi solo para la solución final (ver `solution`).
+
+    El índice guarda el último nodo de cada estado: si una búsqueda encuentra un camino mejor a un estado ya
+    alcanzado agrega un nodo nuevo, y el anterior se conserva porque puede ser padre de otros nodos.
+    """
+
+    def __init__(self, initial: hanoi_states.StatesHanoi, h: float = None, dense_limit: int = DENSE_INDEX_LIMIT):
+        """
+        Inicializa el árbol con la raíz.
+
+        Args:
+            initial (hanoi_states.StatesHanoi): Estado de la raíz.
+            h (float, optional): Heurística de la raíz. Si se pasa, cada nodo guarda su h (ver `add`).
+            dense_limit (int): Máximo de configuraciones posibles para usar un índice denso (ver
+                DENSE_INDEX_LIMIT).
+        """
+        self.number_of_disks = initial.number_of_disks
+        self.number_of_pegs = initial.number_of_pegs
+        states = self.number_of_pegs ** self.number_of_disks
+        if states > 2 ** 63:
+            raise ValueError('Demasiadas configuraciones para codificarlas en 64 bits')
+
+        self.codes = array('q')
+        self.parents = array('q')
+        # Movimiento (disco * varillas + origen) * varillas + destino
+        self.moves = array('I')
+        self.costs = array('d')
+        # Las heurísticas del repo son enteras (y update_heuristic_astar_2 lo necesita); si h es float se guarda así
+        self.h = None if h is None else array('q' if isinstance(h, int) else 'd')
+        # lookup(code) devuelve el último nodo del estado o NO_NODE; se enlaza directamente al índice para que cada
+        # consulta sea una sola llamada
+        if states <= dense_limit:
+            self.index = np.full(states, NO_NODE, dtype=np.int32)
+            self.lookup = self.index.item
+        else:
+            self.index = {}
+            self.lookup = lambda code: self.index.get(code, NO_NODE)
+        self.reached = 0
+
+        self.root = self.add(initial.code, NO_NODE, 0, initial.accumulated_cost, h)
+
+    def add(self, code: int, parent: int, move: int, cost: float, h: float = None) -> int:
+        """
+        Agrega un nodo y lo registra como el nodo de su estado.
+
+        Args:
+            code (int): Código del estado.
+            parent (int): Nodo padre (NO_NODE para la raíz).
+            move (int): Movimiento desde el padre (ver `encode_move`).
+            cost (float): Costo acumulado g.
+            h (float, optional): Heurística, si el árbol las guarda.
+
+        Returns:
+            int: Índice del nodo nuevo.
+        """
+        node = len(self.codes)
+        self.codes.append(code)
+        self.parents.append(parent)
+        self.moves.append(move)
+        self.costs.append(cost)
+        if self.h is not None:
+            self.h.append(h)
+        if self.lookup(code) == NO_NODE:
+            self.reached += 1
+        self.index[code] = node
+        return node
+
+    def forget(self, node: int) -> None:
+        """
+        Olvida el estado del nodo (si sigue siendo el nodo de su estado), así se puede volver a alcanzar. El nodo se
+        conserva en los arreglos, porque puede ser padre de otros nodos.
+        """
+        code = self.codes[node]
+        if self.lookup(code) == node:
+            self.index[code] = NO_NODE
+            self.reached -= 1
+
+    def restore(self, node: int) -> None:
+        """
+        Vuelve a registrar un nodo olvidado como el nodo de su estado, si el estado no fue alcanzado de nuevo.
+        """
+        code = self.codes[node]
+        if self.lookup(code) == NO_NODE:
+            self.index[code] = node
+            self.reached += 1
+
+    def __contains__(self, code: int) -> bool:
+        return self.lookup(code) != NO_NODE
+
+    def __len__(self) -> int:
+        """
+        Cantidad de estados distintos alcanzados.
+        """
+        return self.reached
+
+    def encode_move(self, action: hanoi_states.ActionHanoi) -> int:
+        """
+        Codifica una acción como un único entero.
+        """
+        return (action.disk * self.number_of_pegs + action.rod_input) * self.number_of_pegs + action.rod_out
+
+    def action(self, node: int) -> hanoi_states.ActionHanoi:
+        """
+        Acción que generó el nodo.
+        """
+        move, rod_out = divmod(self.moves[node], self.number_of_pegs)
+        disk, rod_input = divmod(move, self.number_of_pegs)
+        return hanoi_states.ActionHanoi(disk, rod_input, rod_out)
+
+    def state(self, node: int) -> hanoi_states.StatesHanoi:
+        """
+        Reconstruye el estado del nodo, con su costo acumulado.
+        """
+        return hanoi_states.StatesHanoi.from_code(self.codes[node], self.number_of_disks, cost=self.costs[node],
+                                                  number_of_pegs=self.number_of_pegs)
+
+    def solution(self, node: int) -> tree_hanoi.NodeHanoi:
+        """
+        Convierte el camino de la raíz al nodo en una cadena de NodeHanoi, igual a la que arman las búsquedas que
+        trabajan con nodos (para exportar al simulador, Metrics, etc.).
+
+        Returns:
+            tree_hanoi.NodeHanoi: Nodo final del camino.
+        """
+        actions = []
+        while self.parents[node] != NO_NODE:
+            actions.append(self.action(node))
+            node = self.parents[node]
+
+        solution = tree_hanoi.NodeHanoi(self.state(node))
+        for action in reversed(actions):
+            solution = tree_hanoi.NodeHanoi(action.execute(solution.state), parent=solution, action=action)
+        return solution
+
+    def nbytes(self) -> int:
+        """
+        Memoria ocupada por los arreglos (sin contar el diccionario del índice, si no es denso).
+        """
+        arrays = [self.codes, self.parents, self.moves, self.costs] + ([self.h] if self.h is not None else [])
+        total = sum(len(values) * values.itemsize for values in arrays)
+        return total + (self.index.nbytes if isinstance(self.index, np.ndarray) else 0)
+
+
+class StoredNode:
+    """
+    Referencia liviana a un nodo de un NodeStore, para las fronteras con prioridad (aima.PriorityQueue).
+
+    Se compara igual que un NodeHanoi: dos referencias son iguales si tienen el mismo estado (así la frontera tiene
+    una sola entrada por estado y se puede buscar o borrar la de un estado) y se ordenan por costo acumulado, que es
+    el desempate entre nodos con la misma prioridad. Solo existen mientras el nodo está en la frontera.
+    """
+
+    __slots__ = ('node', 'code', 'cost')
+
+    def __init__(self, node: int, code: int, cost: float):
+        self.node = node
+        self.code = code
+        self.cost = cost
+
+    def __eq__(self, other):
+        return self.code == other.code
+
+    def __hash__(self):
+        return self.code
+
+    def __lt__(self, other):
+        return self.cost < other.cost
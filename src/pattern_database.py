@@ -0,0 +1,139 @@
+from typing import Callable
+
+import numpy as np
+
+from src import hanoi_states
+from src.lookup_tables import load_or_build_table
+from src.state_space import breadth_first_distances
+
+
+# Se incrementa cada vez que cambia la forma de construir o guardar las tablas, así no se cargan tablas viejas
+PATTERN_DATABASE_VERSION = 2
+
+# Con más varillas cada tabla crece como k^size; por defecto se usa el mayor patrón que no supera una tabla de
+# 3 varillas y 12 discos (3^12 distancias, 1 MB)
+MAX_TABLE_ENTRIES = 3 ** 12
+
+
+def default_pattern_size(pegs: int) -> int:
+    """
+    Mayor tamaño de patrón cuya tabla no supera MAX_TABLE_ENTRIES distancias (12 discos con 3 varillas, 9 con 4 y 8
+    con 5).
+    """
+    size = 1
+    while pegs ** (size + 1) <= MAX_TABLE_ENTRIES:
+        size += 1
+    return size
+
+
+class PatternDatabase:
+    """
+    Tabla con la distancia exacta al objetivo de un grupo contiguo de discos (de `first_disk` a `last_disk`),
+    ignorando al resto.
+
+    Ignorar discos solo relaja el problema (los discos más chicos no bloquean a los más grandes y los más grandes
+    nunca impiden mover uno más chico), así que la distancia del patrón nunca supera a la real. Como cada
+    movimiento mueve un único disco, las tablas de grupos disjuntos además se pueden sumar.
+    """
+
+    def __init__(self, goal: hanoi_states.StatesHanoi, first_disk: int, last_disk: int,
+                 directory: str = None, persist: bool = True):
+        """
+        Inicializa la tabla, abriéndola de disco (como np.memmap de solo lectura) si ya fue calculada y
+        construyéndola en caso contrario.
+
+        Args:
+            goal (hanoi_states.StatesHanoi): Estado objetivo del problema.
+            first_disk (int): Disco más chico del patrón.
+            last_disk (int): Disco más grande del patrón.
+            directory (str): Carpeta donde se guardan las tablas (ver `lookup_tables.table_path`).
+            persist (bool): Indica si la tabla se lee y se guarda en disco.
+        """
+        if not 1 <= first_disk <= last_disk <= goal.number_of_disks:
+            raise ValueError('Rango de discos incorrecto')
+
+        self.first_disk = first_disk
+        self.size = last_disk - first_disk + 1
+        self.pegs = goal.number_of_pegs
+        self.offset = self.pegs ** (first_disk - 1)
+        self.modulo = self.pegs ** self.size
+        self.goal_code = self.pattern_code(goal)
+
+        self.distances = load_or_build_table(self.table_name(), np.uint16,
+                                             lambda: breadth_first_distances(self.size, self.goal_code, self.pegs),
+                                             directory=directory, persist=persist)
+
+    def table_name(self) -> str:
+        """
+        Nombre de la tabla. Solo depende de la cantidad de varillas, del tamaño del patrón y de su objetivo, así que
+        la misma tabla sirve para cualquier cantidad total de discos.
+        """
+        return f"pdb_v{PATTERN_DATABASE_VERSION}_pegs{self.pegs}_size{self.size}_goal{self.goal_code}"
+
+    def pattern_code(self, state: hanoi_states.StatesHanoi) -> int:
+        """
+        Extrae del código del estado los dígitos correspondientes a los discos del patrón.
+        """
+        return (state.code // self.offset) % self.modulo
+
+    def distance(self, state: hanoi_states.StatesHanoi) -> int:
+        """
+        Distancia exacta al objetivo de los discos del patrón en el estado dado.
+        """
+        return int(self.distances[(state.code // self.offset) % self.modulo])
+
+
+def build_pattern_databases(goal: hanoi_states.StatesHanoi, max_pattern_size: int = None, **kwargs) -> list:
+    """
+    Particiona los discos en grupos contiguos de a lo sumo `max_pattern_size`, empezando por los más grandes, y
+    construye una tabla por grupo.
+
+    Args:
+        goal (hanoi_states.StatesHanoi): Estado objetivo del problema.
+        max_pattern_size (int): Tamaño máximo de cada patrón (la tabla ocupa 2 * k^size bytes). Por defecto
+            `default_pattern_size`.
+        **kwargs: Argumentos adicionales para `PatternDatabase`.
+
+    Returns:
+        list: Lista de PatternDatabase, una por grupo de discos.
+    """
+    max_pattern_size = max_pattern_size or default_pattern_size(goal.number_of_pegs)
+    databases = []
+    last_disk = goal.number_of_disks
+    while last_disk > 0:
+        first_disk = max(1, last_disk - max_pattern_size + 1)
+        databases.append(PatternDatabase(goal, first_disk, last_disk, **kwargs))
+        last_disk = first_disk - 1
+    return databases
+
+
+# Heurísticas ya construidas, por objetivo y parámetros, para no volver a cargar las tablas en cada búsqueda
+_heuristics_cache = {}
+
+
+def pattern_database_heuristic(goal: hanoi_states.StatesHanoi, max_pattern_size: int = None, **kwargs) -> Callable:
+    """
+    Construye una heurística admisible que suma las distancias exactas de cada grupo disjunto de discos.
+
+    La heurística se construye una sola vez por objetivo y parámetros; las llamadas siguientes devuelven la misma
+    función, así que conviene llamarla antes de medir una búsqueda.
+
+    Args:
+        goal (hanoi_states.StatesHanoi): Estado objetivo del problema.
+        max_pattern_size (int): Tamaño máximo de cada patrón. Por defecto `default_pattern_size`.
+        **kwargs: Argumentos adicionales para `PatternDatabase`.
+
+    Returns:
+        Callable: Función heuristic_func(state) lista para usar con `astar_search`.
+    """
+    key = (goal.number_of_disks, goal.number_of_pegs, goal.code, max_pattern_size, tuple(sorted(kwargs.items())))
+    if key not in _heuristics_cache:
+        databases = build_pattern_databases(goal, max_pattern_size, **kwargs)
+
+        def heuristic_func_pattern_database(nodeState: hanoi_states.StatesHanoi) -> int:
+            return sum(database.distance(nodeState) for database in databases)
+
+        # ara_star_search solo calcula la cota de suboptimalidad con heurísticas admisibles
+        heuristic_func_pattern_database.admissible = True
+        _heuristics_cache[key] = heuristic_func_pattern_database
+    return _heuristics_cache[key]
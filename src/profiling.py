@@ -0,0 +1,238 @@
+import sys
+import time
+from collections import deque
+from typing import Callable
+
+from src import hanoi_states
+
+try:
+    import psutil
+except ImportError:  # psutil es opcional, sin él se informa el pico de memoria residente
+    psutil = None
+
+try:
+    import resource
+except ImportError:  # No existe en Windows
+    resource = None
+
+
+class SearchProfile:
+    """
+    Contadores y tiempos acumulados de las fases de una búsqueda: generación de acciones, ejecución de acciones,
+    evaluación de la heurística y operaciones sobre la frontera.
+
+    Las búsquedas de src/search.py reciben un SearchProfile opcional. Si no se pasa, no se instrumenta nada y el
+    lazo de búsqueda es exactamente el mismo; si se pasa, el problema, la heurística y la frontera se envuelven
+    antes de empezar, así que cada llamada medida suma el costo de dos perf_counter (los tiempos totales medidos con
+    perfil activo son mayores que sin él).
+    """
+
+    COUNTERS = ("expansions", "generated", "pushes", "pops", "heuristic_calls", "heuristic_updates")
+    TIMERS = ("actions", "execute", "heuristic", "frontier")
+
+    def __init__(self):
+        self.counters = dict.fromkeys(self.COUNTERS, 0)
+        self.timers = dict.fromkeys(self.TIMERS, 0.0)
+        self.frontier_profiled = False
+        # Caches de heurística (HeuristicCache) de la búsqueda, para informar sus aciertos
+        self.caches = []
+
+    def timed(self, func: Callable, timer: str, counter: str) -> Callable:
+        """
+        Envuelve una función para sumar su tiempo en `timer` y contar sus llamadas en `counter`.
+        """
+        counters, timers = self.counters, self.timers
+        perf_counter = time.perf_counter
+
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timers[timer] += perf_counter() - start
+                counters[counter] += 1
+
+        wrapper.__name__ = getattr(func, '__name__', wrapper.__name__)
+        return wrapper
+
+    def problem(self, problem: hanoi_states.ProblemHanoi) -> "ProfiledProblem":
+        """
+        Envuelve el problema: cada llamada a actions es una expansión y cada llamada a result un hijo generado.
+
+        ProblemHanoi.actions es un generador, así que se consume dentro de la medición; si no, actions_time solo
+        mediría la creación del generador y el costo de generar las acciones quedaría repartido en el lazo.
+        """
+        actions = problem.actions
+
+        def listed_actions(state):
+            return list(actions(state))
+
+        listed_actions.__name__ = getattr(actions, '__name__', listed_actions.__name__)
+        return ProfiledProblem(problem, actions=self.timed(listed_actions, "actions", "expansions"),
+                               result=self.timed(problem.result, "execute", "generated"))
+
+    def heuristic(self, heuristic_func: Callable) -> Callable:
+        """
+        Envuelve la heurística para contar y medir sus evaluaciones.
+        """
+        return self.timed(heuristic_func, "heuristic", "heuristic_calls")
+
+    def frontier(self, frontier):
+        """
+        Instrumenta una frontera (aima.PriorityQueue o deque) ya inicializada con su nodo raíz, así los pushes
+        contados son solo los de hijos y `generated - pushes` son los hijos descartados por estar ya alcanzados.
+
+        Returns:
+            La misma PriorityQueue con append y pop envueltos, o una copia de la deque que mide append y popleft.
+        """
+        self.frontier_profiled = True
+        if isinstance(frontier, deque):
+            return _ProfiledDeque(frontier, self)
+        frontier.append = self.timed(frontier.append, "frontier", "pushes")
+        frontier.pop = self.timed(frontier.pop, "frontier", "pops")
+        return frontier
+
+    def as_dict(self) -> dict:
+        """
+        Contadores, tiempos en segundos y, si se instrumentó la frontera, los hijos duplicados. Con cache de
+        heurística, heuristic_calls son solo las evaluaciones reales y heuristic_cache_hits las que se evitaron.
+        """
+        result = dict(self.counters)
+        if self.frontier_profiled:
+            result["duplicates"] = self.counters["generated"] - self.counters["pushes"]
+        if self.caches:
+            result["heuristic_cache_hits"] = sum(cache.hits for cache in self.caches)
+        result.update({f"{timer}_time": round(value, 6) for timer, value in self.timers.items()})
+        return result
+
+    def report(self) -> str:
+        """
+        Resumen de una línea para imprimir por consola.
+        """
+        return ", ".join(f"{key}: {value}" for key, value in self.as_dict().items())
+
+
+class ProfiledProblem:
+    """
+    Problema que delega en otro, reemplazando actions y/o result por versiones instrumentadas.
+    """
+
+    def __init__(self, problem: hanoi_states.ProblemHanoi, actions: Callable = None, result: Callable = None):
+        self.problem = problem
+        if actions is not None:
+            self.actions = actions
+        if result is not None:
+            self.result = result
+
+    def __getattr__(self, name):
+        return getattr(self.problem, name)
+
+
+class _ProfiledDeque(deque):
+    """
+    Deque que mide append y popleft, usada como frontera de las búsquedas en anchura.
+    """
+
+    def __init__(self, items, profile: SearchProfile):
+        super().__init__(items)
+        self.append = profile.timed(super().append, "frontier", "pushes")
+        self.popleft = profile.timed(super().popleft, "frontier", "pops")
+
+
+def resident_memory_mb() -> float:
+    """
+    Memoria residente del proceso en MB. Sin psutil se usa el pico (ru_maxrss), que nunca baja, y None si tampoco
+    está el módulo resource.
+    """
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss está en KB en Linux y en bytes en macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class SearchProgress:
+    """
+    Emite el avance de una búsqueda cada `every` expansiones, llamando a `callback` con un diccionario:
+
+    - expanded: nodos expandidos hasta el momento.
+    - elapsed: segundos desde el inicio de la búsqueda.
+    - nodes_per_second: expansiones por segundo desde el evento anterior, para ver cómo cae el ritmo a medida que
+      crece la frontera.
+    - frontier: nodos en la(s) frontera(s).
+    - reached: estados alcanzados.
+    - best_f: prioridad del próximo nodo a extraer (None si la frontera no es una cola de prioridad).
+    - rss_mb: memoria residente del proceso (ver `resident_memory_mb`).
+
+    Igual que SearchProfile, solo se engancha al problema cuando se pasa a una búsqueda, así que sin progreso el
+    lazo de búsqueda no cambia. Las búsquedas registran sus fronteras y estados alcanzados con `watch`.
+    """
+
+    def __init__(self, callback: Callable[[dict], None], every: int = 1000):
+        self.callback = callback
+        self.every = every
+        self.expanded = 0
+        self.frontiers = ()
+        self.reached = ()
+        self.start_time = time.perf_counter()
+        self.last_time = self.start_time
+        self.last_expanded = 0
+        self.events = []
+
+    def problem(self, problem: hanoi_states.ProblemHanoi) -> ProfiledProblem:
+        """
+        Envuelve el problema para contar cada llamada a actions como una expansión.
+        """
+        actions = problem.actions
+
+        def counted_actions(state):
+            self.expanded += 1
+            if self.expanded % self.every == 0:
+                self.emit()
+            return actions(state)
+
+        self.start_time = self.last_time = time.perf_counter()
+        return ProfiledProblem(problem, actions=counted_actions)
+
+    def watch(self, frontiers: tuple, reached: tuple) -> None:
+        """
+        Registra las fronteras y los conjuntos de estados alcanzados cuyos tamaños se informan.
+        """
+        self.frontiers = frontiers
+        self.reached = reached
+
+    def emit(self) -> dict:
+        """
+        Arma el evento con el estado actual, lo guarda en `events` y llama al callback.
+        """
+        now = time.perf_counter()
+        interval = now - self.last_time
+        priorities = [frontier.top_priority() for frontier in self.frontiers if hasattr(frontier, "top_priority")]
+        priorities = [priority for priority in priorities if priority is not None]
+        event = {
+            "expanded": self.expanded,
+            "elapsed": now - self.start_time,
+            "nodes_per_second": (self.expanded - self.last_expanded) / interval if interval > 0 else 0.0,
+            "frontier": sum(len(frontier) for frontier in self.frontiers),
+            "reached": sum(len(reached) for reached in self.reached),
+            "best_f": min(priorities) if priorities else None,
+            "rss_mb": resident_memory_mb(),
+        }
+        self.last_time = now
+        self.last_expanded = self.expanded
+        self.events.append(event)
+        self.callback(event)
+        return event
+
+
+def print_progress(event: dict) -> None:
+    """
+    Callback de SearchProgress que reescribe una única línea de la consola con el avance.
+    """
+    best_f = "-" if event["best_f"] is None else f"{event['best_f']:g}"
+    rss = "-" if event["rss_mb"] is None else f"{event['rss_mb']:.1f}"
+    print(f"\r{event['expanded']} expandidos | {event['nodes_per_second']:.0f} nodos/s | "
+          f"frontera {event['frontier']} | alcanzados {event['reached']} | mejor f {best_f} | "
+          f"{rss} MB | {event['elapsed']:.1f} s", end="", flush=True)
@@ -0,0 +1,291 @@
+from functools import lru_cache
+from typing import Iterator
+
+from src import hanoi_states
+
+
+def _disk_positions(state: hanoi_states.StatesHanoi) -> list:
+    """
+    Obtiene la varilla en la que está cada disco.
+
+    Args:
+        state (hanoi_states.StatesHanoi): Estado de la Torre de Hanoi.
+
+    Returns:
+        list: Lista donde el índice d tiene la varilla del disco d (el índice 0 no se usa).
+    """
+    positions = [0] * (state.number_of_disks + 1)
+    for rod_index, rod in enumerate(state.rods):
+        for disk in rod:
+            positions[disk] = rod_index
+    return positions
+
+
+def _tower_moves(disks: int, rod_input: int, rod_out: int) -> Iterator[tuple]:
+    """
+    Genera los movimientos óptimos para llevar una torre completa de discos 1..disks de una varilla a otra.
+
+    Usa una pila explícita en lugar de recursión, por lo que no tiene límite de profundidad. La pila nunca supera los
+    `disks` elementos pendientes.
+
+    Args:
+        disks (int): Cantidad de discos de la torre.
+        rod_input (int): Varilla de origen.
+        rod_out (int): Varilla de destino.
+
+    Yields:
+        tuple: (disco, varilla de origen, varilla de destino) de cada movimiento.
+    """
+    stack = [(False, disks, rod_input, rod_out)]
+    while stack:
+        is_move, disk, rod_from, rod_to = stack.pop()
+        if is_move:
+            yield disk, rod_from, rod_to
+            continue
+        if disk == 0:
+            continue
+        aux = 3 - rod_from - rod_to
+        # Se apila en orden inverso: torre superior a aux, disco más grande, torre superior a destino
+        stack.append((False, disk - 1, aux, rod_to))
+        stack.append((True, disk, rod_from, rod_to))
+        stack.append((False, disk - 1, rod_from, aux))
+
+
+def _pivots(positions: list, disks: int, rod_target: int) -> list:
+    """
+    Calcula, de mayor a menor, los discos que hay que mover para juntar los discos 1..disks en `rod_target`.
+
+    Args:
+        positions (list): Varilla de cada disco (ver `_disk_positions`).
+        disks (int): Cantidad de discos a considerar.
+        rod_target (int): Varilla en la que se quiere la torre.
+
+    Returns:
+        list: Tuplas (disco, varilla actual, varilla destino) de cada disco que debe moverse.
+    """
+    pivots = []
+    for disk in range(disks, 0, -1):
+        if positions[disk] != rod_target:
+            pivots.append((disk, positions[disk], rod_target))
+            rod_target = 3 - positions[disk] - rod_target
+    return pivots
+
+
+def _cost_to_tower(positions: list, disks: int, rod_target: int) -> int:
+    """
+    Calcula la cantidad mínima de movimientos para juntar los discos 1..disks en `rod_target`.
+    """
+    return sum(2 ** (disk - 1) for disk, _, _ in _pivots(positions, disks, rod_target))
+
+
+def _moves_to_tower(positions: list, disks: int, rod_target: int) -> Iterator[tuple]:
+    """
+    Genera los movimientos óptimos para juntar los discos 1..disks, en cualquier ubicación válida, en `rod_target`.
+    """
+    for disk, rod_from, rod_to in reversed(_pivots(positions, disks, rod_target)):
+        yield disk, rod_from, rod_to
+        yield from _tower_moves(disk - 1, 3 - rod_from - rod_to, rod_to)
+
+
+def _moves_from_tower(positions: list, disks: int, rod_source: int) -> Iterator[tuple]:
+    """
+    Genera los movimientos óptimos para llevar una torre de discos 1..disks en `rod_source` hasta la ubicación
+    `positions`. Es la secuencia de `_moves_to_tower` recorrida al revés.
+    """
+    for disk, rod_goal, rod_from in _pivots(positions, disks, rod_source):
+        aux = 3 - rod_goal - rod_from
+        yield from _tower_moves(disk - 1, rod_from, aux)
+        yield disk, rod_from, rod_goal
+
+
+def _plan(initial_positions: list, goal_positions: list, disks: int):
+    """
+    Elige la mejor forma de mover el disco más grande que no está en su lugar.
+
+    El disco más grande que difiere se mueve una vez (pasando los menores por la varilla auxiliar) o dos veces
+    (pasándolo por la auxiliar); cualquier otra estrategia no es óptima.
+
+    Returns:
+        tuple: (disco, varilla origen, varilla destino, se mueve dos veces, costo), o None si los estados son iguales.
+    """
+    for disk in range(disks, 0, -1):
+        rod_from, rod_to = initial_positions[disk], goal_positions[disk]
+        if rod_from == rod_to:
+            continue
+        aux = 3 - rod_from - rod_to
+        cost_direct = (_cost_to_tower(initial_positions, disk - 1, aux) + 1 +
+                       _cost_to_tower(goal_positions, disk - 1, aux))
+        cost_twice = (_cost_to_tower(initial_positions, disk - 1, rod_to) + 1 + (2 ** (disk - 1) - 1) + 1 +
+                      _cost_to_tower(goal_positions, disk - 1, rod_from))
+        if cost_twice < cost_direct:
+            return disk, rod_from, rod_to, True, cost_twice
+        return disk, rod_from, rod_to, False, cost_direct
+    return None
+
+
+def optimal_cost(initial: hanoi_states.StatesHanoi, goal: hanoi_states.StatesHanoi) -> int:
+    """
+    Calcula la cantidad mínima de movimientos entre dos estados de 3 varillas sin hacer ninguna búsqueda.
+
+    Para el problema estándar (todos los discos de una varilla a otra) es 2^n - 1.
+
+    Args:
+        initial (hanoi_states.StatesHanoi): Estado inicial.
+        goal (hanoi_states.StatesHanoi): Estado objetivo.
+
+    Returns:
+        int: Cantidad mínima de movimientos.
+    """
+    plan = _plan(_disk_positions(initial), _disk_positions(goal), initial.number_of_disks)
+    return 0 if plan is None else plan[-1]
+
+
+def recursive_optimal_solver(disks: int, rod_input: int = 0, rod_out: int = 2) -> Iterator[hanoi_states.ActionHanoi]:
+    """
+    Genera la solución clásica de la Torre de Hanoi (todos los discos de una varilla a otra), un movimiento a la vez.
+
+    Es la solución recursiva conocida pero implementada con una pila explícita, así que no tiene límite de recursión
+    y no construye ningún estado ni nodo.
+
+    Args:
+        disks (int): Cantidad de discos.
+        rod_input (int): Varilla donde empieza la torre.
+        rod_out (int): Varilla donde debe terminar la torre.
+
+    Yields:
+        hanoi_states.ActionHanoi: Cada una de las 2^n - 1 acciones de la solución óptima.
+    """
+    for disk, rod_from, rod_to in _tower_moves(disks, rod_input, rod_out):
+        yield hanoi_states.ActionHanoi(disk, rod_from, rod_to)
+
+
+def general_optimal_solver(initial: hanoi_states.StatesHanoi,
+                           goal: hanoi_states.StatesHanoi) -> Iterator[hanoi_states.ActionHanoi]:
+    """
+    Genera una solución óptima entre dos estados cualesquiera de 3 varillas, un movimiento a la vez.
+
+    Los discos más grandes que ya están en su lugar no se tocan. Para el mayor disco que no lo está se elige entre
+    moverlo una o dos veces (ver `_plan`) y el resto se resuelve llevando los discos menores a una torre y desde una
+    torre, cada movimiento en tiempo O(n) como máximo.
+
+    Args:
+        initial (hanoi_states.StatesHanoi): Estado inicial.
+        goal (hanoi_states.StatesHanoi): Estado objetivo.
+
+    Yields:
+        hanoi_states.ActionHanoi: Cada acción de la solución óptima.
+    """
+    initial_positions = _disk_positions(initial)
+    goal_positions = _disk_positions(goal)
+    plan = _plan(initial_positions, goal_positions, initial.number_of_disks)
+    if plan is None:
+        return
+
+    disk, rod_from, rod_to, twice, _ = plan
+    aux = 3 - rod_from - rod_to
+    if twice:
+        moves = (
+            _moves_to_tower(initial_positions, disk - 1, rod_to),
+            [(disk, rod_from, aux)],
+            _tower_moves(disk - 1, rod_to, rod_from),
+            [(disk, aux, rod_to)],
+            _moves_from_tower(goal_positions, disk - 1, rod_from),
+        )
+    else:
+        moves = (
+            _moves_to_tower(initial_positions, disk - 1, aux),
+            [(disk, rod_from, rod_to)],
+            _moves_from_tower(goal_positions, disk - 1, aux),
+        )
+    for part in moves:
+        for move_disk, move_from, move_to in part:
+            yield hanoi_states.ActionHanoi(move_disk, move_from, move_to)
+
+
+@lru_cache(maxsize=None)
+def _frame_stewart_tables(disks: int, pegs: int) -> tuple:
+    """
+    Calcula, para cada cantidad de varillas 3..pegs y de discos 0..disks, el costo de Frame–Stewart y la cantidad de
+    discos superiores que conviene apartar.
+
+    Con k varillas se apartan los t discos superiores usando las k varillas, se llevan los n - t restantes al destino
+    con k - 1 varillas (la auxiliar queda ocupada) y se vuelven a poner los t encima:
+    FS(n, k) = min_t 2 * FS(t, k) + FS(n - t, k - 1), con FS(n, 3) = 2^n - 1. Se calcula de abajo hacia arriba, sin
+    recursión.
+
+    Returns:
+        tuple: (costs, splits), diccionarios varillas -> lista indexada por la cantidad de discos.
+    """
+    costs = {3: [2 ** n - 1 for n in range(disks + 1)]}
+    splits = {3: [max(n - 1, 0) for n in range(disks + 1)]}
+    for k in range(4, pegs + 1):
+        costs[k] = [0] * (disks + 1)
+        splits[k] = [0] * (disks + 1)
+        for n in range(1, disks + 1):
+            costs[k][n], splits[k][n] = min((2 * costs[k][t] + costs[k - 1][n - t], t) for t in range(n))
+    return costs, splits
+
+
+def frame_stewart_cost(disks: int, pegs: int) -> int:
+    """
+    Cantidad de movimientos de la solución de Frame–Stewart para llevar una torre de `disks` discos de una varilla a
+    otra con `pegs` varillas.
+
+    Con 3 varillas es 2^n - 1 y con 4 está demostrado que es óptima; con más varillas es la mejor solución conocida
+    (su optimalidad es una conjetura).
+
+    Args:
+        disks (int): Cantidad de discos.
+        pegs (int): Cantidad de varillas (al menos 3).
+
+    Returns:
+        int: Cantidad de movimientos.
+    """
+    if pegs < 3:
+        raise ValueError('Se necesitan al menos 3 varillas')
+    costs, _ = _frame_stewart_tables(disks, pegs)
+    return costs[pegs][disks]
+
+
+def frame_stewart_solver(disks: int, pegs: int, rod_input: int = 0,
+                         rod_out: int = None) -> Iterator[hanoi_states.ActionHanoi]:
+    """
+    Genera la solución de Frame–Stewart para llevar una torre completa de una varilla a otra con `pegs` varillas, un
+    movimiento a la vez (ver `frame_stewart_cost`).
+
+    Igual que `recursive_optimal_solver` usa una pila explícita: cada elemento es un rango de discos consecutivos que
+    hay que llevar de una varilla a otra usando solo un subconjunto de las varillas.
+
+    Args:
+        disks (int): Cantidad de discos.
+        pegs (int): Cantidad de varillas (al menos 3).
+        rod_input (int): Varilla donde empieza la torre.
+        rod_out (int): Varilla donde debe terminar la torre. Por defecto la última.
+
+    Yields:
+        hanoi_states.ActionHanoi: Cada acción de la solución.
+    """
+    if pegs < 3:
+        raise ValueError('Se necesitan al menos 3 varillas')
+    rod_out = pegs - 1 if rod_out is None else rod_out
+    if rod_input == rod_out:
+        return
+    _, splits = _frame_stewart_tables(disks, pegs)
+
+    # (disco más chico, disco más grande, varillas disponibles, varilla origen, varilla destino)
+    stack = [(1, disks, tuple(range(pegs)), rod_input, rod_out)]
+    while stack:
+        low, high, available, rod_from, rod_to = stack.pop()
+        count = high - low + 1
+        if count <= 0:
+            continue
+        if count == 1:
+            yield hanoi_states.ActionHanoi(high, rod_from, rod_to)
+            continue
+        top = splits[len(available)][count]
+        aux = next(rod for rod in available if rod != rod_from and rod != rod_to)
+        rest = tuple(rod for rod in available if rod != aux)
+        # Se apila en orden inverso: discos superiores a aux, el resto al destino sin aux, superiores al destino
+        stack.append((low, low + top - 1, available, aux, rod_to))
+        stack.append((low + top, high, rest, rod_from, rod_to))
+        stack.append((low, low + top - 1, available, rod_from, aux))
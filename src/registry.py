@@ -0,0 +1,151 @@
+import importlib
+from typing import Callable
+
+from src import hanoi_states
+from src import search
+from src.heuristics import heuristic_func_astar_1, heuristic_func_astar_2, heuristic_func_greedy
+from src.pattern_database import pattern_database_heuristic
+
+
+class SolverSpec:
+    """
+    Solver declarado como (estrategia, heurística, opciones): se llama como cualquier búsqueda de src/search.py,
+    solver(problem, display=False, profile=None, progress=None, budget=None), y le pasa a la estrategia la
+    heurística y las opciones.
+    """
+
+    def __init__(self, name: str, strategy: Callable, heuristic: Callable = None, heuristic_factory: Callable = None,
+                 options: dict = None, budget: dict = None, sweep: bool = True):
+        """
+        Args:
+            name (str): Nombre con el que se lo elige desde la línea de comandos y se lo registra en Metrics.
+            strategy (Callable): Búsqueda de src/search.py (o con su misma firma).
+            heuristic (Callable, optional): Heurística h(state) que recibe la estrategia como heuristic_func.
+            heuristic_factory (Callable, optional): En lugar de `heuristic`, función factory(problem) que construye
+                la heurística para cada problema (por ejemplo las pattern databases, que dependen del objetivo).
+            options (dict, optional): Argumentos adicionales de la estrategia (por ejemplo order).
+            budget (dict, optional): Límites propios del solver para SearchBudget (ver src/budget.py).
+            sweep (bool): Indica si el solver corre en los barridos por defecto de main.py.
+        """
+        if heuristic is not None and heuristic_factory is not None:
+            raise ValueError('Se indica heuristic o heuristic_factory, no ambas')
+        self.name = self.__name__ = name
+        self.strategy = strategy
+        self.heuristic = heuristic
+        self.heuristic_factory = heuristic_factory
+        self.options = dict(options or {})
+        self.budget = dict(budget or {})
+        self.sweep = sweep
+
+    def prepare(self, problem: hanoi_states.ProblemHanoi) -> Callable:
+        """
+        Heurística del solver para el problema (None si no usa). Las que se construyen por problema quedan en su
+        cache, así que conviene llamarla antes de medir una búsqueda.
+        """
+        if self.heuristic_factory is not None:
+            return self.heuristic_factory(problem)
+        return self.heuristic
+
+    def __call__(self, problem: hanoi_states.ProblemHanoi, display: bool = False, profile=None, progress=None,
+                 budget=None):
+        kwargs = dict(self.options)
+        heuristic_func = self.prepare(problem)
+        if heuristic_func is not None:
+            kwargs["heuristic_func"] = heuristic_func
+        return self.strategy(problem, display=display, profile=profile, progress=progress, budget=budget, **kwargs)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.name}: {getattr(self.strategy, '__name__', self.strategy)}>"
+
+
+# Solvers registrados por nombre, en el orden en que corren los barridos
+SOLVERS = {}
+
+
+def register(name: str, strategy: Callable, **kwargs) -> SolverSpec:
+    """
+    Registra un solver (ver SolverSpec). Un módulo propio puede registrar estrategias nuevas al importarse y
+    elegirlas por nombre desde main.py con --solvers-module, sin modificar main.py.
+
+    Returns:
+        SolverSpec: El solver registrado.
+    """
+    if name in SOLVERS:
+        raise ValueError(f'Ya hay un solver registrado como {name}')
+    SOLVERS[name] = SolverSpec(name, strategy, **kwargs)
+    return SOLVERS[name]
+
+
+def get_solver(name: str) -> SolverSpec:
+    """
+    Busca un solver por nombre.
+
+    Raises:
+        ValueError: Si no hay un solver con ese nombre.
+    """
+    if name not in SOLVERS:
+        raise ValueError(f'No hay un solver llamado {name}. Disponibles: {", ".join(SOLVERS)}')
+    return SOLVERS[name]
+
+
+def sweep_solvers(names: list = None) -> dict:
+    """
+    Solvers a correr en un barrido: los indicados por nombre, en ese orden, o todos los que tienen sweep.
+
+    Returns:
+        dict: Diccionario nombre -> SolverSpec.
+    """
+    if names:
+        return {name: get_solver(name) for name in names}
+    return {name: spec for name, spec in SOLVERS.items() if spec.sweep}
+
+
+def load_solver_modules(modules: list) -> None:
+    """
+    Importa módulos que registran solvers propios (ver `register`).
+    """
+    for module in modules:
+        importlib.import_module(module)
+
+
+# La búsqueda en árbol no recuerda estados visitados y no termina en tiempos razonables desde 5 discos
+register('breadth_first_tree_search', search.breadth_first_tree_search, sweep=False)
+register('breadth_first_graph_search', search.breadth_first_graph_search)
+register('astar_search_heuristic1', search.astar_search, heuristic=heuristic_func_astar_1)
+register('astar_search_heuristic2', search.astar_search, heuristic=heuristic_func_astar_2)
+# heuristic_func_greedy mide cuánto se avanzó (mayor es mejor), así que se extrae primero el de mayor prioridad
+register('astar_search_heuristic3', search.astar_search, heuristic=heuristic_func_greedy, options={'order': 'max'})
+register('greedy_search_heuristic1', search.greedy_search, heuristic=heuristic_func_astar_1)
+register('greedy_search_heuristic2', search.greedy_search, heuristic=heuristic_func_astar_2)
+register('greedy_search_heuristic3', search.greedy_search, heuristic=heuristic_func_greedy, options={'order': 'max'})
+# IDA* reexpande nodos en cada iteración y con la heurística 1 no termina en tiempos razonables desde 7 discos
+register('ida_star_search_heuristic1', search.ida_star_search, heuristic=heuristic_func_astar_1,
+         budget={'max_expansions': 2_000_000})
+register('ida_star_search_heuristic2', search.ida_star_search, heuristic=heuristic_func_astar_2,
+         budget={'max_expansions': 2_000_000})
+register('bidirectional_breadth_first_search', search.bidirectional_breadth_first_search)
+register('bidirectional_astar_search_heuristic1', search.bidirectional_astar_search, heuristic=heuristic_func_astar_1)
+register('bidirectional_astar_search_heuristic2', search.bidirectional_astar_search, heuristic=heuristic_func_astar_2)
+register('recursive_optimal_search', search.recursive_optimal_search)
+# La heurística se construye una vez por objetivo (ver pattern_database_heuristic)
+register('astar_search_pattern_database', search.astar_search,
+         heuristic_factory=lambda problem: pattern_database_heuristic(problem.goal))
+# A* ponderado (f = g + 2h, costo a lo sumo el doble del óptimo) y ARA*, que mejora la solución bajando el peso de 3
+# a 1 y con presupuesto devuelve la mejor encontrada hasta el corte. Las garantías valen con una heurística
+# admisible, así que se registran solo con las pattern databases
+register('weighted_astar_search_pattern_database', search.astar_search,
+         heuristic_factory=lambda problem: pattern_database_heuristic(problem.goal), options={'weight': 2})
+register('ara_star_search_pattern_database', search.ara_star_search,
+         heuristic_factory=lambda problem: pattern_database_heuristic(problem.goal))
+# Memoria acotada por consulta a costa de la optimalidad: beam search guarda a lo sumo beam_width nodos por
+# profundidad, y A*/greedy con max_frontier podan la frontera al estilo SMA*. Con un límite muy por debajo de la
+# frontera que necesita la búsqueda se reexpanden los mismos estados una y otra vez (A* con la heurística 1 no termina
+# así desde 4 varillas), por eso el máximo de expansiones
+register('beam_search_heuristic2', search.beam_search, heuristic=heuristic_func_astar_2, options={'beam_width': 256})
+register('beam_search_pattern_database', search.beam_search,
+         heuristic_factory=lambda problem: pattern_database_heuristic(problem.goal), options={'beam_width': 64})
+register('bounded_astar_search_pattern_database', search.astar_search,
+         heuristic_factory=lambda problem: pattern_database_heuristic(problem.goal), options={'max_frontier': 1024},
+         budget={'max_expansions': 2_000_000})
+register('bounded_greedy_search_heuristic2', search.greedy_search, heuristic=heuristic_func_astar_2,
+         options={'max_frontier': 256}, budget={'max_expansions': 2_000_000})
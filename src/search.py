@@ -1,13 +1,21 @@
+import heapq
+import time
 from typing import Callable
 from collections import deque
 from src import aima
 from src import tree_hanoi
 from src import hanoi_states
-from src.heuristics import heuristic_func_astar_1, heuristic_func_astar_2, heuristic_func_greedy
+from src.heuristics import HeuristicCache
+from src.recursive_solver import general_optimal_solver, frame_stewart_solver
+from src.profiling import SearchProfile, SearchProgress
+from src.node_store import NodeStore, StoredNode, NO_NODE
+from src.budget import SearchBudget, BudgetStop, budgeted
 
 
-
-def breadth_first_tree_search(problem: hanoi_states.ProblemHanoi, display: bool = False):
+@budgeted
+def breadth_first_tree_search(problem: hanoi_states.ProblemHanoi, display: bool = False,
+                              profile: SearchProfile = None, progress: SearchProgress = None,
+                              budget: SearchBudget = None):
     """
     Realiza una búsqueda en anchura para encontrar una solución a un problema de Hanoi.
     Esta función no chequea si un estado se visito, por lo que puede entrar en Loop infinitos muy fácilmente. No
@@ -15,11 +23,28 @@ def breadth_first_tree_search(problem: hanoi_states.ProblemHanoi, display: bool
 
     Parameters:
         problem (hanoi_states.ProblemHanoi): El problema de la Torre de Hanoi a resolver.
+        display (bool, optional): Se acepta para que todas las búsquedas tengan la misma firma.
+        profile (SearchProfile, optional): Si se pasa, cuenta y mide las expansiones y los hijos generados (la
+                                           frontera no se instrumenta).
+        progress (SearchProgress, optional): Si se pasa, informa el avance cada cierta cantidad de expansiones.
+        budget (SearchBudget, optional): Si se pasa, corta la búsqueda al superar un límite de tiempo, expansiones
+                                         o memoria y devuelve un BudgetExceeded (ver src/budget.py).
 
     Returns:
         tree_hanoi.NodeHanoi: El nodo que contiene la solución encontrada.
     """
+    if profile is not None:
+        problem = profile.problem(problem)
+    if progress is not None:
+        problem = progress.problem(problem)
+    if budget is not None:
+        problem = budget.problem(problem)
+
     frontier = deque([tree_hanoi.NodeHanoi(problem.initial)])  # Creamos una cola FIFO con el nodo inicial
+    if progress is not None:
+        progress.watch((frontier,), ())
+    if budget is not None:
+        budget.watch((frontier,), ())
     while frontier:
         node = frontier.popleft()  # Extraemos el primer nodo de la cola
         if problem.goal_test(node.state):  # Comprobamos si hemos alcanzado el estado objetivo
@@ -28,7 +53,11 @@ def breadth_first_tree_search(problem: hanoi_states.ProblemHanoi, display: bool
 
     return None
 
-def breadth_first_graph_search(problem: hanoi_states.ProblemHanoi, display: bool = False):
+
+@budgeted
+def breadth_first_graph_search(problem: hanoi_states.ProblemHanoi, display: bool = False,
+                               profile: SearchProfile = None, progress: SearchProgress = None,
+                               budget: SearchBudget = None):
     """
     Realiza una búsqueda en anchura para encontrar una solución a un problema de Hanoi. Pero ahora si recuerda si ya
     paso por un estado e ignora seguir buscando en ese nodo para evitar recursividad.
@@ -37,168 +66,917 @@ def breadth_first_graph_search(problem: hanoi_states.ProblemHanoi, display: bool
         problem (hanoi_states.ProblemHanoi): El problema de la Torre de Hanoi a resolver.
         display (bool, optional): Muestra un mensaje de cuantos caminos se expandieron y cuantos quedaron sin expandir.
                                   Por defecto es False.
+        profile (SearchProfile, optional): Si se pasa, acumula contadores y tiempos por fase (ver src/profiling.py).
+        progress (SearchProgress, optional): Si se pasa, informa el avance cada cierta cantidad de expansiones.
+        budget (SearchBudget, optional): Si se pasa, corta la búsqueda al superar un límite de tiempo, expansiones
+                                         o memoria y devuelve un BudgetExceeded (ver src/budget.py).
 
     Returns:
         tree_hanoi.NodeHanoi: El nodo que contiene la solución encontrada.
     """
-
-    frontier = deque([tree_hanoi.NodeHanoi(problem.initial)])  # Creamos una cola FIFO con el nodo inicial
-
-    explored = set()  # Este set nos permite ver si ya exploramos un estado para evitar repetir indefinidamente
+    if profile is not None:
+        problem = profile.problem(problem)
+    if progress is not None:
+        problem = progress.problem(problem)
+    if budget is not None:
+        problem = budget.problem(problem)
+
+    # El árbol se guarda en arreglos (ver NodeStore) y la cola FIFO tiene solo los índices de los nodos. El índice
+    # del árbol marca los estados que ya están en la frontera o que ya fueron explorados: se marcan al generarse, así
+    # cada estado entra una sola vez en la cola y chequear si ya lo vimos es O(1) en vez de recorrer la frontera.
+    reached = NodeStore(problem.initial)
+    frontier = deque([reached.root])  # Creamos una cola FIFO con el nodo inicial
+    if profile is not None:
+        frontier = profile.frontier(frontier)
+    if progress is not None:
+        progress.watch((frontier,), (reached,))
+    if budget is not None:
+        budget.watch((frontier,), (reached,))
     while frontier:
         node = frontier.popleft()  # Extraemos el primer nodo de la cola
+        state = reached.state(node)
 
-        # Agregamos nodo al set. Esto evita guardar duplicados, porque set nunca tiene elementos repetidos, esto sirve
-        # porque heredamos el método __eq__ en tree_hanoi.NodeHanoi de aima.Node
-        explored.add(node.state)
-
-        if problem.goal_test(node.state):  # Comprobamos si hemos alcanzado el estado objetivo
+        if problem.goal_test(state):  # Comprobamos si hemos alcanzado el estado objetivo
+            # Los estados explorados son los alcanzados que ya salieron de la frontera
+            explored = len(reached) - len(frontier)
             if display:
-                print(len(explored), "caminos se expandieron y", len(frontier), "caminos quedaron en la frontera")
-            return (node, len(explored), len(frontier))
-        # Agregamos a la cola todos los nodos sucesores del nodo actual que no haya visitados
-        frontier.extend(child for child in node.expand(problem)
-                        if child.state not in explored and child not in frontier)
+                print(explored, "caminos se expandieron y", len(frontier), "caminos quedaron en la frontera")
+            return (reached.solution(node), explored, len(frontier))
+        # Agregamos a la cola todos los nodos sucesores del nodo actual que no hayan sido alcanzados
+        for action in problem.actions(state):
+            child = problem.result(state, action)
+            if child.code not in reached:
+                frontier.append(reached.add(child.code, node, reached.encode_move(action), child.accumulated_cost))
 
     return None
 
-def astar_search(problem: hanoi_states.ProblemHanoi, heuristic_func: Callable, display: bool = False):
+
+def _instrument_heuristic(heuristic_func: Callable, profile: SearchProfile, cache_size: int) -> tuple:
+    """
+    Wraps a heuristic with the profile timers and the LRU cache. Heuristics with an incremental form (children get
+    h from their parent's h in O(1)) are not cached, since their updates are already cheaper than a cache lookup.
+
+    Returns:
+        tuple: (heuristic_func, heuristic_update), where heuristic_update is the incremental form or None.
+    """
+    heuristic_update = getattr(heuristic_func, 'incremental', None)
+    if profile is not None:
+        heuristic_func = profile.heuristic(heuristic_func)
+        if heuristic_update is not None:
+            heuristic_update = profile.timed(heuristic_update, "heuristic", "heuristic_updates")
+    if cache_size and heuristic_update is None:
+        heuristic_func = HeuristicCache(heuristic_func, cache_size)
+        if profile is not None:
+            profile.caches.append(heuristic_func)
+    return heuristic_func, heuristic_update
+
+
+def _instrument(problem: hanoi_states.ProblemHanoi, heuristic_func: Callable, profile: SearchProfile,
+                progress: SearchProgress, budget: SearchBudget, cache_size: int) -> tuple:
+    """
+    Hooks the profile, the progress report and the budget into the problem and wraps the heuristic (see
+    _instrument_heuristic), as every informed search does before expanding anything.
+
+    Returns:
+        tuple: (problem, heuristic_func, heuristic_update).
+    """
+    if profile is not None:
+        problem = profile.problem(problem)
+    if progress is not None:
+        problem = progress.problem(problem)
+    if budget is not None:
+        problem = budget.problem(problem)
+    heuristic_func, heuristic_update = _instrument_heuristic(heuristic_func, profile, cache_size)
+    return problem, heuristic_func, heuristic_update
+
+
+@budgeted
+def astar_search(problem: hanoi_states.ProblemHanoi, heuristic_func: Callable, display: bool = False,
+                 order: str = 'min', weight: float = 1, max_frontier: int = None, profile: SearchProfile = None,
+                 progress: SearchProgress = None, budget: SearchBudget = None, heuristic_cache_size: int = 2 ** 20):
     """
-    A* search algorithm for the Tower of Hanoi problem using tree_hanoi.NodeHanoi.
+    A* search algorithm for the Tower of Hanoi problem. The search tree is kept in a NodeStore and only the
+    solution path is returned as tree_hanoi.NodeHanoi objects.
+
+    With weight > 1 this is weighted A* (f = g + w * h): it expands fewer nodes and, with an admissible heuristic,
+    the solution costs at most w times the optimal cost. With max_frontier the frontier is bounded (see
+    _best_first_graph_search) and the solution is no longer guaranteed to be optimal.
     
     Parameters:
         problem (hanoi_states.ProblemHanoi): The Tower of Hanoi problem instance.
+        heuristic_func (Callable): Heuristic h(state).
+        order (str, optional): 'min' pops the node with the lowest priority first; 'max' the highest, for
+                               heuristics that score progress instead of estimating a cost (heuristic_func_greedy).
+                               Defaults to 'min'.
+        weight (float, optional): Weight w of the heuristic. Defaults to 1 (plain A*).
+        max_frontier (int, optional): Maximum number of nodes in the frontier; the worst ones are pruned when it is
+                                      exceeded. Defaults to None (unbounded).
+        profile (SearchProfile, optional): Accumulates per-phase counters and timers (see src/profiling.py).
+        progress (SearchProgress, optional): Reports the search progress every N expansions.
+        budget (SearchBudget, optional): Stops the search when a time, expansion or memory limit is exceeded and
+                                         returns a BudgetExceeded with partial stats instead (see src/budget.py).
+        heuristic_cache_size (int, optional): States kept in the heuristic LRU cache (see HeuristicCache). 0
+                                              disables it. Defaults to 2^20.
 
     Returns:
         tree_hanoi.NodeHanoi: The node containing the solution, or "failure" if no solution is found.
     """
-    
-    def f(new_node):
-        # The f(n) function combines the actual path cost (g) and the heuristic estimate (h)
-        return heuristic_func(new_node.state) + new_node.path_cost
+    problem, heuristic_func, heuristic_update = _instrument(problem, heuristic_func, profile, progress, budget,
+                                                            heuristic_cache_size)
 
-    node = tree_hanoi.NodeHanoi(problem.initial)
+    # The f(n) function combines the actual path cost (g) and the heuristic estimate (h)
+    def f(g, h):
+        return g + weight * h
+
+    return _best_first_graph_search(problem, f, order, heuristic_func, heuristic_update, display, profile, progress,
+                                   budget, max_frontier)
 
-    if problem.goal_test(node.state):
-        return node
+
+@budgeted
+def greedy_search(problem: hanoi_states.ProblemHanoi, heuristic_func: Callable, display: bool = False,
+                  order: str = 'min', max_frontier: int = None, profile: SearchProfile = None,
+                  progress: SearchProgress = None, budget: SearchBudget = None, heuristic_cache_size: int = 2 ** 20):
+    """
+    Greedy Search search algorithm for the Tower of Hanoi problem. The search tree is kept in a NodeStore and only
+    the solution path is returned as tree_hanoi.NodeHanoi objects.
     
-    if "greedy" in getattr(heuristic_func, '__name__', 'Unknown'):
-        frontier = aima.PriorityQueue(order='max', f=f)         #greedy considere weight (higher the better)
+    Parameters:
+        problem (hanoi_states.ProblemHanoi): The Tower of Hanoi problem instance.
+        heuristic_func (Callable): Heuristic h(state).
+        order (str, optional): 'min' pops the node with the lowest priority first; 'max' the highest, for
+                               heuristics that score progress instead of estimating a cost (heuristic_func_greedy).
+                               Defaults to 'min'.
+        max_frontier (int, optional): Maximum number of nodes in the frontier; the worst ones are pruned when it is
+                                      exceeded (see _best_first_graph_search). Defaults to None (unbounded).
+        profile (SearchProfile, optional): Accumulates per-phase counters and timers (see src/profiling.py).
+        progress (SearchProgress, optional): Reports the search progress every N expansions.
+        budget (SearchBudget, optional): Stops the search when a time, expansion or memory limit is exceeded and
+                                         returns a BudgetExceeded with partial stats instead (see src/budget.py).
+        heuristic_cache_size (int, optional): States kept in the heuristic LRU cache (see HeuristicCache). 0
+                                              disables it. Defaults to 2^20.
+
+    Returns:
+        tree_hanoi.NodeHanoi: The node containing the solution, or "failure" if no solution is found.
+    """
+    problem, heuristic_func, heuristic_update = _instrument(problem, heuristic_func, profile, progress, budget,
+                                                            heuristic_cache_size)
+
+    def f(g, h):
+        return h
+
+    return _best_first_graph_search(problem, f, order, heuristic_func, heuristic_update, display, profile, progress,
+                                   budget, max_frontier)
+
+
+def _best_first_graph_search(problem: hanoi_states.ProblemHanoi, f: Callable, order: str, heuristic_func: Callable,
+                             heuristic_update: Callable, display: bool, profile: SearchProfile,
+                             progress: SearchProgress, budget: SearchBudget, max_frontier: int = None):
+    """
+    Best-first graph search shared by astar_search and greedy_search, over an array-backed search tree (NodeStore).
+
+    The frontier holds StoredNode references ordered by f(g, h) (ties broken by g, as with tree_hanoi.NodeHanoi).
+    Only the code, parent, move, g and h of each node are stored; the state is rebuilt from its code when the node
+    is expanded, and the solution path is turned into a tree_hanoi.NodeHanoi chain once the goal is popped.
+
+    With max_frontier the frontier is bounded in the style of SMA*: when it grows past max_frontier, the worst nodes
+    (the shallowest ones among equal priorities) are pruned down to 3/4 of it, in one batch so that sorting the
+    frontier is amortized over many expansions. A pruned state is forgotten, so it can be reached again, and its f
+    is backed up into its parent: once all its children were pruned, the parent goes back to the frontier with the
+    best f among them, and is expanded again (regenerating them) only when that is the best f left. After each
+    expansion the frontier holds at most max_frontier nodes, at the cost of optimality and of re-expansions (a limit
+    far below the frontier the search needs makes it expand the same states over and over); the compact tree (see
+    NodeStore) still grows with the reached states.
+
+    Parameters:
+        problem (hanoi_states.ProblemHanoi): The (already instrumented) Tower of Hanoi problem instance.
+        f (Callable): Priority f(g, h) of a node.
+        order (str): 'min' or 'max', see aima.PriorityQueue.
+        heuristic_func (Callable): Heuristic h(state), already wrapped by the profile and the cache.
+        heuristic_update (Callable): Incremental form of heuristic_func, or None.
+        display (bool): Prints how many nodes were reached and left in the frontier.
+        profile (SearchProfile): Instruments the frontier when given.
+        progress (SearchProgress): Watches the frontier and the reached states when given.
+        budget (SearchBudget): Watches the frontier and the reached states when given.
+        max_frontier (int, optional): Maximum number of nodes in the frontier, None for unbounded.
+
+    Returns:
+        tuple: (tree_hanoi.NodeHanoi, reached states, nodes left in the frontier), or "failure" if no solution is
+        found.
+    """
+    if problem.goal_test(problem.initial):
+        return tree_hanoi.NodeHanoi(problem.initial)
+
+    # Tree of the best-known path to each state
+    reached = NodeStore(problem.initial, h=heuristic_func(problem.initial))
+    costs, hs = reached.costs, reached.h
+    if max_frontier is None:
+        frontier = aima.PriorityQueue(order=order, f=lambda key: f(key.cost, hs[key.node]))
     else:
-        frontier = aima.PriorityQueue(order='min', f=f)         #a_star considere cost (lower the better)
-    frontier.append(node)
+        # Best f of the forgotten children of each node, and how many of its children are in the frontier: as in
+        # SMA*, a node goes back to the frontier only when all its children were pruned
+        backed, queued = {}, {}
+        frontier = aima.PriorityQueue(order=order, f=lambda key: backed.get(key.node, f(key.cost, hs[key.node])))
+    frontier.append(StoredNode(reached.root, problem.initial.code, problem.initial.accumulated_cost))
+    if profile is not None:
+        frontier = profile.frontier(frontier)
+    if progress is not None:
+        progress.watch((frontier,), (reached,))
+    if budget is not None:
+        budget.watch((frontier,), (reached,))
 
-    # Dictionary to track the best-known path to a state
-    reached = {node.state: node}
-    
     while len(frontier) > 0:
-        node = frontier.pop()
-        
-        if problem.goal_test(node.state):
+        node = frontier.pop().node
+        state = reached.state(node)
+        if max_frontier is not None:
+            backed.pop(node, None)
+            _count_queued(queued, reached.parents[node], -1)
+
+        if problem.goal_test(state):
             if display:
                 print(len(reached), "caminos se expandieron y", len(frontier), "caminos quedaron en la frontera")
-            return (node, len(reached), len(frontier))
-        
+            solution = reached.solution(node)
+            solution.h, solution.f = hs[node], f(costs[node], hs[node])
+            return (solution, len(reached), len(frontier))
+
         # Expand the node to generate successors
-        for child in node.expand(problem):
-            s = child.state  
-            
+        h = hs[node]
+        for action in problem.actions(state):
+            child = problem.result(state, action)
+            # Children get h from their parent's h in O(1) when the heuristic has an incremental form
+            child_h = heuristic_update(h, state, action) if heuristic_update is not None else heuristic_func(child)
+            previous = reached.lookup(child.code)
+
             # If this state has not been reached before, or we found a better path
-            if s not in reached or f(child) < f(reached[s]):
-                reached[s] = child  # Update the reached dictionary with the better node
-                # If the child is already in the frontier with a higher cost, remove it
-                if child in frontier:
-                    del frontier[child]
+            if previous == NO_NODE or f(child.accumulated_cost, child_h) < f(costs[previous], hs[previous]):
+                key = StoredNode(reached.add(child.code, node, reached.encode_move(action), child.accumulated_cost,
+                                             child_h), child.code, child.accumulated_cost)
+                # If the state is already in the frontier with a higher cost, remove it
+                if key in frontier:
+                    if max_frontier is not None:
+                        _count_queued(queued, reached.parents[frontier.entries[key][1].node], -1)
+                    del frontier[key]
                 # Add the child node to the frontier
-                frontier.append(child)
+                frontier.append(key)
+                if max_frontier is not None:
+                    _count_queued(queued, node, 1)
+
+        if max_frontier is not None and len(frontier) > max_frontier:
+            _prune_frontier(frontier, reached, backed, queued, max(1, max_frontier * 3 // 4), f, order)
 
     return "failure"
 
-def greedy_search(problem: hanoi_states.ProblemHanoi, heuristic_func: Callable, display: bool = False):
+
+def _prune_frontier(frontier: aima.PriorityQueue, reached: NodeStore, backed: dict, queued: dict, size: int,
+                    f: Callable, order: str) -> None:
     """
-    Greedy Search search algorithm for the Tower of Hanoi problem using tree_hanoi.NodeHanoi.
-    
+    Prunes the frontier of _best_first_graph_search down to `size` nodes (see its max_frontier).
+
+    Each pruned state is forgotten in the NodeStore and its f is backed up into its parent. Once all the children of
+    a parent were pruned, the parent (or the node of a better path to its state, if one was found since) is queued
+    again, and registered again as the node of its state if it had been forgotten too. The pruning is repeated
+    until the parents queued again fit in `size` too.
+    """
+    better = min if order == 'min' else max
+    costs, hs, parents, codes = reached.costs, reached.h, reached.parents, reached.codes
+    # The parents queued again can take the frontier past `size`; pruning again replaces nodes with shallower ones,
+    # and the root has no parent, so this ends
+    while len(frontier) > size:
+        # Among equal priorities the shallowest nodes are pruned, so a plateau of the heuristic does not undo the
+        # last expansions (the deepest nodes have the largest g)
+        for key in frontier.prune(size, key=lambda entry: (entry[0], -entry[1].cost)):
+            reached.forget(key.node)
+            parent = parents[key.node]
+            value = backed.pop(key.node, f(key.cost, hs[key.node]))
+            if parent == NO_NODE:
+                continue
+            backed[parent] = better(backed[parent], value) if parent in backed else value
+            if _count_queued(queued, parent, -1) > 0:
+                continue
+
+            # If a better path to the parent's state was found since, that node regenerates the forgotten states
+            if reached.lookup(codes[parent]) == NO_NODE:
+                reached.restore(parent)
+            node = reached.lookup(codes[parent])
+            if node != parent:
+                value = backed.pop(parent)
+                backed[node] = better(backed[node], value) if node in backed else value
+            key = StoredNode(node, codes[node], costs[node])
+            if key not in frontier:
+                _count_queued(queued, parents[node], 1)
+            # Appending replaces the node's entry if it is already queued, updating its priority
+            frontier.append(key)
+
+
+def _count_queued(queued: dict, node: int, delta: int) -> int:
+    """
+    Adds delta to the children of `node` in the frontier (see _prune_frontier) and returns the new count.
+    """
+    count = queued.get(node, 0) + delta
+    if count > 0:
+        queued[node] = count
+    else:
+        queued.pop(node, None)
+    return count
+
+
+@budgeted
+def beam_search(problem: hanoi_states.ProblemHanoi, heuristic_func: Callable, display: bool = False,
+                beam_width: int = 64, order: str = 'min', profile: SearchProfile = None,
+                progress: SearchProgress = None, budget: SearchBudget = None, heuristic_cache_size: int = 0):
+    """
+    Beam search algorithm for the Tower of Hanoi problem: a breadth-first search that keeps only the beam_width
+    best nodes of each depth, ranked by the heuristic.
+
+    Memory is predictable instead of growing with the state space: only the nodes that entered a beam are kept, in
+    a NodeStore (at most beam_width per depth), and their states are not expanded again; the children of the beam
+    live only until the next one is chosen. The price is optimality (the beam may drop the nodes of every optimal
+    path) and completeness (the beam may run out of new states).
+
     Parameters:
         problem (hanoi_states.ProblemHanoi): The Tower of Hanoi problem instance.
+        heuristic_func (Callable): Heuristic h(state).
+        display (bool, optional): Prints how many nodes were expanded and left in the beam. Defaults to False.
+        beam_width (int, optional): Nodes kept per depth. Defaults to 64.
+        order (str, optional): 'min' keeps the nodes with the lowest h; 'max' the highest, for heuristics that score
+                               progress instead of estimating a cost (heuristic_func_greedy). Defaults to 'min'.
+        profile (SearchProfile, optional): Accumulates per-phase counters and timers (see src/profiling.py). The
+                                           beam is not a frontier, so it is not instrumented.
+        progress (SearchProgress, optional): Reports the search progress every N expansions.
+        budget (SearchBudget, optional): Stops the search when a time, expansion or memory limit is exceeded and
+                                         returns a BudgetExceeded with partial stats instead (see src/budget.py).
+        heuristic_cache_size (int, optional): States kept in the heuristic LRU cache (see HeuristicCache). 0
+                                              disables it. Defaults to 0: states pruned from a beam are rarely
+                                              generated again, and the cache would grow with every generated state.
 
     Returns:
-        tree_hanoi.NodeHanoi: The node containing the solution, or "failure" if no solution is found.
+        tuple: (tree_hanoi.NodeHanoi, expanded nodes, nodes left in the beam), or "failure" if no solution is found.
     """
-    
+    if order not in ('min', 'max'):
+        raise ValueError("Order must be either 'min' or 'max'.")
+    problem, heuristic_func, heuristic_update = _instrument(problem, heuristic_func, profile, progress, budget,
+                                                            heuristic_cache_size)
+
+    if problem.goal_test(problem.initial):
+        return (tree_hanoi.NodeHanoi(problem.initial), 0, 0)
+
+    # Only the nodes that entered a beam are stored, and their states are not expanded again
+    kept = NodeStore(problem.initial, h=heuristic_func(problem.initial))
+    hs = kept.h
+    beam = [kept.root]
+    sign = 1 if order == 'min' else -1
+    if progress is not None:
+        progress.watch((beam,), (kept,))
+    if budget is not None:
+        budget.watch((beam,), (kept,))
+
+    expanded = 0
+    while beam:
+        # Children of the whole beam, one per state: code -> (ranking, h, parent, move, g)
+        candidates = {}
+        for node in beam:
+            state = kept.state(node)
+            actions = problem.actions(state)
+            expanded += 1
+            for action in actions:
+                child = problem.result(state, action)
+                if child.code in kept or child.code in candidates:
+                    continue
+                if problem.goal_test(child):
+                    if display:
+                        print(expanded, "caminos se expandieron y", len(beam), "caminos quedaron en el haz")
+                    goal = kept.add(child.code, node, kept.encode_move(action), child.accumulated_cost, 0)
+                    return (kept.solution(goal), expanded, len(beam))
+                # Children get h from their parent's h in O(1) when the heuristic has an incremental form
+                h = heuristic_update(hs[node], state, action) if heuristic_update is not None else heuristic_func(child)
+                candidates[child.code] = (sign * h, h, node, kept.encode_move(action), child.accumulated_cost)
+
+        # The beam is updated in place, it is the list watched by progress and budget. Ties keep generation order
+        best = heapq.nsmallest(beam_width, candidates.items(), key=lambda item: item[1][0])
+        beam[:] = [kept.add(code, parent, move, cost, h) for code, (_, h, parent, move, cost) in best]
+
+    return "failure"
+
+
+@budgeted
+def ara_star_search(problem: hanoi_states.ProblemHanoi, heuristic_func: Callable, display: bool = False,
+                    weight: float = 3, weight_step: float = 0.5, on_solution: Callable[[dict], None] = None,
+                    profile: SearchProfile = None, progress: SearchProgress = None, budget: SearchBudget = None,
+                    heuristic_cache_size: int = 2 ** 20):
+    """
+    Anytime Repairing A* (ARA*) search algorithm for the Tower of Hanoi problem, over a NodeStore.
+
+    Runs weighted A* (f = g + w * h) with a large w to find a first solution quickly, then lowers w by weight_step
+    and repairs the search instead of restarting it: the frontier is kept (re-prioritized with the new w), and states
+    whose g improved after they were expanded in the current iteration are queued again for the next one. Each
+    iteration reports the solution cost and its suboptimality bound, min(w, cost / min(g + h)) over the queued
+    states, and the search ends when w reaches 1 or the bound reaches 1 (the solution is then optimal).
+
+    When a budget is given and exceeded after the first solution, the best solution found so far is returned
+    instead of a BudgetExceeded, so a latency budget yields the best answer within it.
+
+    The bound only holds for an admissible heuristic, so it is only computed for heuristics marked with
+    admissible = True (pattern_database_heuristic). The ones in src/heuristics.py overestimate the remaining cost
+    (heuristic_func_astar_1 by 2 moves, heuristic_func_astar_2 by up to 2^(n-1) - 1): with them the bound is None
+    and w is always lowered down to 1, where the solution is the one A* finds with that heuristic, not necessarily
+    the optimal one.
+
+    Parameters:
+        problem (hanoi_states.ProblemHanoi): The Tower of Hanoi problem instance.
+        heuristic_func (Callable): Heuristic h(state).
+        display (bool, optional): Prints each improvement and the final counts. Defaults to False.
+        weight (float, optional): Initial weight w. Defaults to 3.
+        weight_step (float, optional): How much w is lowered after each iteration. Defaults to 0.5.
+        on_solution (Callable, optional): Called after each iteration with a dict: cost, weight, bound (None for
+                                          a heuristic not marked admissible), expanded and elapsed seconds.
+        profile (SearchProfile, optional): Accumulates per-phase counters and timers (see src/profiling.py).
+        progress (SearchProgress, optional): Reports the search progress every N expansions.
+        budget (SearchBudget, optional): Stops the search when a time, expansion or memory limit is exceeded,
+                                         returning the best solution so far, or a BudgetExceeded if there is none
+                                         yet (see src/budget.py).
+        heuristic_cache_size (int, optional): States kept in the heuristic LRU cache (see HeuristicCache). 0
+                                              disables it. Defaults to 2^20.
+
+    Returns:
+        tuple: (tree_hanoi.NodeHanoi, expanded nodes, nodes left in the frontier), or "failure" if no solution is
+        found.
+    """
+    admissible = getattr(heuristic_func, 'admissible', False)
+    problem, heuristic_func, heuristic_update = _instrument(problem, heuristic_func, profile, progress, budget,
+                                                            heuristic_cache_size)
+
+    if problem.goal_test(problem.initial):
+        return (tree_hanoi.NodeHanoi(problem.initial), 0, 0)
+
+    start_time = time.perf_counter()
+    reached = NodeStore(problem.initial, h=heuristic_func(problem.initial))
+    costs, hs = reached.costs, reached.h
+    w = max(weight, 1)
+
+    def new_frontier(keys):
+        # The priority reads the current w, so the frontier is rebuilt every time w changes
+        frontier = aima.PriorityQueue(order='min', f=lambda key: key.cost + w * hs[key.node])
+        frontier.extend(keys)
+        if profile is not None:
+            frontier = profile.frontier(frontier)
+        if progress is not None:
+            progress.watch((frontier,), (reached,))
+        if budget is not None:
+            budget.watch((frontier,), (reached,))
+        return frontier
+
+    frontier = new_frontier([StoredNode(reached.root, problem.initial.code, problem.initial.accumulated_cost)])
+    closed = set()      # States expanded in the current iteration
+    inconsistent = {}   # States whose g improved after being expanded, queued again in the next iteration
+    goal_node = NO_NODE
+    expanded = 0
+
+    try:
+        while True:
+            # Improve the solution with the current w: stop once no queued node can beat it
+            while len(frontier) > 0 and (goal_node == NO_NODE or
+                                         costs[goal_node] + w * hs[goal_node] > frontier.top_priority()):
+                node = frontier.pop().node
+                state = reached.state(node)
+                actions = problem.actions(state)
+                closed.add(state.code)
+                expanded += 1
+
+                h = hs[node]
+                for action in actions:
+                    child = problem.result(state, action)
+                    previous = reached.lookup(child.code)
+                    if previous != NO_NODE and child.accumulated_cost >= costs[previous]:
+                        continue
+                    if previous != NO_NODE:
+                        child_h = hs[previous]
+                    elif heuristic_update is not None:
+                        child_h = heuristic_update(h, state, action)
+                    else:
+                        child_h = heuristic_func(child)
+
+                    key = StoredNode(reached.add(child.code, node, reached.encode_move(action),
+                                                 child.accumulated_cost, child_h), child.code, child.accumulated_cost)
+                    if problem.goal_test(child):
+                        goal_node = key.node
+                    if child.code in closed:
+                        inconsistent[key] = key
+                    else:
+                        if key in frontier:
+                            del frontier[key]
+                        frontier.append(key)
+
+            if goal_node == NO_NODE:
+                return "failure"
+
+            # Suboptimality bound: with an admissible h the optimal cost is at least the smallest g + h among the
+            # queued states
+            queued = list(frontier.entries) + list(inconsistent)
+            bound = None
+            if admissible:
+                lower = min((key.cost + hs[key.node] for key in queued), default=costs[goal_node])
+                bound = max(1.0, min(w, costs[goal_node] / lower)) if lower > 0 else w
+            event = {"cost": costs[goal_node], "weight": w, "bound": bound, "expanded": expanded,
+                     "elapsed": time.perf_counter() - start_time}
+            if display:
+                bound_text = "sin cota" if bound is None else f"cota {bound:.3f}"
+                print(f"ARA* w={w:g}: costo {event['cost']:g}, {bound_text}, {expanded} nodos expandidos")
+            if on_solution is not None:
+                on_solution(event)
+
+            if w <= 1 or (bound is not None and bound <= 1):
+                break
+            w = max(1.0, w - weight_step)
+            frontier = new_frontier(queued)
+            closed.clear()
+            inconsistent.clear()
+    except BudgetStop:
+        if goal_node == NO_NODE:
+            raise
+
+    if display:
+        print(expanded, "caminos se expandieron y", len(frontier), "caminos quedaron en la frontera")
+    return (reached.solution(goal_node), expanded, len(frontier))
+
+
+@budgeted
+def ida_star_search(problem: hanoi_states.ProblemHanoi, heuristic_func: Callable, display: bool = False,
+                    profile: SearchProfile = None, progress: SearchProgress = None, budget: SearchBudget = None,
+                    heuristic_cache_size: int = 2 ** 20):
+    """
+    Iterative-deepening A* (IDA*) search algorithm for the Tower of Hanoi problem using tree_hanoi.NodeHanoi.
+
+    Runs successive depth-first searches bounded by f = g + h, raising the bound to the smallest f that exceeded it
+    in the previous iteration. Only the current path is kept in memory (no reached dict), so memory grows linearly
+    with the solution depth at the price of re-expanding nodes. The depth-first search uses an explicit stack, since
+    solutions are 2^n - 1 moves long and would exceed Python's recursion limit.
+
+    The first goal found within the bound is returned, so the solution is optimal only when heuristic_func is
+    admissible (it never overestimates the remaining cost, up to a constant offset). The heuristics in
+    src/heuristics.py are not: with heuristic_func_astar_2 the solution costs 41 moves at 5 disks instead of 31.
+
+    Two prunings are applied that keep an optimal path reachable: states already on the current path are skipped,
+    and the disk moved by the parent is never moved again right away (two consecutive moves of the same disk can
+    always be replaced by a single one).
+
+    Parameters:
+        problem (hanoi_states.ProblemHanoi): The Tower of Hanoi problem instance.
+        heuristic_func (Callable): Heuristic h(state) added to the path cost.
+        display (bool, optional): Prints the number of iterations and expanded nodes. Defaults to False.
+        profile (SearchProfile, optional): Accumulates per-phase counters and timers (see src/profiling.py).
+        progress (SearchProgress, optional): Reports the search progress every N expansions.
+        budget (SearchBudget, optional): Stops the search when a time, expansion or memory limit is exceeded and
+                                         returns a BudgetExceeded with partial stats instead (see src/budget.py).
+        heuristic_cache_size (int, optional): States kept in the heuristic LRU cache (see HeuristicCache). 0
+                                              disables it. Defaults to 2^20.
+
+    Returns:
+        tuple: (tree_hanoi.NodeHanoi, expanded nodes, length of the final path stack), or "failure" if no solution
+        is found.
+    """
+    problem, heuristic_func, heuristic_update = _instrument(problem, heuristic_func, profile, progress, budget,
+                                                            heuristic_cache_size)
+
     def f(new_node):
-        return heuristic_func(new_node.state) 
+        if new_node.f is None:
+            if new_node.h is None:
+                new_node.h = heuristic_func(new_node.state)
+            new_node.f = new_node.h + new_node.path_cost
+        return new_node.f
+
+    def successors(node):
+        # Children sorted by f, so the most promising branch is explored first
+        children = []
+        for action in problem.actions(node.state):
+            if node.action is not None and action.disk == node.action.disk:
+                continue
+            child = node.child_node(problem, action, heuristic_update)
+            if child.state not in path_states:
+                children.append((f(child), child))
+        children.sort(key=lambda pair: pair[0])
+        return iter(children)
+
+    root = tree_hanoi.NodeHanoi(problem.initial)
+    if problem.goal_test(root.state):
+        return (root, 0, 0)
+
+    bound = f(root)
+    iterations = 0
+    expanded = 0
+    while True:
+        iterations += 1
+        next_bound = float('inf')
+        path_states = {root.state}
+        stack = [(root, successors(root))]
+        if progress is not None:
+            progress.watch((stack,), (path_states,))
+        if budget is not None:
+            budget.watch((stack,), (path_states,))
+        expanded += 1
+
+        while stack:
+            node, children = stack[-1]
+            pair = next(children, None)
+            if pair is None:
+                stack.pop()
+                path_states.discard(node.state)
+                continue
+
+            f_child, child = pair
+            if f_child > bound:
+                next_bound = min(next_bound, f_child)
+                continue
+
+            if problem.goal_test(child.state):
+                if display:
+                    print(iterations, "iteraciones,", expanded, "nodos se expandieron y", len(stack),
+                          "nodos quedaron en el camino")
+                return (child, expanded, len(stack))
+
+            path_states.add(child.state)
+            stack.append((child, successors(child)))
+            expanded += 1
+
+        if next_bound == float('inf'):
+            return "failure"
+        bound = next_bound
+
+
+def _join_bidirectional_paths(problem: hanoi_states.ProblemHanoi, forward_node: tree_hanoi.NodeHanoi,
+                              backward_node: tree_hanoi.NodeHanoi) -> tree_hanoi.NodeHanoi:
+    """
+    Joins the forward path (initial -> meeting state) with the backward path (goal -> meeting state).
 
-    node = tree_hanoi.NodeHanoi(problem.initial)
-    if problem.goal_test(node.state):
-        return node
-    
-    if "greedy" in getattr(heuristic_func, '__name__', 'Unknown'):
-        frontier = aima.PriorityQueue(order='max', f=f)     #greedy considere weight (higher the better)
-    else:
-        frontier = aima.PriorityQueue(order='min', f=f)     #a_star considere cost (lower the better)
-    frontier.append(node)
-    
-    # Dictionary to track the best-known path to a state
-    reached = {node.state: node}
-    
-    while len(frontier) > 0:
-        node: tree_hanoi.NodeHanoi = frontier.pop()
-        
-        if problem.goal_test(node.state):
+    The backward path is replayed from the meeting state towards the goal by undoing each of its moves, so the
+    result is a regular tree_hanoi.NodeHanoi chain from the initial state to the goal.
+
+    Parameters:
+        problem (hanoi_states.ProblemHanoi): The Tower of Hanoi problem instance.
+        forward_node (tree_hanoi.NodeHanoi): Node reached by the forward search.
+        backward_node (tree_hanoi.NodeHanoi): Node with the same state reached by the backward search.
+
+    Returns:
+        tree_hanoi.NodeHanoi: The node containing the goal state.
+    """
+    node = forward_node
+    while backward_node.parent is not None:
+        action = backward_node.action
+        node = node.child_node(problem, hanoi_states.ActionHanoi(action.disk, action.rod_out, action.rod_input))
+        backward_node = backward_node.parent
+    return node
+
+
+def _backward_heuristic(problem: hanoi_states.ProblemHanoi, heuristic_func: Callable) -> Callable:
+    """
+    Builds the default backward heuristic for bidirectional_astar_search.
+
+    When the initial state is the goal with its rods reversed (e.g. the standard first rod -> last rod instance),
+    heuristic_func evaluated on the mirrored state estimates the distance to the initial state. For any other
+    instance there is no such mapping, so the backward search falls back to h = 0 (uniform cost).
+    """
+    goal = problem.goal
+    mirrored_goal = hanoi_states.encode_rods(goal.rods[::-1], goal.number_of_pegs)
+    if mirrored_goal != problem.initial.code or goal.number_of_disks != problem.initial.number_of_disks:
+        return lambda state: 0
+
+    def mirrored(state: hanoi_states.StatesHanoi):
+        return heuristic_func(hanoi_states.StatesHanoi.from_code(
+            hanoi_states.encode_rods(state.rods[::-1], state.number_of_pegs), state.number_of_disks,
+            number_of_pegs=state.number_of_pegs))
+    return mirrored
+
+
+@budgeted
+def bidirectional_breadth_first_search(problem: hanoi_states.ProblemHanoi, display: bool = False,
+                                       profile: SearchProfile = None, progress: SearchProgress = None,
+                                       budget: SearchBudget = None):
+    """
+    Bidirectional breadth-first search for the Tower of Hanoi problem, with one NodeStore per direction.
+
+    Hanoi moves are reversible, so a second breadth-first search is run backwards from the goal. On each step the
+    direction with the smaller frontier expands one full level; once a generated state has been reached by the
+    other direction the level is finished and the cheapest meeting point is returned. Both searches only go about
+    half the solution depth.
+
+    Parameters:
+        problem (hanoi_states.ProblemHanoi): The Tower of Hanoi problem instance.
+        display (bool, optional): Prints how many nodes were expanded and left in both frontiers. Defaults to False.
+        profile (SearchProfile, optional): Accumulates per-phase counters and timers (see src/profiling.py).
+        progress (SearchProgress, optional): Reports the search progress every N expansions.
+        budget (SearchBudget, optional): Stops the search when a time, expansion or memory limit is exceeded and
+                                         returns a BudgetExceeded with partial stats instead (see src/budget.py).
+
+    Returns:
+        tuple: (tree_hanoi.NodeHanoi, expanded nodes, nodes left in both frontiers), or "failure" if no solution is
+        found.
+    """
+    if profile is not None:
+        problem = profile.problem(problem)
+    if progress is not None:
+        problem = progress.problem(problem)
+    if budget is not None:
+        problem = budget.problem(problem)
+
+    if problem.goal_test(problem.initial):
+        return (tree_hanoi.NodeHanoi(problem.initial), 0, 0)
+
+    # One array-backed tree per direction (see NodeStore); the frontiers only hold node indices
+    reached = (NodeStore(problem.initial), NodeStore(problem.goal))
+    frontiers = (deque([reached[0].root]), deque([reached[1].root]))
+    if profile is not None:
+        frontiers = tuple(profile.frontier(frontier) for frontier in frontiers)
+    if progress is not None:
+        progress.watch(frontiers, reached)
+    if budget is not None:
+        budget.watch(frontiers, reached)
+    expanded = 0
+
+    while frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        frontier, own_reached, other_reached = frontiers[side], reached[side], reached[1 - side]
+
+        best = None
+        for _ in range(len(frontier)):
+            node = frontier.popleft()
+            state = own_reached.state(node)
+            expanded += 1
+            for action in problem.actions(state):
+                child = problem.result(state, action)
+                if child.code in own_reached:
+                    continue
+                child_node = own_reached.add(child.code, node, own_reached.encode_move(action),
+                                             child.accumulated_cost)
+                frontier.append(child_node)
+                other_node = other_reached.lookup(child.code)
+                if other_node != NO_NODE:
+                    cost = child.accumulated_cost + other_reached.costs[other_node]
+                    if best is None or cost < best[0]:
+                        best = (cost, child_node, other_node)
+
+        if best is not None:
+            _, meeting_node, other_node = best
+            if side == 0:
+                node = _join_bidirectional_paths(problem, reached[0].solution(meeting_node),
+                                                 reached[1].solution(other_node))
+            else:
+                node = _join_bidirectional_paths(problem, reached[0].solution(other_node),
+                                                 reached[1].solution(meeting_node))
+            left = len(frontiers[0]) + len(frontiers[1])
             if display:
-                print(len(reached), "caminos se expandieron y", len(frontier), "caminos quedaron en la frontera")
-            return (node, len(reached), len(frontier))
-        
-        # Expand the node to generate successors
-        for child in node.expand(problem):
-            s = child.state  
-            
-            # If this state has not been reached before, or we found a better path
-            if s not in reached or f(child) < f(reached[s]):
-                reached[s] = child  # Update the reached dictionary with the better node
-                # If the child is already in the frontier with a higher cost, remove it
-                if child in frontier:
-                    del frontier[child]
-                # Add the child node to the frontier
-                frontier.append(child)
+                print(expanded, "caminos se expandieron y", left, "caminos quedaron en la frontera")
+            return (node, expanded, left)
 
     return "failure"
 
 
+@budgeted
+def bidirectional_astar_search(problem: hanoi_states.ProblemHanoi, heuristic_func: Callable,
+                               backward_heuristic_func: Callable = None, display: bool = False,
+                               profile: SearchProfile = None, progress: SearchProgress = None,
+                               budget: SearchBudget = None, heuristic_cache_size: int = 2 ** 20):
+    """
+    Bidirectional A* search for the Tower of Hanoi problem using tree_hanoi.NodeHanoi.
 
-astar_search_heuristic1: Callable = lambda problem, display=False: astar_search(
-    problem, 
-    heuristic_func=heuristic_func_astar_1,
-    display=display
-)
+    Runs one A* from the initial state (guided by heuristic_func) and one from the goal (guided by
+    backward_heuristic_func), always expanding the direction with the smaller frontier. Every time a generated
+    state has been reached by the other direction the joined path becomes a candidate; the search stops once the
+    node popped from a frontier cannot improve the best candidate (f >= best cost).
 
-astar_search_heuristic2: Callable = lambda problem, display=False: astar_search(
-    problem, 
-    heuristic_func=heuristic_func_astar_2,  
-    display=display
-)
+    Parameters:
+        problem (hanoi_states.ProblemHanoi): The Tower of Hanoi problem instance.
+        heuristic_func (Callable): Heuristic towards the goal.
+        backward_heuristic_func (Callable, optional): Heuristic towards the initial state. Defaults to heuristic_func
+                                                      evaluated on the mirrored state when the initial state is the
+                                                      mirror of the goal, and to h = 0 otherwise.
+        display (bool, optional): Prints how many nodes were expanded and left in both frontiers. Defaults to False.
+        profile (SearchProfile, optional): Accumulates per-phase counters and timers (see src/profiling.py).
+        progress (SearchProgress, optional): Reports the search progress every N expansions.
+        budget (SearchBudget, optional): Stops the search when a time, expansion or memory limit is exceeded and
+                                         returns a BudgetExceeded with partial stats instead (see src/budget.py).
+        heuristic_cache_size (int, optional): States kept in the heuristic LRU cache (see HeuristicCache). 0
+                                              disables it. Defaults to 2^20.
+
+    Returns:
+        tuple: (tree_hanoi.NodeHanoi, expanded nodes, nodes left in both frontiers), or "failure" if no solution is
+        found.
+    """
+    if backward_heuristic_func is None:
+        backward_heuristic_func = _backward_heuristic(problem, heuristic_func)
+    problem, heuristic_func, forward_update = _instrument(problem, heuristic_func, profile, progress, budget,
+                                                          heuristic_cache_size)
+    backward_heuristic_func, backward_update = _instrument_heuristic(backward_heuristic_func, profile,
+                                                                     heuristic_cache_size)
+    heuristic_updates = [forward_update, backward_update]
+
+    # Each node belongs to a single direction, so it stores the h and f of that direction
+    def f_forward(new_node):
+        if new_node.f is None:
+            if new_node.h is None:
+                new_node.h = heuristic_func(new_node.state)
+            new_node.f = new_node.h + new_node.path_cost
+        return new_node.f
+
+    def f_backward(new_node):
+        if new_node.f is None:
+            if new_node.h is None:
+                new_node.h = backward_heuristic_func(new_node.state)
+            new_node.f = new_node.h + new_node.path_cost
+        return new_node.f
+
+    forward_root = tree_hanoi.NodeHanoi(problem.initial)
+    if problem.goal_test(forward_root.state):
+        return (forward_root, 0, 0)
+    backward_root = tree_hanoi.NodeHanoi(problem.goal)
+
+    fs = (f_forward, f_backward)
+    frontiers = (aima.PriorityQueue(order='min', f=f_forward), aima.PriorityQueue(order='min', f=f_backward))
+    frontiers[0].append(forward_root)
+    frontiers[1].append(backward_root)
+    if profile is not None:
+        frontiers = tuple(profile.frontier(frontier) for frontier in frontiers)
+    reached = ({forward_root.state: forward_root}, {backward_root.state: backward_root})
+    if progress is not None:
+        progress.watch(frontiers, reached)
+    if budget is not None:
+        budget.watch(frontiers, reached)
+
+    best = None
+    expanded = 0
+    while len(frontiers[0]) > 0 and len(frontiers[1]) > 0:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        f, frontier, own_reached, other_reached = fs[side], frontiers[side], reached[side], reached[1 - side]
+
+        node = frontier.pop()
+        if best is not None and f(node) >= best[0]:
+            break
+        expanded += 1
+
+        for child in node.expand(problem, heuristic_updates[side]):
+            s = child.state
+            if s in own_reached and child.path_cost >= own_reached[s].path_cost:
+                continue
+            own_reached[s] = child
+            frontier.append(child)  # Replaces the previous entry of this state, if any
+            if s in other_reached:
+                cost = child.path_cost + other_reached[s].path_cost
+                if best is None or cost < best[0]:
+                    best = (cost, child, other_reached[s]) if side == 0 else (cost, other_reached[s], child)
+
+    if best is None:
+        return "failure"
+
+    node = _join_bidirectional_paths(problem, best[1], best[2])
+    left = len(frontiers[0]) + len(frontiers[1])
+    if display:
+        print(expanded, "caminos se expandieron y", left, "caminos quedaron en la frontera")
+    return (node, expanded, left)
+
+
+@budgeted
+def recursive_optimal_search(problem: hanoi_states.ProblemHanoi, display: bool = False,
+                             profile: SearchProfile = None, progress: SearchProgress = None,
+                             budget: SearchBudget = None):
+    """
+    Builds the optimal solution of the Tower of Hanoi problem without searching, using
+    recursive_solver.general_optimal_solver for 3 pegs and recursive_solver.frame_stewart_solver for more.
 
-astar_search_heuristic3: Callable = lambda problem, display=False: astar_search(
-    problem, 
-    heuristic_func=heuristic_func_greedy,  
-    display=display
-)
+    The moves are streamed by the solver and turned into a tree_hanoi.NodeHanoi chain only here, so the result can
+    be used like the one of any other search (simulator JSON export, metrics). With 3 pegs it works for any pair of
+    valid initial and goal states and serves as ground truth for the optimal cost. With more pegs only whole-tower
+    instances (every disk on one rod, both in the initial and the goal state) are supported; Frame–Stewart is proven
+    optimal for 4 pegs and is the best known solution (conjectured optimal) for 5 or more.
 
-greedy_search_heuristic1: Callable = lambda problem, display=False: greedy_search(
-    problem, 
-    heuristic_func=heuristic_func_astar_1,
-    display=display
-)
+    Parameters:
+        problem (hanoi_states.ProblemHanoi): The Tower of Hanoi problem instance.
+        display (bool, optional): Prints how many states the solution goes through. Defaults to False.
+        profile (SearchProfile, optional): Accumulates per-phase counters and timers (see src/profiling.py).
+        progress (SearchProgress, optional): Accepted for a uniform signature; nothing is expanded, so no progress
+                                             is reported.
+        budget (SearchBudget, optional): Accepted for a uniform signature; nothing is expanded, so no limit is
+                                         checked.
+
+    Returns:
+        tuple: (tree_hanoi.NodeHanoi, states in the solution path, 0 nodes left in the frontier).
 
-greedy_search_heuristic2: Callable = lambda problem, display=False: greedy_search(
-    problem, 
-    heuristic_func=heuristic_func_astar_2,
-    display=display
-)
+    Raises:
+        ValueError: With more than 3 pegs, if the initial or the goal state is not a whole tower.
+    """
+    initial, goal = problem.initial, problem.goal
+    if initial.number_of_pegs == 3:
+        actions = general_optimal_solver(initial, goal)
+    else:
+        towers = [[index for index, rod in enumerate(state.rods) if len(rod) == state.number_of_disks]
+                  for state in (initial, goal)]
+        if not all(towers):
+            raise ValueError('Con más de 3 varillas solo se admiten torres completas')
+        actions = frame_stewart_solver(initial.number_of_disks, initial.number_of_pegs, towers[0][0], towers[1][0])
 
-greedy_search_heuristic3: Callable = lambda problem, display=False: greedy_search(
-    problem, 
-    heuristic_func=heuristic_func_greedy,
-    display=display
-)
+    if profile is not None:
+        problem = profile.problem(problem)
+
+    node = tree_hanoi.NodeHanoi(problem.initial)
+    for action in actions:
+        node = node.child_node(problem, action)
 
+    if display:
+        print(node.depth + 1, "estados recorridos por la solución óptima")
+    return (node, node.depth + 1, 0)
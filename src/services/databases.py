@@ -1,6 +1,7 @@
+import atexit
 from typing import List, Union
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, insert
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, close_all_sessions
 
@@ -8,19 +9,30 @@ from src.config.settings import config
 
 
 
-engine = create_engine(
-    config['SQLALCHEMY_DATABASE_URL'],
-    # SQLite requires the next arg:
-    # connect_args={"check_same_thread": False},
-    echo=config['SQLALCHEMY_DATABASE_ECHO'],
-    pool_pre_ping=True,
-    connect_args={
-        "keepalives": 1,
-        "keepalives_idle": 30,
-        "keepalives_interval": 10,
-        "keepalives_count": 5,
-    }
-)
+def create_database_engine(url: str):
+    """
+    Creates an engine with the connection arguments each backend supports: TCP keepalives for PostgreSQL (the
+    remote server drops idle connections during long sweeps) and thread sharing for a local SQLite file.
+    """
+    connect_args = {}
+    if url.startswith("postgresql"):
+        connect_args = {
+            "keepalives": 1,
+            "keepalives_idle": 30,
+            "keepalives_interval": 10,
+            "keepalives_count": 5,
+        }
+    elif url.startswith("sqlite"):
+        connect_args = {"check_same_thread": False}
+    return create_engine(
+        url,
+        echo=config['SQLALCHEMY_DATABASE_ECHO'],
+        pool_pre_ping=True,
+        connect_args=connect_args,
+    )
+
+
+engine = create_database_engine(config['SQLALCHEMY_DATABASE_URL'])
 
 # The new base class will be given a metaclass that produces appropriate Table objects and makes the appropriate
 # mapper() calls based on the information provided declarative in the class and any subclasses of the class:
@@ -31,18 +43,21 @@ SessionLocalFactory = sessionmaker(bind=engine, autoflush=False, autocommit=Fals
 
 
 class DatabaseService:
-    def __init__(self):
+    def __init__(self, database_engine=None):
         print("Initializing DatabaseService instance")
-        self.session_factory = SessionLocalFactory
+        if database_engine is None:
+            self.session_factory = SessionLocalFactory
+        else:
+            self.session_factory = sessionmaker(bind=database_engine, autoflush=False, autocommit=False)
 
     def __del__(self):
         print("Closing all connections...")
         close_all_sessions()
 
     @staticmethod
-    def init_database():
+    def init_database(database_engine=None):
         print("Initializing database...")
-        Base.metadata.create_all(engine)
+        Base.metadata.create_all(database_engine or engine)
         close_all_sessions()
 
     def query_all(self, model, query_filter=None) -> List[Base]:
@@ -83,5 +98,53 @@ class DatabaseService:
             print(f"Error adding into DB. Detail: {e}")
         else:
             print(f"Add successful.")
-            
-            
\ No newline at end of file
+
+    def add_many(self, model, rows: List[dict]) -> int:
+        """
+        Inserts all the rows in a single transaction with one executemany INSERT, without loading them as ORM
+        objects.
+        """
+        if not rows:
+            return 0
+        try:
+            with self.session_factory() as session:
+                with session.begin():
+                    session.execute(insert(model), rows)
+        except SQLAlchemyError as e:
+            print(f"Error adding into DB. Detail: {e}")
+            return 0
+        print(f"Added {len(rows)} rows into DB.")
+        return len(rows)
+
+
+class BufferedWriter:
+    """
+    Accumulates rows of a model and writes them with `DatabaseService.add_many` every `flush_size` rows. Pending
+    rows are written when leaving a `with` block and, as a last resort, when the interpreter exits.
+    """
+
+    def __init__(self, model, flush_size: int = 100, service: DatabaseService = None):
+        self.model = model
+        self.flush_size = flush_size
+        self.service = service or DatabaseService()
+        self.rows = []
+        atexit.register(self.flush)
+
+    def add(self, row: dict) -> None:
+        self.rows.append(row)
+        if len(self.rows) >= self.flush_size:
+            self.flush()
+
+    def flush(self) -> int:
+        rows, self.rows = self.rows, []
+        return self.service.add_many(self.model, rows)
+
+    def close(self) -> None:
+        self.flush()
+        atexit.unregister(self.flush)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,34 +1,32 @@
 import pygame
+from src.simulator import logic
 from src.simulator.constants import *
 
 
-def draw_pegs(display: pygame.display, color=(130, 130, 130)):
+def draw_pegs(display: pygame.display, color=(130, 130, 130), number_of_pegs: int = 3):
     """
     Draws the pegs on the display.
 
     Parameters:
     - display (pygame.display): The display surface to draw on.
     - color (tuple): RGB color tuple representing the color of the pegs. Default is (130, 130, 130).
+    - number_of_pegs (int): The number of pegs. Default is 3.
     """
 
-    # Calculate left positions of each peg
-    peg_1_left = int(PEG_CENTER_CENTER - PEGS_WIDTH/2)
-    peg_2_left = int(PEG_LEFT_CENTER - PEGS_WIDTH/2)
-    peg_3_left = int(PEG_RIGHT_CENTER - PEGS_WIDTH/2)
-
     # Draw base and pegs
     pygame.draw.rect(display, color, pygame.Rect(BASE_LEFT, BASE_TOP, SCREEN_WIDTH - 2 * BASE_LEFT, PEGS_WIDTH))
-    pygame.draw.rect(display, color, pygame.Rect(peg_1_left, PEGS_TOP, PEGS_WIDTH, PEGS_HEIGHT))
-    pygame.draw.rect(display, color, pygame.Rect(peg_2_left, PEGS_TOP, PEGS_WIDTH, PEGS_HEIGHT))
-    pygame.draw.rect(display, color, pygame.Rect(peg_3_left, PEGS_TOP, PEGS_WIDTH, PEGS_HEIGHT))
+    for peg_center in logic.pegs_centers(number_of_pegs):
+        peg_left = int(peg_center - PEGS_WIDTH/2)
+        pygame.draw.rect(display, color, pygame.Rect(peg_left, PEGS_TOP, PEGS_WIDTH, PEGS_HEIGHT))
 
 
-def draw_background(display: pygame.display):
+def draw_background(display: pygame.display, number_of_pegs: int = 3):
     """
     Draws the background on the display.
 
     Parameters:
     - display (pygame.display): The display surface to draw on.
+    - number_of_pegs (int): The number of pegs. Default is 3.
     """
     display.fill((0, 0, 0))  # Fill the display with black color
-    draw_pegs(display)  # Draw the pegs on the display
+    draw_pegs(display, number_of_pegs=number_of_pegs)  # Draw the pegs on the display
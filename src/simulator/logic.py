@@ -1,6 +1,36 @@
 from src.simulator.constants import *
 
 
+def distance_between_pegs(number_of_pegs: int) -> int:
+    """
+    Calculates the distance between the centers of two neighbouring pegs. With 3 pegs it is DISTANCE_BETWEEN_PEGS;
+    with more pegs it shrinks so that all of them fit on the base.
+
+    Parameters:
+    - number_of_pegs (int): The number of pegs.
+
+    Returns:
+    - int: The distance between neighbouring pegs.
+    """
+    return min(DISTANCE_BETWEEN_PEGS, int((SCREEN_WIDTH - 2 * BASE_LEFT) / number_of_pegs))
+
+
+def pegs_centers(number_of_pegs: int) -> tuple:
+    """
+    Calculates the x-coordinate of the center of each peg, evenly spaced around the center of the screen. With 3
+    pegs they are (PEG_LEFT_CENTER, PEG_CENTER_CENTER, PEG_RIGHT_CENTER).
+
+    Parameters:
+    - number_of_pegs (int): The number of pegs.
+
+    Returns:
+    - tuple: The x-coordinate of each peg, from left to right.
+    """
+    distance = distance_between_pegs(number_of_pegs)
+    return tuple(int(PEG_CENTER_CENTER + (index - (number_of_pegs - 1) / 2) * distance)
+                 for index in range(number_of_pegs))
+
+
 class HanoiPeg:
     """
     Initializes a HanoiPeg object.
@@ -94,9 +124,7 @@ class HanoiBaseLogic:
     """
     def __init__(self, pegs_centers: tuple):
 
-        self.pegs = [HanoiPeg(1, pegs_centers[0]),
-                     HanoiPeg(2, pegs_centers[1]),
-                     HanoiPeg(3, pegs_centers[2])]
+        self.pegs = [HanoiPeg(index + 1, x_peg) for index, x_peg in enumerate(pegs_centers)]
 
     def get_next_disk_position(self, id_peg: int, disk_height: int):
         """
@@ -157,10 +185,10 @@ def initialize_logic(initial_state: dict, disk_height: int) -> HanoiBaseLogic:
     height.
     """
 
-    hanoi_base = HanoiBaseLogic((PEG_LEFT_CENTER, PEG_CENTER_CENTER, PEG_RIGHT_CENTER))
+    hanoi_base = HanoiBaseLogic(pegs_centers(len(initial_state)))
 
     for peg_name in initial_state:
-        peg_number = int(peg_name[-1])
+        peg_number = int(peg_name.split("_")[-1])
         for _ in initial_state[peg_name]:
             hanoi_base.add_disk_to_peg(peg_number, disk_height)
 
@@ -85,7 +85,7 @@ def main():
         flag_execute_next_seq = anim_manager.ask_new_seq  # Check if there's a new sequence to execute
 
         # Draw all elements
-        background.draw_background(screen)  # Draw the background
+        background.draw_background(screen, len(hanoi_base.pegs))  # Draw the background
         disks_sprites_groups.draw(screen)  # Draw the disk sprites
 
         pygame.display.flip()  # Update the display
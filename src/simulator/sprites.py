@@ -108,20 +108,23 @@ def obtain_disks_height(number_of_disk: int) -> int:
     return disk_height
 
 
-def obtain_disks_geometries(number_of_disk: int, disk_height: int) -> dict:
+def obtain_disks_geometries(number_of_disk: int, disk_height: int, number_of_pegs: int = 3) -> dict:
     """
     Obtains the geometries of each disk.
 
     Parameters:
     - number_of_disk (int): The total number of disks.
     - disk_height (int): The height of each disk.
+    - number_of_pegs (int): The number of pegs, the disks get narrower when the pegs are closer. Default is 3.
 
     Returns:
     - dict: A dictionary containing the geometries of each disk.
     """
-    delta_width = int((MAX_DISK_WIDTH - MIN_DISK_WIDTH) / number_of_disk)
+    scale = logic.distance_between_pegs(number_of_pegs) / DISTANCE_BETWEEN_PEGS
+    max_disk_width = int(MAX_DISK_WIDTH * scale)
+    delta_width = int((max_disk_width - MIN_DISK_WIDTH * scale) / number_of_disk)
 
-    disk_width = MAX_DISK_WIDTH
+    disk_width = max_disk_width
     disks_geometries = {}
     for i in reversed(range(number_of_disk)):
         color_index = random.randint(0, len(colors))
@@ -147,7 +150,7 @@ def create_sprites(number_of_disk: int, disk_height: int, base_logic: logic.Hano
     Returns:
     - dict: A dictionary containing the disk sprites.
     """
-    disks_geometries = obtain_disks_geometries(number_of_disk, disk_height)
+    disks_geometries = obtain_disks_geometries(number_of_disk, disk_height, len(base_logic.pegs))
 
     sprites_stack = {}
     for peg in base_logic.pegs:
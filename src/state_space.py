@@ -0,0 +1,126 @@
+from typing import Callable
+
+import numpy as np
+
+from src import hanoi_states
+from src.lookup_tables import load_or_build_table
+
+
+UNREACHED = np.iinfo(np.uint16).max
+
+# Máximo de configuraciones de una tabla de distancias (3^15 son 29 MB en uint16). Con 3 varillas la mayor distancia
+# es 2^15 - 1 y con más varillas es menor, así que ninguna distancia real llega a UNREACHED
+MAX_STATES = 3 ** 15
+
+
+def successor_codes(codes: np.ndarray, disks: int, pegs: int = 3) -> np.ndarray:
+    """
+    Calcula en lote los códigos de todos los sucesores de un conjunto de estados.
+
+    Args:
+        codes (np.ndarray): Códigos de los estados (ver `hanoi_states.encode_rods`).
+        disks (int): Cantidad de discos.
+        pegs (int): Cantidad de varillas.
+
+    Returns:
+        np.ndarray: Códigos de los sucesores, sin ningún orden ni eliminación de repetidos.
+    """
+    codes = np.asarray(codes, dtype=np.int64)
+    powers = pegs ** np.arange(disks, dtype=np.int64)
+    # digits[i, d] es la varilla del disco d+1 en el estado i
+    digits = (codes[:, None] // powers) % pegs
+
+    # Disco superior (el de menor índice) de cada varilla; `disks` si la varilla está vacía
+    tops = []
+    for peg in range(pegs):
+        on_peg = digits == peg
+        tops.append(np.where(on_peg.any(axis=1), on_peg.argmax(axis=1), disks))
+
+    children = []
+    for rod_input in range(pegs):
+        for rod_out in range(pegs):
+            if rod_input == rod_out:
+                continue
+            valid = tops[rod_input] < tops[rod_out]
+            disk_index = tops[rod_input][valid]
+            children.append(codes[valid] + (rod_out - rod_input) * powers[disk_index])
+    return np.concatenate(children)
+
+
+def breadth_first_distances(disks: int, goal_code: int, pegs: int = 3) -> np.ndarray:
+    """
+    Calcula la distancia exacta al objetivo de las k^n configuraciones, con una búsqueda en anchura por niveles
+    completamente vectorizada (los movimientos de Hanoi son reversibles, así que se busca desde el objetivo).
+
+    Args:
+        disks (int): Cantidad de discos (a lo sumo MAX_STATES configuraciones, para que las distancias entren en
+            uint16 sin alcanzar UNREACHED).
+        goal_code (int): Código del estado objetivo.
+        pegs (int): Cantidad de varillas.
+
+    Returns:
+        np.ndarray: Arreglo uint16 de k^n elementos con la distancia de cada código al objetivo.
+    """
+    if pegs ** disks > MAX_STATES:
+        raise ValueError(f'Se admiten hasta {MAX_STATES} configuraciones (15 discos con 3 varillas)')
+
+    distances = np.full(pegs ** disks, UNREACHED, dtype=np.uint16)
+    distances[goal_code] = 0
+    frontier = np.array([goal_code], dtype=np.int64)
+    depth = 0
+    while frontier.size:
+        depth += 1
+        children = successor_codes(frontier, disks, pegs)
+        children = np.unique(children[distances[children] == UNREACHED])
+        distances[children] = depth
+        frontier = children
+    return distances
+
+
+class GoalDistances:
+    """
+    Distancias exactas (cantidad óptima de movimientos) de todos los estados a un objetivo, consultables con
+    objetos StatesHanoi.
+    """
+
+    def __init__(self, goal: hanoi_states.StatesHanoi, directory: str = None, persist: bool = True):
+        """
+        Inicializa la tabla, abriéndola de disco si ya fue calculada y construyéndola en caso contrario.
+
+        Args:
+            goal (hanoi_states.StatesHanoi): Estado objetivo.
+            directory (str): Carpeta donde se guardan las tablas (ver `lookup_tables.table_path`).
+            persist (bool): Indica si la tabla se lee y se guarda en disco.
+        """
+        self.number_of_disks = goal.number_of_disks
+        self.number_of_pegs = goal.number_of_pegs
+        self.goal_code = goal.code
+        self.distances = load_or_build_table(
+            f"goal_distances_k{self.number_of_pegs}_n{self.number_of_disks}_goal{self.goal_code}", np.uint16,
+            lambda: breadth_first_distances(self.number_of_disks, self.goal_code, self.number_of_pegs),
+            directory=directory, persist=persist
+        )
+
+    def __getitem__(self, state: hanoi_states.StatesHanoi) -> int:
+        """
+        Cantidad óptima de movimientos desde el estado hasta el objetivo.
+        """
+        return int(self.distances[state.code])
+
+    def distance(self, state: hanoi_states.StatesHanoi) -> int:
+        """
+        Cantidad óptima de movimientos desde el estado hasta el objetivo.
+        """
+        return int(self.distances[state.code])
+
+    def as_heuristic(self) -> Callable:
+        """
+        Devuelve la distancia exacta como heurística (perfecta) para `astar_search`, útil como referencia para medir
+        la calidad de las demás heurísticas.
+        """
+        distances = self.distances
+
+        def heuristic_func_exact(nodeState: hanoi_states.StatesHanoi) -> int:
+            return int(distances[nodeState.code])
+
+        return heuristic_func_exact
@@ -1,4 +1,5 @@
 import json
+from typing import Callable, Iterator
 from src import aima
 from src import hanoi_states
 
@@ -19,20 +20,43 @@ class NodeHanoi(aima.Node):
         """
         super().__init__(state, parent=parent, action=action)
         self.path_cost = state.accumulated_cost
+        # Heurística y prioridad del nodo, las completa la búsqueda la primera vez que las calcula
+        self.h = None
+        self.f = None
 
-    def child_node(self, problem: hanoi_states.ProblemHanoi, action: hanoi_states.ActionHanoi):
+    def expand(self, problem: hanoi_states.ProblemHanoi, heuristic_update: Callable = None) -> Iterator["NodeHanoi"]:
+        """
+        Genera, de a uno, los nodos hijos de todas las acciones posibles.
+
+        Args:
+            problem (hanoi_states.ProblemHanoi): Problema de la Torre de Hanoi.
+            heuristic_update (Callable, optional): Forma incremental de la heurística (ver `child_node`).
+
+        Yields:
+            NodeHanoi: Cada nodo hijo.
+        """
+        for action in problem.actions(self.state):
+            yield self.child_node(problem, action, heuristic_update)
+
+    def child_node(self, problem: hanoi_states.ProblemHanoi, action: hanoi_states.ActionHanoi,
+                   heuristic_update: Callable = None):
         """
         Genera el nodo hijo a partir de una acción.
 
         Args:
             problem (hanoi_states.ProblemHanoi): Problema de la Torre de Hanoi.
             action (hanoi_states.ActionHanoi): Acción a aplicar.
+            heuristic_update (Callable, optional): Función update(h_padre, estado_padre, acción) que calcula la
+                heurística del hijo a partir de la del padre. Si se pasa y el padre ya tiene h, el hijo se crea con
+                su h; si no, la búsqueda la evalúa completa cuando la necesita.
 
         Returns:
             NodeHanoi: Nodo hijo generado.
         """
         next_state = problem.result(self.state, action)
         next_node = NodeHanoi(next_state, parent=self, action=action)
+        if heuristic_update is not None and self.h is not None:
+            next_node.h = heuristic_update(self.h, self.state, action)
         return next_node
 
     def generate_solution_for_simulator(self, initial_state_file="./src/simulator/solutions/initial_state.json",
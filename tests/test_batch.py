@@ -0,0 +1,79 @@
+import io
+import json
+
+import pytest
+
+from src.batch import (state_from_dict, read_pairs, write_pairs, random_pairs, canonical_labels, relabel_state,
+                       solve_batch, write_jsonl)
+from src.hanoi_states import StatesHanoi, ProblemHanoi
+from src.search import recursive_optimal_search, astar_search
+from src.pattern_database import pattern_database_heuristic
+
+
+def test_random_pairs_are_reproducible(tmp_path):
+    pairs = list(random_pairs(20, 5, seed=7))
+    assert pairs == list(random_pairs(20, 5, seed=7))
+    assert pairs != list(random_pairs(20, 5, seed=8))
+
+    path = str(tmp_path / "pairs.jsonl")
+    assert write_pairs(pairs, path) == 20
+    assert list(read_pairs(path)) == pairs
+
+
+def test_state_from_dict_accepts_dicts_and_lists():
+    state = StatesHanoi([4, 1], [], [3], [2], max_disks=4)
+    assert state_from_dict(state.get_state_dict()) == state
+    assert state_from_dict([[4, 1], [], [3], [2]]) == state
+
+
+@pytest.mark.parametrize("pegs", [3, 4])
+def test_canonical_labels_keep_goal_structure(pegs):
+    for initial, goal in random_pairs(50, 5, pegs=pegs, seed=1):
+        labels = canonical_labels(goal)
+        assert sorted(labels) == list(range(pegs))
+        canonical = relabel_state(goal, labels)
+        assert canonical_labels(canonical) == list(range(pegs))
+        assert 5 in canonical.rods[-1]
+
+    standard = StatesHanoi([], [], [3, 2, 1], max_disks=3)
+    assert canonical_labels(standard) == [0, 1, 2]
+
+
+def test_solve_batch_streams_optimal_solutions():
+    pairs = list(random_pairs(30, 5, seed=3))
+    buffer = io.StringIO()
+    rows = solve_batch(pairs, recursive_optimal_search, include_solution=True)
+
+    assert write_jsonl(rows, buffer) == 30
+    for line, (initial, goal) in zip(buffer.getvalue().splitlines(), pairs):
+        row = json.loads(line)
+        assert row["model_name"] == "recursive_optimal_search"
+        assert row["cost"] == row["optimal_cost"] == len(row["solution"])
+
+        # La solución está expresada en las varillas originales del par
+        state = initial
+        for move in row["solution"]:
+            problem = ProblemHanoi(initial=state, goal=goal)
+            state = next(problem.result(state, action) for action in problem.actions(state)
+                         if action.action_dict == move)
+        assert state == goal
+
+
+@pytest.mark.parametrize("canonical", [True, False])
+def test_solve_batch_with_pattern_database(canonical, tmp_path):
+    solver = lambda problem: astar_search(problem, pattern_database_heuristic(problem.goal, directory=str(tmp_path)))
+    rows = list(solve_batch(random_pairs(40, 3, seed=11), solver, solver_name="astar_pdb", canonical=canonical))
+
+    assert all(row["cost"] == row["optimal_cost"] for row in rows)
+    goals = {StatesHanoi.from_code(code, 3) for code in range(3 ** 3)}
+    canonical_goals = {relabel_state(goal, canonical_labels(goal)) for goal in goals}
+    # Con la renumeración los objetivos simétricos comparten las mismas tablas
+    assert len(list(tmp_path.iterdir())) <= (len(canonical_goals) if canonical else len(goals))
+    assert len(canonical_goals) < len(goals)
+
+
+def test_solve_batch_records_unsupported_pairs():
+    pairs = [(StatesHanoi([3, 2], [1], [], [], max_disks=3), StatesHanoi([], [], [], [3, 2, 1], max_disks=3))]
+    row, = solve_batch(pairs, recursive_optimal_search)
+
+    assert "error" in row and "cost" not in row
@@ -0,0 +1,78 @@
+import csv
+from datetime import datetime, timedelta
+
+from src.benchmark import (run_benchmark, run_parallel_benchmark, summarize, summarize_rows, unique_timestamps,
+                           write_results)
+from src.search import breadth_first_graph_search, recursive_optimal_search
+
+
+def test_summarize():
+    stats = summarize([1.0, 2.0, 3.0, 4.0])
+    assert stats["mean"] == 2.5
+    assert stats["median"] == 2.5
+    assert abs(stats["var"] - 5 / 3) < 1e-12
+    assert 3.8 < stats["p95"] <= 4.0
+
+
+def test_run_benchmark_writes_csv_rows(tmp_path):
+    solvers = {
+        'breadth_first_graph_search': breadth_first_graph_search,
+        'recursive_optimal_search': recursive_optimal_search,
+    }
+    results = run_benchmark(solvers, range(3, 5), repeats=2, warmup=1, display=False)
+    write_results(results, output_dir=str(tmp_path))
+
+    with open(tmp_path / "execution_time.csv") as file:
+        rows = list(csv.DictReader(file))
+    assert [(row["model_name"], row["disks"]) for row in rows] == [
+        ('breadth_first_graph_search', '3'), ('recursive_optimal_search', '3'),
+        ('breadth_first_graph_search', '4'), ('recursive_optimal_search', '4'),
+    ]
+    assert set(rows[0]) == {"model_name", "disks", "mean", "std", "var", "median", "p95"}
+    assert (tmp_path / "memory_alloc_df.csv").exists()
+
+
+def test_run_benchmark_drops_solver_after_timeout():
+    results = run_benchmark({'bfs': breadth_first_graph_search}, range(3, 6), repeats=1, warmup=0,
+                            timeout=0.0, display=False)
+    assert results == {"execution_time": [], "memory_allocation": []}
+
+
+def test_run_benchmark_applies_solver_budget():
+    from src.registry import SolverSpec
+    limited = SolverSpec('limited_bfs', breadth_first_graph_search, budget={'max_expansions': 10})
+    results = run_benchmark({'limited_bfs': limited, 'bfs': breadth_first_graph_search}, range(3, 5), repeats=1,
+                            warmup=0, display=False)
+    assert [(row["model_name"], row["disks"]) for row in results["execution_time"]] == [('bfs', 3), ('bfs', 4)]
+
+
+def test_run_parallel_benchmark_one_row_per_job():
+    rows = run_parallel_benchmark(['breadth_first_graph_search', 'recursive_optimal_search'], range(3, 5),
+                                  repeats=2, warmup=0, workers=2, cpus=[0])
+    assert len(rows) == 8
+    assert {row["cost"] for row in rows if row["disks"] == 4} == {15}
+
+    results = summarize_rows(rows)
+    assert [(row["model_name"], row["disks"]) for row in results["execution_time"]] == [
+        ('breadth_first_graph_search', 3), ('recursive_optimal_search', 3),
+        ('breadth_first_graph_search', 4), ('recursive_optimal_search', 4),
+    ]
+
+
+def test_unique_timestamps_shifts_repeated_ones():
+    now = datetime(2024, 1, 1)
+    rows = [{"timestamp": now}, {"timestamp": now + timedelta(microseconds=1)}, {"timestamp": now}]
+    timestamps = [row["timestamp"] for row in unique_timestamps(rows)]
+    assert len(set(timestamps)) == 3
+    assert timestamps[0] == now
+
+
+def test_summarize_rows_skips_budget_exceeded():
+    rows = [
+        {"model_name": "bfs", "disks": 3, "execution_time": 1.0, "memory_allocation": 2.0, "budget_exceeded": None},
+        {"model_name": "bfs", "disks": 3, "execution_time": 60.0, "memory_allocation": None,
+         "budget_exceeded": {"budget_exceeded": "time"}},
+    ]
+    results = summarize_rows(rows)
+    assert results["execution_time"][0]["mean"] == 1.0
+    assert results["memory_allocation"][0]["mean"] == 2.0
@@ -1 +1,25 @@
-import pytest
\ No newline at end of file
+import pytest
+
+from src.hanoi_states import StatesHanoi, ProblemHanoi
+from src.search import breadth_first_graph_search
+
+
+def build_problem(disks: int) -> ProblemHanoi:
+    initial_state = StatesHanoi(list(range(disks, 0, -1)), [], [], max_disks=disks)
+    goal_state = StatesHanoi([], [], list(range(disks, 0, -1)), max_disks=disks)
+    return ProblemHanoi(initial=initial_state, goal=goal_state)
+
+
+@pytest.mark.parametrize("disks", [3, 4, 5])
+def test_breadth_first_graph_search_is_optimal(disks):
+    node, explored, frontier = breadth_first_graph_search(build_problem(disks))
+
+    assert node.state == build_problem(disks).goal
+    assert node.state.accumulated_cost == 2 ** disks - 1
+    assert explored <= 3 ** disks
+    assert frontier >= 0
+
+
+def test_breadth_first_graph_search_counts():
+    _, explored, frontier = breadth_first_graph_search(build_problem(5))
+    assert (explored, frontier) == (233, 10)
@@ -0,0 +1,79 @@
+import tracemalloc
+
+import pytest
+
+from src.benchmark import build_problem
+from src.budget import SearchBudget, BudgetExceeded
+from src.heuristics import heuristic_func_astar_1
+from src.registry import get_solver
+from src.search import breadth_first_graph_search, astar_search, recursive_optimal_search
+
+
+@pytest.mark.parametrize("name", [
+    'breadth_first_tree_search',
+    'breadth_first_graph_search',
+    'ida_star_search_heuristic1',
+    'bidirectional_breadth_first_search',
+    'bidirectional_astar_search_heuristic1',
+    'greedy_search_heuristic2',
+])
+def test_max_expansions_stops_every_search(name):
+    result = get_solver(name)(build_problem(6), budget=SearchBudget(max_expansions=50))
+
+    assert isinstance(result, BudgetExceeded)
+    assert result.reason == "expansions"
+    assert result.limit == 50
+    assert result.expanded == 50
+    assert result.frontier > 0
+
+
+def test_budget_exceeded_reports_partial_stats():
+    result = astar_search(build_problem(8), heuristic_func_astar_1, budget=SearchBudget(max_expansions=1000))
+
+    assert result.expanded == 1000
+    assert result.reached > 1000  # los hijos generados de los nodos expandidos
+    assert result.as_dict()["budget_exceeded"] == "expansions"
+    assert "expansions" in str(result)
+
+
+def test_time_memory_and_cancellation():
+    problem = build_problem(8)
+    assert breadth_first_graph_search(problem, budget=SearchBudget(max_seconds=0.0, check_every=1)).reason == "time"
+
+    budget = SearchBudget(check_every=1)
+    budget.cancel()
+    assert breadth_first_graph_search(problem, budget=budget).reason == "cancelled"
+
+    tracemalloc.start()
+    try:
+        result = breadth_first_graph_search(problem, budget=SearchBudget(max_memory_mb=0.01, check_every=16))
+    finally:
+        tracemalloc.stop()
+    assert result.reason == "memory"
+    assert result.memory_mb > 0.01
+
+
+def test_search_within_budget_is_unchanged():
+    problem = build_problem(5)
+    budget = SearchBudget(max_seconds=60, max_expansions=10 ** 6, max_memory_mb=10 ** 4)
+    expected = breadth_first_graph_search(problem)
+
+    # El mismo presupuesto se reinicia en cada búsqueda
+    for _ in range(2):
+        node, explored, frontier = breadth_first_graph_search(problem, budget=budget)
+        assert (node.state, explored, frontier) == (expected[0].state, expected[1], expected[2])
+    assert recursive_optimal_search(problem, budget=SearchBudget(max_expansions=0))[0].state == expected[0].state
+
+
+def test_positional_budget_and_memory_before_the_search():
+    problem = build_problem(8)
+    assert breadth_first_graph_search(problem, False, None, None, SearchBudget(max_expansions=10)).expanded == 10
+
+    tracemalloc.start()
+    try:
+        allocated = bytearray(8 * 1024 * 1024)  # memoria que ya estaba en uso antes de la búsqueda
+        result = breadth_first_graph_search(build_problem(5), budget=SearchBudget(max_memory_mb=4, check_every=1))
+        del allocated
+    finally:
+        tracemalloc.stop()
+    assert not isinstance(result, BudgetExceeded)
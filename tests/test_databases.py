@@ -0,0 +1,31 @@
+from datetime import datetime, timedelta
+
+from src.models.metrics import Metrics
+from src.services.databases import BufferedWriter, DatabaseService, create_database_engine
+
+
+def metrics_row(i):
+    return dict(model_name='breadth_first_graph_search', disks=3, timestamp=datetime(2024, 1, 1) + timedelta(seconds=i),
+                movements=25, frontiers=2, memory_allocation=0.1, execution_time=0.01, cost=7, comments="")
+
+
+def sqlite_service(tmp_path):
+    engine = create_database_engine(f"sqlite:///{tmp_path / 'metrics.db'}")
+    DatabaseService.init_database(engine)
+    return DatabaseService(engine)
+
+
+def test_add_many_inserts_all_rows(tmp_path):
+    service = sqlite_service(tmp_path)
+    assert service.add_many(Metrics, [metrics_row(i) for i in range(10)]) == 10
+    assert service.add_many(Metrics, []) == 0
+    assert len(service.query_all(Metrics)) == 10
+
+
+def test_buffered_writer_flushes_by_size_and_on_exit(tmp_path):
+    service = sqlite_service(tmp_path)
+    with BufferedWriter(Metrics, flush_size=3, service=service) as writer:
+        for i in range(5):
+            writer.add(metrics_row(i))
+        assert len(service.query_all(Metrics)) == 3
+    assert len(service.query_all(Metrics)) == 5
@@ -0,0 +1,102 @@
+import pytest
+
+from src.hanoi_states import StatesHanoi, ActionHanoi, ProblemHanoi, encode_rods, decode_rods
+
+
+def test_code_identifies_state():
+    state = StatesHanoi([5, 4, 3], [2], [1], max_disks=5)
+    same = StatesHanoi([5, 4, 3], [2], [1], max_disks=5, cost=7.0)
+    other = StatesHanoi([5, 4, 3], [1], [2], max_disks=5)
+
+    assert state == same
+    assert hash(state) == hash(same)
+    assert state != other
+    assert str(state) == "HanoiState: 5 4 3 | 2 | 1"
+
+
+def test_encode_decode_roundtrip():
+    rods = [[4, 1], [3], [2]]
+    code = encode_rods(rods)
+    assert decode_rods(code, 4) == rods
+
+    state = StatesHanoi.from_code(code, 4, cost=2.0)
+    assert state.rods == rods
+    assert state.accumulated_cost == 2.0
+    assert state == StatesHanoi(*rods, max_disks=4)
+
+
+def test_mutations_keep_code_in_sync():
+    state = StatesHanoi([3, 2, 1], [], [], max_disks=3)
+    disk = state.get_last_disk_rod(0)
+    state.put_disk_in_rod(2, disk)
+    assert state == StatesHanoi([3, 2], [], [1], max_disks=3)
+
+
+def test_invalid_state_raises():
+    with pytest.raises(ValueError):
+        StatesHanoi([1, 2], [], [3], max_disks=3)
+    with pytest.raises(ValueError):
+        StatesHanoi([2, 1], [3], max_disks=3)
+    with pytest.raises(ValueError):
+        StatesHanoi([3, 1], [], [], [1], max_disks=3)
+
+
+def test_state_with_four_pegs():
+    state = StatesHanoi([4, 3], [], [2], [1], max_disks=4)
+
+    assert state.number_of_pegs == 4
+    assert state.code == encode_rods(state.rods, 4)
+    assert StatesHanoi.from_code(state.code, 4, number_of_pegs=4) == state
+    assert state != StatesHanoi.from_code(state.code, 4)
+    assert state.get_state_dict() == {"peg_1": [4, 3], "peg_2": [], "peg_3": [2], "peg_4": [1]}
+
+    child = state.move_disk(3, 1)
+    assert child == StatesHanoi([4, 3], [1], [2], [], max_disks=4)
+    assert child.code == encode_rods(child.rods, 4)
+
+
+def test_execute_builds_child_without_touching_parent():
+    parent = StatesHanoi([3, 2], [1], [], max_disks=3, cost=1.0)
+    child = ActionHanoi(disk=2, rod_input=0, rod_out=2).execute(parent)
+
+    assert child == StatesHanoi([3], [1], [2], max_disks=3)
+    assert child.accumulated_cost == 2.0
+    assert parent.rods == [[3, 2], [1], []]
+    assert parent.accumulated_cost == 1.0
+
+
+def test_mutating_child_does_not_corrupt_parent():
+    parent = StatesHanoi([3, 2], [1], [], max_disks=3)
+    child = ActionHanoi(disk=2, rod_input=0, rod_out=2).execute(parent)
+
+    disk = child.get_last_disk_rod(1)
+    child.put_disk_in_rod(0, disk)
+
+    assert parent.rods == [[3, 2], [1], []]
+    assert parent == StatesHanoi([3, 2], [1], [], max_disks=3)
+    assert child == StatesHanoi([3, 1], [], [2], max_disks=3)
+
+
+def test_actions_are_generated_lazily_without_self_moves():
+    state = StatesHanoi([4, 3], [2], [1], [], max_disks=4)
+    problem = ProblemHanoi(initial=state, goal=state)
+    actions = problem.actions(state)
+
+    assert not isinstance(actions, list)
+    moves = [(action.disk, action.rod_input, action.rod_out) for action in actions]
+    assert sorted(moves) == [(1, 2, 0), (1, 2, 1), (1, 2, 3), (2, 1, 0), (2, 1, 3), (3, 0, 3)]
+    assert all(rod_input != rod_out for _, rod_input, rod_out in moves)
+
+
+def test_action_descriptions_are_built_on_demand():
+    action = ActionHanoi(disk=2, rod_input=0, rod_out=2)
+    assert not hasattr(action, "__dict__")
+    assert action.cost == 1.0
+    assert str(action) == "Move disk 2 from 1 to 3"
+    assert action.action_dict == {"type": "movement", "disk": 2, "peg_start": 1, "peg_end": 3}
+
+    maintain = ActionHanoi(disk=1, rod_input=1, rod_out=1)
+    state = StatesHanoi([3, 2], [1], [], max_disks=3)
+    assert maintain.cost == 0.0
+    assert maintain.action_dict == {"type": "maintain", "disk": 1, "peg": 2}
+    assert maintain.execute(state) == state and maintain.execute(state).accumulated_cost == 0.0
@@ -0,0 +1,62 @@
+import pytest
+
+from src.benchmark import build_problem
+from src.hanoi_states import StatesHanoi
+from src.heuristics import HeuristicCache, heuristic_func_astar_1, heuristic_func_astar_2, heuristic_func_greedy
+from src.profiling import SearchProfile
+from src.search import astar_search
+
+
+def test_heuristic_astar_2_rewards_only_final_positions():
+    assert heuristic_func_astar_2(StatesHanoi([], [], [5, 4, 3, 2, 1], max_disks=5)) == -31
+    assert heuristic_func_astar_2(StatesHanoi([2, 1], [], [5, 4, 3], max_disks=5)) == -28
+    assert heuristic_func_astar_2(StatesHanoi([5], [], [4, 3, 2, 1], max_disks=5)) == 0
+    assert heuristic_func_astar_2(StatesHanoi([5, 4, 3, 2, 1], [], [], max_disks=5)) == 0
+
+
+def test_heuristic_cache_evicts_least_recently_used():
+    cache = HeuristicCache(heuristic_func_astar_1, maxsize=2)
+    states = [StatesHanoi.from_code(code, 3) for code in (0, 1, 2)]
+
+    cache(states[0])
+    cache(states[1])
+    cache(states[0])  # states[1] queda como el menos usado
+    cache(states[2])
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert list(cache.values) == [states[0], states[2]]
+    assert cache(states[1]) == heuristic_func_astar_1(states[1])
+    assert cache.__name__ == 'heuristic_func_astar_1'
+
+
+def test_astar_evaluates_each_state_once():
+    def heuristic_func(state):  # Sin forma incremental, así se usa la cache
+        return heuristic_func_astar_2(state)
+
+    profile = SearchProfile()
+    node, explored, _ = astar_search(build_problem(5), heuristic_func, profile=profile)
+    stats = profile.as_dict()
+
+    assert stats["heuristic_calls"] == explored  # una evaluación por estado alcanzado
+    assert stats["heuristic_cache_hits"] > 0
+    assert node.f == node.h + node.path_cost
+    assert astar_search(build_problem(5), heuristic_func, heuristic_cache_size=0)[1] == explored
+
+
+@pytest.mark.parametrize("heuristic_func", [heuristic_func_astar_1, heuristic_func_astar_2, heuristic_func_greedy])
+def test_incremental_heuristics_match_full_evaluation(heuristic_func):
+    problem = build_problem(4)
+    for code in range(3 ** 4):
+        state = StatesHanoi.from_code(code, 4)
+        for action in problem.actions(state):
+            child = problem.result(state, action)
+            assert heuristic_func.incremental(heuristic_func(state), state, action) == heuristic_func(child)
+
+
+def test_astar_uses_incremental_heuristic():
+    profile = SearchProfile()
+    result = astar_search(build_problem(5), heuristic_func_astar_2, profile=profile)
+    stats = profile.as_dict()
+
+    assert result[1:] == astar_search(build_problem(5), heuristic_func_astar_2)[1:]
+    assert stats["heuristic_calls"] == 1  # solo la raíz
+    assert stats["heuristic_updates"] == stats["generated"]
@@ -0,0 +1,27 @@
+import numpy as np
+
+from src.lookup_tables import save_table, load_table, load_or_build_table
+
+
+def test_saved_table_is_memory_mapped_read_only(tmp_path):
+    table = np.arange(3 ** 5, dtype=np.uint16)
+    save_table("example_n5", table, directory=str(tmp_path))
+
+    loaded = load_table("example_n5", np.uint16, directory=str(tmp_path))
+    assert isinstance(loaded, np.memmap)
+    assert not loaded.flags.writeable
+    assert (loaded == table).all()
+    assert load_table("example_n6", np.uint16, directory=str(tmp_path)) is None
+
+
+def test_builder_runs_only_once(tmp_path):
+    calls = []
+
+    def builder():
+        calls.append(1)
+        return np.zeros(9, dtype=np.uint8)
+
+    for _ in range(3):
+        table = load_or_build_table("zeros", np.uint8, builder, directory=str(tmp_path))
+    assert len(calls) == 1
+    assert table.shape == (9,)
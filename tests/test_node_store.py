@@ -0,0 +1,90 @@
+import numpy as np
+
+from src.hanoi_states import StatesHanoi, ProblemHanoi, ActionHanoi
+from src.node_store import NodeStore, StoredNode, NO_NODE
+
+
+def test_add_and_lookup():
+    initial = StatesHanoi([3, 2, 1], [], [], max_disks=3)
+    store = NodeStore(initial)
+    child = initial.move_disk(0, 2, 1)
+    node = store.add(child.code, store.root, store.encode_move(ActionHanoi(1, 0, 2)), 1)
+
+    assert isinstance(store.index, np.ndarray)
+    assert store.lookup(child.code) == node
+    assert child.code in store
+    assert StatesHanoi([3, 2], [1], [], max_disks=3).code not in store
+    assert store.lookup(StatesHanoi([3, 2], [1], [], max_disks=3).code) == NO_NODE
+    assert store.state(node) == child
+    assert store.action(node).action_dict == ActionHanoi(1, 0, 2).action_dict
+
+    # Un camino mejor al mismo estado agrega un nodo nuevo pero no un estado alcanzado nuevo
+    better = store.add(child.code, store.root, store.encode_move(ActionHanoi(1, 0, 2)), 0.5)
+    assert store.lookup(child.code) == better
+    assert len(store) == 2
+
+
+def test_sparse_index_matches_dense():
+    initial = StatesHanoi([4, 3, 2, 1], [], [], [], max_disks=4)
+    problem = ProblemHanoi(initial=initial, goal=StatesHanoi([], [], [], [4, 3, 2, 1], max_disks=4))
+    dense, sparse = NodeStore(initial), NodeStore(initial, dense_limit=0)
+    assert isinstance(sparse.index, dict)
+
+    for store in (dense, sparse):
+        for action in problem.actions(initial):
+            child = problem.result(initial, action)
+            store.add(child.code, store.root, store.encode_move(action), child.accumulated_cost)
+    assert len(dense) == len(sparse) == 4
+    for code in range(4 ** 4):
+        assert dense.lookup(code) == sparse.lookup(code)
+
+
+def test_solution_rebuilds_the_path():
+    initial = StatesHanoi([3, 2, 1], [], [], max_disks=3)
+    problem = ProblemHanoi(initial=initial, goal=StatesHanoi([], [], [3, 2, 1], max_disks=3))
+    store = NodeStore(initial)
+    node, state = store.root, initial
+    for action in [ActionHanoi(1, 0, 2), ActionHanoi(2, 0, 1), ActionHanoi(1, 2, 1)]:
+        state = problem.result(state, action)
+        node = store.add(state.code, node, store.encode_move(action), state.accumulated_cost)
+
+    solution = store.solution(node)
+    assert solution.state == state
+    assert solution.path_cost == 3
+    assert solution.path()[0].state == initial
+    assert [action.action_dict for action in solution.solution()] == [
+        ActionHanoi(1, 0, 2).action_dict, ActionHanoi(2, 0, 1).action_dict, ActionHanoi(1, 2, 1).action_dict
+    ]
+
+
+def test_nbytes_and_heuristics():
+    store = NodeStore(StatesHanoi([2, 1], [], [], max_disks=2), h=3)
+    assert store.h.typecode == 'q'
+    assert store.nbytes() == (8 + 8 + 4 + 8 + 8) + store.index.nbytes
+    assert NodeStore(StatesHanoi([2, 1], [], [], max_disks=2), h=1.5).h.typecode == 'd'
+
+
+def test_stored_node_compares_like_nodes():
+    first, second = StoredNode(0, 5, 2), StoredNode(1, 5, 1)
+    assert first == second and hash(first) == hash(second)
+    assert second < first
+    assert not StoredNode(2, 6, 1) < second
+
+
+def test_forget_and_restore():
+    initial = StatesHanoi([2, 1], [], [], max_disks=2)
+    store = NodeStore(initial)
+    child = initial.move_disk(0, 2, 1)
+    node = store.add(child.code, store.root, store.encode_move(ActionHanoi(1, 0, 2)), 1)
+
+    store.forget(node)
+    assert child.code not in store and len(store) == 1
+    assert store.state(node) == child
+    store.restore(node)
+    assert store.lookup(child.code) == node and len(store) == 2
+
+    # Un nodo que ya no es el de su estado no lo olvida ni lo reemplaza
+    better = store.add(child.code, store.root, store.encode_move(ActionHanoi(1, 0, 2)), 0.5)
+    store.forget(node)
+    store.restore(node)
+    assert store.lookup(child.code) == better and len(store) == 2
@@ -0,0 +1,68 @@
+import os
+from collections import deque
+
+import numpy as np
+import pytest
+
+from src.hanoi_states import StatesHanoi, ProblemHanoi
+from src.pattern_database import PatternDatabase, pattern_database_heuristic, PATTERN_DATABASE_VERSION
+from src.recursive_solver import optimal_cost
+from src.lookup_tables import table_path
+
+
+def distances_from(problem: ProblemHanoi, state: StatesHanoi) -> dict:
+    distances = {state: 0}
+    queue = deque([state])
+    while queue:
+        current = queue.popleft()
+        for action in problem.actions(current):
+            child = problem.result(current, action)
+            if child not in distances:
+                distances[child] = distances[current] + 1
+                queue.append(child)
+    return distances
+
+
+@pytest.mark.parametrize("disks", [1, 3, 5])
+def test_full_pattern_matches_breadth_first_distances(disks, tmp_path):
+    goal = StatesHanoi([], [disks], list(range(disks - 1, 0, -1)), max_disks=disks)
+    distances = distances_from(ProblemHanoi(initial=goal, goal=goal), goal)
+    database = PatternDatabase(goal, 1, disks, directory=str(tmp_path))
+
+    assert len(distances) == 3 ** disks
+    for state, distance in distances.items():
+        assert database.distance(state) == distance
+
+
+def test_additive_heuristic_is_admissible(tmp_path):
+    goal = StatesHanoi([2], [5, 4], [6, 3, 1], max_disks=6)
+    heuristic = pattern_database_heuristic(goal, max_pattern_size=3, directory=str(tmp_path))
+
+    assert heuristic(goal) == 0
+    for code in range(3 ** 6):
+        state = StatesHanoi.from_code(code, 6)
+        assert 0 <= heuristic(state) <= optimal_cost(state, goal)
+
+
+def test_additive_heuristic_is_admissible_with_four_pegs(tmp_path):
+    goal = StatesHanoi([2], [5], [4, 3], [6, 1], max_disks=6)
+    distances = distances_from(ProblemHanoi(initial=goal, goal=goal), goal)
+    heuristic = pattern_database_heuristic(goal, max_pattern_size=3, directory=str(tmp_path))
+
+    assert len(distances) == 4 ** 6
+    for state, distance in distances.items():
+        assert 0 <= heuristic(state) <= distance
+
+
+def test_saved_table_loads_back(tmp_path):
+    goal = StatesHanoi([], [], [4, 3, 2, 1], max_disks=4)
+    database = PatternDatabase(goal, 1, 4, directory=str(tmp_path))
+
+    assert [path.name for path in tmp_path.iterdir()] == [
+        os.path.basename(table_path(database.table_name(), np.uint16, str(tmp_path)))]
+    assert f"_v{PATTERN_DATABASE_VERSION}_" in database.table_name()
+
+    loaded = PatternDatabase(goal, 1, 4, directory=str(tmp_path))
+    assert isinstance(loaded.distances, np.memmap)
+    assert loaded.distances.dtype == np.uint16
+    assert (loaded.distances == database.distances).all()
@@ -0,0 +1,81 @@
+import pytest
+
+from src.aima import PriorityQueue
+
+
+def test_pop_order_and_decrease_key():
+    frontier = PriorityQueue(order='min', f=lambda x: x[1])
+    frontier.extend([('a', 5), ('b', 3), ('c', 4)])
+
+    assert ('b', 3) in frontier
+    assert frontier[('a', 5)] == 5
+
+    del frontier[('a', 5)]
+    frontier.append(('a', 1))
+
+    assert len(frontier) == 3
+    assert [frontier.pop()[0] for _ in range(3)] == ['a', 'b', 'c']
+    with pytest.raises(Exception):
+        frontier.pop()
+
+
+def test_max_order_and_missing_key():
+    frontier = PriorityQueue(order='max', f=lambda x: x)
+    frontier.extend([1, 3, 2])
+
+    assert frontier.pop() == 3
+    with pytest.raises(KeyError):
+        del frontier[3]
+    with pytest.raises(KeyError):
+        frontier[3]
+
+
+class Entry:
+    def __init__(self, name, priority):
+        self.name = name
+        self.priority = priority
+
+    def __eq__(self, other):
+        return self.name == other.name
+
+    def __lt__(self, other):
+        return self.name < other.name
+
+    def __hash__(self):
+        return hash(self.name)
+
+
+def test_replacing_entries_keeps_heap_bounded():
+    frontier = PriorityQueue(order='min', f=lambda x: x.priority)
+    for priority in range(1000, 0, -1):
+        frontier.append(Entry('a', priority))
+        frontier.append(Entry('b', priority))
+
+    assert len(frontier) == 2
+    assert len(frontier.heap) <= 2 * len(frontier) + 33
+    first = frontier.pop()
+    assert (first.name, first.priority) == ('a', 1)
+
+
+def test_top_priority_skips_deleted_entries():
+    frontier = PriorityQueue(order='max', f=lambda x: x)
+    assert frontier.top_priority() is None
+    frontier.extend([1, 3, 2])
+    del frontier[3]
+    assert frontier.top_priority() == 2
+    assert frontier.pop() == 2
+
+
+def test_prune_keeps_the_best_entries():
+    frontier = PriorityQueue(order='max', f=lambda x: x)
+    frontier.extend([4, 1, 5, 2, 3])
+    assert frontier.prune(3) == [1, 2]
+    assert len(frontier) == 3 and 1 not in frontier
+    assert [frontier.pop() for _ in range(3)] == [5, 4, 3]
+
+    # With a key, ties are broken by it instead of by the items
+    frontier = PriorityQueue(order='min', f=lambda x: x.priority)
+    frontier.extend([Entry('a', 1), Entry('b', 2), Entry('c', 2)])
+    removed = frontier.prune(2, key=lambda entry: (entry[0], entry[1].name != 'c'))
+    assert [entry.name for entry in removed] == ['b']
+    assert [frontier.pop().name for _ in range(2)] == ['a', 'c']
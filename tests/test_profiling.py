@@ -0,0 +1,38 @@
+from src.benchmark import build_problem
+from src.profiling import SearchProfile, SearchProgress
+from src.registry import get_solver
+from src.search import breadth_first_graph_search
+
+
+def test_profile_does_not_change_the_search():
+    profile = SearchProfile()
+    node, explored, frontier = get_solver('astar_search_heuristic1')(build_problem(4), profile=profile)
+    assert (explored, frontier) == get_solver('astar_search_heuristic1')(build_problem(4))[1:]
+    assert node.state.accumulated_cost == 15
+
+    stats = profile.as_dict()
+    assert stats["expansions"] == stats["pops"] - 1  # el último pop es el objetivo, que no se expande
+    assert stats["heuristic_calls"] > 0
+    assert stats["duplicates"] == stats["generated"] - stats["pushes"]
+
+
+def test_profile_breadth_first_counts():
+    profile = SearchProfile()
+    _, explored, frontier = breadth_first_graph_search(build_problem(4), profile=profile)
+    stats = profile.as_dict()
+    # Cada estado alcanzado, salvo el inicial, entró una vez en la cola
+    assert stats["pushes"] == explored + frontier - 1
+    assert stats["heuristic_calls"] == 0
+    assert stats["actions_time"] > 0
+
+
+def test_progress_reports_every_n_expansions():
+    events = []
+    progress = SearchProgress(events.append, every=10)
+    result = get_solver('astar_search_heuristic1')(build_problem(5), progress=progress)
+    assert result[1:] == get_solver('astar_search_heuristic1')(build_problem(5))[1:]
+
+    assert events == progress.events
+    assert [event["expanded"] for event in events] == list(range(10, 10 * len(events) + 1, 10))
+    assert all(event["frontier"] > 0 and event["reached"] > event["frontier"] for event in events)
+    assert all(event["best_f"] is not None for event in events)
@@ -0,0 +1,79 @@
+from collections import deque
+
+import pytest
+
+from src.hanoi_states import StatesHanoi, ProblemHanoi
+from src.recursive_solver import (optimal_cost, general_optimal_solver, recursive_optimal_solver, frame_stewart_cost,
+                                  frame_stewart_solver)
+from src.state_space import breadth_first_distances
+
+
+def distances_from(problem: ProblemHanoi, state: StatesHanoi) -> dict:
+    distances = {state: 0}
+    queue = deque([state])
+    while queue:
+        current = queue.popleft()
+        for action in problem.actions(current):
+            child = problem.result(current, action)
+            if child not in distances:
+                distances[child] = distances[current] + 1
+                queue.append(child)
+    return distances
+
+
+@pytest.mark.parametrize("disks", [1, 5, 12])
+def test_recursive_optimal_solver_moves_whole_tower(disks):
+    state = StatesHanoi(list(range(disks, 0, -1)), [], [], max_disks=disks)
+    actions = list(recursive_optimal_solver(disks))
+    for action in actions:
+        state = action.execute(state)
+
+    assert len(actions) == 2 ** disks - 1
+    assert state == StatesHanoi([], [], list(range(disks, 0, -1)), max_disks=disks)
+
+
+@pytest.mark.parametrize("disks", [3, 4])
+def test_general_optimal_solver_matches_breadth_first_distances(disks):
+    states = [StatesHanoi.from_code(code, disks) for code in range(3 ** disks)]
+    problem = ProblemHanoi(initial=states[0], goal=states[-1])
+    for initial in states:
+        distances = distances_from(problem, initial)
+        for goal in states:
+            state = initial
+            for action in general_optimal_solver(initial, goal):
+                assert state.rods[action.rod_input][-1] == action.disk
+                assert state.check_valid_disk_in_rod(action.rod_out, action.disk)
+                state = action.execute(state)
+
+            assert state == goal
+            assert state.accumulated_cost == optimal_cost(initial, goal) == distances[goal]
+
+
+def test_frame_stewart_cost():
+    assert [frame_stewart_cost(disks, 3) for disks in range(1, 9)] == [2 ** disks - 1 for disks in range(1, 9)]
+    assert [frame_stewart_cost(disks, 4) for disks in range(1, 9)] == [1, 3, 5, 9, 13, 17, 25, 33]
+    assert [frame_stewart_cost(disks, 5) for disks in range(1, 9)] == [1, 3, 5, 7, 11, 15, 19, 23]
+
+
+@pytest.mark.parametrize("pegs", [3, 4, 5])
+@pytest.mark.parametrize("disks", [1, 6, 10])
+def test_frame_stewart_solver_moves_whole_tower(disks, pegs):
+    empty_rods = [[] for _ in range(pegs - 1)]
+    state = StatesHanoi(list(range(disks, 0, -1)), *empty_rods, max_disks=disks)
+    actions = list(frame_stewart_solver(disks, pegs))
+    for action in actions:
+        assert state.rods[action.rod_input][-1] == action.disk
+        assert state.check_valid_disk_in_rod(action.rod_out, action.disk)
+        state = action.execute(state)
+
+    assert len(actions) == frame_stewart_cost(disks, pegs)
+    assert state == StatesHanoi(*empty_rods, list(range(disks, 0, -1)), max_disks=disks)
+
+
+@pytest.mark.parametrize("disks", [3, 5, 7])
+def test_frame_stewart_is_optimal_with_four_pegs(disks):
+    goal = StatesHanoi([], [], [], list(range(disks, 0, -1)), max_disks=disks)
+    initial = StatesHanoi(list(range(disks, 0, -1)), [], [], [], max_disks=disks)
+    distances = breadth_first_distances(disks, goal.code, pegs=4)
+
+    assert distances[initial.code] == frame_stewart_cost(disks, 4)
@@ -0,0 +1,43 @@
+import pytest
+
+from src.benchmark import build_problem
+from src.heuristics import heuristic_func_astar_1
+from src.registry import SolverSpec, SOLVERS, register, get_solver, sweep_solvers
+from src.search import astar_search, greedy_search
+
+
+def test_sweep_runs_registered_solvers_in_order():
+    sweep = sweep_solvers()
+    assert 'breadth_first_tree_search' not in sweep
+    assert list(sweep)[:2] == ['breadth_first_graph_search', 'astar_search_heuristic1']
+    assert 'ida_star_search_heuristic1' in sweep
+    assert list(sweep_solvers(['recursive_optimal_search', 'astar_search_heuristic2'])) == [
+        'recursive_optimal_search', 'astar_search_heuristic2'
+    ]
+
+
+def test_get_solver_lists_available_names():
+    with pytest.raises(ValueError, match='breadth_first_graph_search'):
+        get_solver('unknown_search')
+
+
+def test_solver_spec_passes_heuristic_and_options():
+    problem = build_problem(5)
+    spec = get_solver('greedy_search_heuristic3')
+    assert spec.options == {'order': 'max'}
+    assert spec(problem)[1:] == greedy_search(problem, spec.heuristic, order='max')[1:]
+    assert get_solver('astar_search_heuristic1')(problem)[1:] == astar_search(problem, heuristic_func_astar_1)[1:]
+    assert get_solver('ida_star_search_heuristic1').budget == {'max_expansions': 2_000_000}
+
+
+def test_register_new_solver():
+    spec = register('test_weighted_greedy', greedy_search, heuristic_factory=lambda problem: heuristic_func_astar_1,
+                    sweep=False)
+    try:
+        assert isinstance(spec, SolverSpec) and spec.__name__ == 'test_weighted_greedy'
+        assert get_solver('test_weighted_greedy')(build_problem(4))[0].state == build_problem(4).goal
+        assert 'test_weighted_greedy' not in sweep_solvers()
+        with pytest.raises(ValueError):
+            register('test_weighted_greedy', greedy_search)
+    finally:
+        del SOLVERS['test_weighted_greedy']
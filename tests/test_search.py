@@ -0,0 +1,218 @@
+import json
+
+import pytest
+
+from src.hanoi_states import StatesHanoi, ProblemHanoi
+from src.search import (ida_star_search, bidirectional_breadth_first_search, bidirectional_astar_search,
+                        _backward_heuristic, recursive_optimal_search, astar_search, ara_star_search, beam_search,
+                        greedy_search)
+from src.batch import random_pairs
+from src.budget import SearchBudget, BudgetExceeded
+from src.heuristics import heuristic_func_astar_1, heuristic_func_astar_2, heuristic_func_greedy
+from src.pattern_database import pattern_database_heuristic
+from src.profiling import SearchProgress
+from src.recursive_solver import frame_stewart_cost, optimal_cost
+
+
+def build_problem(disks: int, pegs: int = 3) -> ProblemHanoi:
+    empty_rods = [[] for _ in range(pegs - 1)]
+    initial_state = StatesHanoi(list(range(disks, 0, -1)), *empty_rods, max_disks=disks)
+    goal_state = StatesHanoi(*empty_rods, list(range(disks, 0, -1)), max_disks=disks)
+    return ProblemHanoi(initial=initial_state, goal=goal_state)
+
+
+@pytest.mark.parametrize("disks", [3, 4, 5])
+def test_ida_star_search_finds_optimal_path(disks):
+    problem = build_problem(disks)
+    node, expanded, path_length = ida_star_search(problem, heuristic_func_astar_1)
+
+    assert problem.goal_test(node.state)
+    assert node.state.accumulated_cost == 2 ** disks - 1
+    assert len(node.solution()) == 2 ** disks - 1
+    assert expanded > 0
+    assert path_length == node.depth
+
+
+@pytest.mark.parametrize("disks", [3, 4, 5])
+def test_ida_star_search_with_inadmissible_heuristic_returns_valid_path(disks):
+    problem = build_problem(disks)
+    node, _, _ = ida_star_search(problem, heuristic_func_astar_2)
+
+    state = problem.initial
+    for action in node.solution():
+        state = problem.result(state, action)
+
+    assert state == problem.goal
+    # heuristic_func_astar_2 is not admissible, so the path may be longer than the optimal one
+    assert node.state.accumulated_cost >= 2 ** disks - 1
+
+
+@pytest.mark.parametrize("disks", [3, 4, 6])
+def test_bidirectional_searches_find_optimal_path(disks):
+    problem = build_problem(disks)
+    for node, _, _ in (bidirectional_breadth_first_search(problem),
+                       bidirectional_astar_search(problem, heuristic_func_astar_1)):
+        state = problem.initial
+        for action in node.solution():
+            state = problem.result(state, action)
+
+        assert state == problem.goal
+        assert node.state.accumulated_cost == 2 ** disks - 1
+
+
+def test_bidirectional_solution_exports_for_simulator(tmp_path):
+    node, _, _ = bidirectional_breadth_first_search(build_problem(3))
+    node.generate_solution_for_simulator(initial_state_file=tmp_path / "initial.json",
+                                         sequence_file=tmp_path / "sequence.json")
+
+    assert json.loads((tmp_path / "initial.json").read_text()) == {"peg_1": [3, 2, 1], "peg_2": [], "peg_3": []}
+    assert len(json.loads((tmp_path / "sequence.json").read_text())) == 7
+
+
+def test_bidirectional_astar_backward_heuristic_falls_back_to_zero():
+    standard = build_problem(4)
+    mirrored = _backward_heuristic(standard, heuristic_func_astar_1)
+    assert mirrored(standard.initial) == heuristic_func_astar_1(standard.goal)
+
+    initial_state = StatesHanoi([4, 1], [3], [2], max_disks=4)
+    goal_state = StatesHanoi([2], [4, 3], [1], max_disks=4)
+    problem = ProblemHanoi(initial=initial_state, goal=goal_state)
+    backward = _backward_heuristic(problem, heuristic_func_astar_1)
+    assert all(backward(StatesHanoi.from_code(code, 4)) == 0 for code in range(3 ** 4))
+
+    node, _, _ = bidirectional_astar_search(problem, heuristic_func_astar_1)
+    state = problem.initial
+    for action in node.solution():
+        state = problem.result(state, action)
+    assert state == problem.goal
+
+
+@pytest.mark.parametrize("pegs", [4, 5])
+def test_searches_with_more_pegs_find_frame_stewart_cost(pegs, tmp_path):
+    disks = 5
+    problem = build_problem(disks, pegs)
+    heuristic = pattern_database_heuristic(problem.goal, directory=str(tmp_path))
+    results = [recursive_optimal_search(problem), bidirectional_breadth_first_search(problem),
+               astar_search(problem, heuristic)]
+
+    for node, _, _ in results:
+        assert node.state == problem.goal
+        assert node.state.accumulated_cost == frame_stewart_cost(disks, pegs)
+
+
+def test_recursive_optimal_search_with_more_pegs_needs_whole_towers():
+    initial = StatesHanoi([4, 3, 2], [1], [], [], max_disks=4)
+    goal = StatesHanoi([], [], [], [4, 3, 2, 1], max_disks=4)
+
+    with pytest.raises(ValueError):
+        recursive_optimal_search(ProblemHanoi(initial=initial, goal=goal))
+
+
+@pytest.mark.parametrize("weight", [1, 2, 3])
+def test_weighted_astar_cost_within_weight_of_optimal(weight, tmp_path):
+    for initial, goal in random_pairs(5, 7, seed=1):
+        problem = ProblemHanoi(initial=initial, goal=goal)
+        heuristic = pattern_database_heuristic(goal, max_pattern_size=4, directory=str(tmp_path))
+        node, _, _ = astar_search(problem, heuristic, weight=weight)
+        assert node.state == goal
+        assert optimal_cost(initial, goal) <= node.state.accumulated_cost <= weight * optimal_cost(initial, goal)
+
+
+def test_ara_star_improves_until_optimal(tmp_path):
+    for initial, goal in random_pairs(5, 7, seed=2):
+        problem = ProblemHanoi(initial=initial, goal=goal)
+        heuristic = pattern_database_heuristic(goal, max_pattern_size=4, directory=str(tmp_path))
+        events = []
+        node, _, _ = ara_star_search(problem, heuristic, on_solution=events.append)
+
+        assert node.state == goal
+        assert node.state.accumulated_cost == optimal_cost(initial, goal)
+        assert [event["weight"] for event in events] == [3, 2.5, 2, 1.5, 1][:len(events)]
+        assert events[-1]["bound"] == 1
+        for previous, event in zip(events, events[1:]):
+            assert event["cost"] <= previous["cost"]
+            assert event["expanded"] >= previous["expanded"]
+        for event in events:
+            assert event["cost"] <= event["bound"] * optimal_cost(initial, goal) + 1e-9
+
+
+def test_ara_star_without_admissible_heuristic_lowers_weight_to_one():
+    events = []
+    node, _, _ = ara_star_search(build_problem(6), heuristic_func_astar_1, on_solution=events.append)
+
+    assert node.state == build_problem(6).goal
+    assert [event["weight"] for event in events] == [3, 2.5, 2, 1.5, 1]
+    assert all(event["bound"] is None for event in events)
+
+
+def test_ara_star_returns_best_solution_within_budget():
+    problem = build_problem(8)
+    events = []
+    ara_star_search(problem, heuristic_func_astar_1, on_solution=events.append)
+    first = events[0]["expanded"]
+
+    budget = SearchBudget(max_expansions=first + 10)
+    node, expanded, _ = ara_star_search(problem, heuristic_func_astar_1, budget=budget)
+    assert node.state == problem.goal
+    assert expanded == first + 10
+    assert isinstance(ara_star_search(problem, heuristic_func_astar_1, budget=SearchBudget(max_expansions=10)),
+                      BudgetExceeded)
+
+
+def assert_valid_path(problem, node):
+    state = problem.initial
+    for action in node.solution():
+        assert action.action_dict in [legal.action_dict for legal in problem.actions(state)]
+        state = problem.result(state, action)
+    assert state == problem.goal == node.state
+    assert state.accumulated_cost == len(node.solution())
+
+
+@pytest.mark.parametrize("heuristic, order", [(heuristic_func_astar_1, 'min'), (heuristic_func_astar_2, 'min'),
+                                              (heuristic_func_greedy, 'max')])
+def test_beam_search_returns_valid_path(heuristic, order):
+    problem = build_problem(8)
+    node, expanded, beam = beam_search(problem, heuristic, beam_width=16, order=order)
+
+    assert_valid_path(problem, node)
+    assert node.state.accumulated_cost >= 2 ** 8 - 1
+    # At most beam_width nodes are expanded per depth
+    assert expanded <= 16 * node.state.accumulated_cost
+    assert beam <= 16
+
+
+def test_wide_beam_search_is_breadth_first():
+    problem = build_problem(6)
+    node, _, _ = beam_search(problem, heuristic_func_astar_1, beam_width=3 ** 6)
+    assert node.state.accumulated_cost == 2 ** 6 - 1
+
+
+def test_beam_search_with_pattern_database(tmp_path):
+    for initial, goal in random_pairs(5, 7, seed=3):
+        problem = ProblemHanoi(initial=initial, goal=goal)
+        heuristic = pattern_database_heuristic(goal, max_pattern_size=4, directory=str(tmp_path))
+        node, _, _ = beam_search(problem, heuristic, beam_width=8)
+        assert_valid_path(problem, node)
+        assert node.state.accumulated_cost >= optimal_cost(initial, goal)
+
+
+@pytest.mark.parametrize("search, heuristic", [(astar_search, heuristic_func_astar_1),
+                                               (greedy_search, heuristic_func_astar_2)])
+def test_bounded_frontier_stays_within_max_frontier(search, heuristic):
+    problem = build_problem(7)
+    progress = SearchProgress(lambda event: None, every=1)
+    node, _, frontier = search(problem, heuristic, max_frontier=16, progress=progress)
+
+    assert_valid_path(problem, node)
+    assert node.state.accumulated_cost >= 2 ** 7 - 1
+    assert max(event["frontier"] for event in progress.events) <= 16
+    assert frontier <= 16
+
+
+def test_bounded_frontier_without_pruning_matches_unbounded():
+    problem = build_problem(7)
+    node, reached, frontier = astar_search(problem, heuristic_func_astar_1)
+    bounded, bounded_reached, bounded_frontier = astar_search(problem, heuristic_func_astar_1, max_frontier=10 ** 6)
+
+    assert [action.action_dict for action in bounded.solution()] == [action.action_dict for action in node.solution()]
+    assert (bounded_reached, bounded_frontier) == (reached, frontier)
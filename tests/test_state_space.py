@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from src.hanoi_states import StatesHanoi, ProblemHanoi
+from src.recursive_solver import optimal_cost
+from src.state_space import successor_codes, breadth_first_distances, GoalDistances
+
+
+def test_successor_codes_match_problem_actions():
+    disks = 4
+    states = [StatesHanoi.from_code(code, disks) for code in range(3 ** disks)]
+    problem = ProblemHanoi(initial=states[0], goal=states[-1])
+    for state in states:
+        expected = sorted(problem.result(state, action).code for action in problem.actions(state))
+        assert sorted(successor_codes(np.array([state.code]), disks).tolist()) == expected
+
+
+def test_breadth_first_distances_are_optimal_costs():
+    disks = 5
+    goal = StatesHanoi([3], [5, 1], [4, 2], max_disks=disks)
+    distances = breadth_first_distances(disks, goal.code)
+
+    assert distances.dtype == np.uint16
+    for code in range(3 ** disks):
+        assert distances[code] == optimal_cost(StatesHanoi.from_code(code, disks), goal)
+
+
+def test_goal_distances_lookup(tmp_path):
+    goal = StatesHanoi([], [], [6, 5, 4, 3, 2, 1], max_disks=6)
+    initial = StatesHanoi([6, 5, 4, 3, 2, 1], [], [], max_disks=6)
+    table = GoalDistances(goal, directory=str(tmp_path))
+
+    assert table[initial] == table.distance(initial) == 63
+    assert table.as_heuristic()(goal) == 0
+    assert isinstance(GoalDistances(goal, directory=str(tmp_path)).distances, np.memmap)
+
+
+def test_successor_codes_match_problem_actions_with_four_pegs():
+    disks = 3
+    states = [StatesHanoi.from_code(code, disks, number_of_pegs=4) for code in range(4 ** disks)]
+    problem = ProblemHanoi(initial=states[0], goal=states[-1])
+    for state in states:
+        expected = sorted(problem.result(state, action).code for action in problem.actions(state))
+        assert sorted(successor_codes(np.array([state.code]), disks, pegs=4).tolist()) == expected
+
+
+@pytest.mark.parametrize("disks, pegs", [(16, 3), (12, 4)])
+def test_breadth_first_distances_rejects_too_many_configurations(disks, pegs):
+    with pytest.raises(ValueError):
+        breadth_first_distances(disks, 0, pegs)